@@ -272,58 +272,49 @@ class AmpScaler:
         if getattr(optimizer, '_param_groups', None) and isinstance(
             optimizer._param_groups[0], dict
         ):
-            param_grads = []
-            param_grads_fp16 = []
-            param_grads_bf16 = []
-            param_grads_fp32 = []
-            for group in optimizer._param_groups:
-                for param in group['params']:
-                    if param._grad_ivar() is not None:
-                        param_grads.append(param._grad_ivar())
-                        if (
-                            param._grad_ivar().dtype
-                            == core.VarDesc.VarType.FP16
-                        ):
-                            param_grads_fp16.append(param._grad_ivar())
-                        elif (
-                            param._grad_ivar().dtype
-                            == core.VarDesc.VarType.BF16
-                        ):
-                            param_grads_bf16.append(param._grad_ivar())
-                        else:
-                            param_grads_fp32.append(param._grad_ivar())
+            parameter_list, other_parameters = self._get_grouped_parameters(
+                optimizer
+            )
         else:
-            if in_dygraph_mode():
-                # It is very time-consuming to call c++ functions in a loop on the python side.
-                # We put this part of the code on the c++ side to improve the speed in eager mode.
-                (
-                    param_grads_fp16,
-                    param_grads_bf16,
-                    param_grads_fp32,
-                ) = core.eager.get_grads_lists(optimizer._parameter_list)
-            else:
-                # Keep the original code to support legacy mode.
-                # Delete the else branch when the legacy mode exits.
-                param_grads = [
-                    param._grad_ivar()
-                    for param in optimizer._parameter_list
-                    if param._grad_ivar() is not None
-                ]
-                param_grads_fp16 = [
-                    param
-                    for param in param_grads
-                    if param.dtype == core.VarDesc.VarType.FP16
-                ]
-                param_grads_bf16 = [
-                    param
-                    for param in param_grads
-                    if param.dtype == core.VarDesc.VarType.BF16
-                ]
-                param_grads_fp32 = [
-                    param
-                    for param in param_grads
-                    if param.dtype == core.VarDesc.VarType.FP32
-                ]
+            parameter_list, other_parameters = optimizer._parameter_list, []
+
+        if in_dygraph_mode():
+            # It is very time-consuming to call c++ functions in a loop on the python side.
+            # We put this part of the code on the c++ side to improve the speed in eager mode.
+            (
+                param_grads_fp16,
+                param_grads_bf16,
+                param_grads_fp32,
+            ) = core.eager.get_grads_lists(parameter_list)
+        else:
+            # Keep the original code to support legacy mode.
+            # Delete the else branch when the legacy mode exits.
+            param_grads = [
+                param._grad_ivar()
+                for param in parameter_list
+                if param._grad_ivar() is not None
+            ]
+            param_grads_fp16 = [
+                param
+                for param in param_grads
+                if param.dtype == core.VarDesc.VarType.FP16
+            ]
+            param_grads_bf16 = [
+                param
+                for param in param_grads
+                if param.dtype == core.VarDesc.VarType.BF16
+            ]
+            param_grads_fp32 = [
+                param
+                for param in param_grads
+                if param.dtype == core.VarDesc.VarType.FP32
+            ]
+        # grads of other dtypes in param groups are unscaled with fp32 grads
+        for param in other_parameters:
+            grad = param._grad_ivar()
+            if grad is not None:
+                param_grads_fp32.append(grad)
+
         self._found_inf = self._temp_found_inf_value_false
         if len(param_grads_fp16):
             _legacy_C_ops.check_finite_and_unscale(
@@ -358,6 +349,45 @@ class AmpScaler:
 
         optimizer_state["state"] = OptimizerState.UNSCALED
 
+    def _get_grouped_parameters(self, optimizer):
+        """
+        Flatten the parameters of all param groups of :attr:`optimizer`, and
+        split them into parameters whose grads are bucketed by dtype on the
+        c++ side, i.e. FP16, BF16 and FP32 ones, and the other parameters.
+        The result is cached on the optimizer until groups are added, or
+        their parameter lists are replaced or resized, or the dtypes of
+        their parameters are changed.
+        """
+        param_groups = optimizer._param_groups
+        signature = tuple(
+            (id(group['params']), tuple(p.dtype for p in group['params']))
+            for group in param_groups
+        )
+        # (signature, parameter_list, other_parameters)
+        cached = getattr(optimizer, '_amp_grouped_params', None)
+        if cached is not None and cached[0] == signature:
+            return cached[1], cached[2]
+
+        bucketed_dtypes = (
+            core.VarDesc.VarType.FP16,
+            core.VarDesc.VarType.BF16,
+            core.VarDesc.VarType.FP32,
+        )
+        parameter_list = []
+        other_parameters = []
+        for group in param_groups:
+            for param in group['params']:
+                if param.dtype in bucketed_dtypes:
+                    parameter_list.append(param)
+                else:
+                    other_parameters.append(param)
+        optimizer._amp_grouped_params = (
+            signature,
+            parameter_list,
+            other_parameters,
+        )
+        return parameter_list, other_parameters
+
     def _update(self):
         """
         Updates the loss_scaling.
@@ -13,7 +13,7 @@
 # limitations under the License
 
 from pathlib import Path
-from typing import Optional, Tuple, Union
+from typing import Iterator, Optional, Tuple, Union
 
 import paddle
 
@@ -152,3 +152,69 @@ def save(
     """
     # for API doc
     raise NotImplementedError("please set audio backend")
+
+
+def stream(
+    filepath: Union[str, Path],
+    frames_per_chunk: int,
+    frame_offset: int = 0,
+    num_frames: int = -1,
+    normalize: bool = True,
+    channels_first: bool = True,
+) -> Iterator[paddle.Tensor]:
+    """Load audio data from file chunk by chunk, so that long audio files can be processed with bounded memory.
+    Each chunk is read by the load function of current audio backend.
+
+    Args:
+        filepath: audio path.
+        frames_per_chunk: number of frames of each chunk, the last chunk may be shorter.
+        frame_offset: from 0 to total frames,
+        num_frames: from -1 (means total frames) or number frames which want to read,
+        normalize:
+            if True: return audio which norm to (-1, 1), dtype=float32
+            if False: return audio with raw data, dtype=int16
+
+        channels_first:
+            if True: return audio with shape (channels, time)
+
+    Return:
+        Iterator[paddle.Tensor]: chunks of audio content.
+
+    Examples:
+        .. code-block:: python
+
+            import os
+            import paddle
+
+            sample_rate = 16000
+            wav_duration = 0.5
+            num_channels = 1
+            num_frames = sample_rate * wav_duration
+            wav_data = paddle.linspace(-1.0, 1.0, num_frames) * 0.1
+            waveform = wav_data.tile([num_channels, 1])
+            base_dir = os.getcwd()
+            filepath = os.path.join(base_dir, "test.wav")
+
+            paddle.audio.save(filepath, waveform, sample_rate)
+            feature_extractor = paddle.audio.features.LogMelSpectrogram(sr=sample_rate)
+            for chunk in paddle.audio.stream(filepath, frames_per_chunk=4000):
+                feats = feature_extractor(chunk)
+    """
+    if frames_per_chunk <= 0:
+        raise ValueError(
+            "frames_per_chunk should be a positive value, but got {}".format(
+                frames_per_chunk
+            )
+        )
+    total_frames = info(filepath).num_samples
+    end = total_frames if num_frames == -1 else frame_offset + num_frames
+    end = min(end, total_frames)
+    for offset in range(frame_offset, end, frames_per_chunk):
+        chunk, _ = load(
+            filepath,
+            frame_offset=offset,
+            num_frames=min(frames_per_chunk, end - offset),
+            normalize=normalize,
+            channels_first=channels_first,
+        )
+        yield chunk
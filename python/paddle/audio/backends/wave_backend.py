@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
+import struct
 import wave
 from pathlib import Path
 from typing import Optional, Tuple, Union
@@ -34,6 +36,23 @@ def _error_message():
     return warn_msg
 
 
+def _data_chunk_offset(file_obj):
+    # returns the byte offset of the samples in a RIFF WAVE file, or None
+    file_obj.seek(0)
+    header = file_obj.read(12)
+    if len(header) < 12 or header[:4] != b'RIFF' or header[8:] != b'WAVE':
+        return None
+    while True:
+        chunk_header = file_obj.read(8)
+        if len(chunk_header) < 8:
+            return None
+        chunk_id, chunk_size = struct.unpack('<4sI', chunk_header)
+        if chunk_id == b'data':
+            return file_obj.tell()
+        # chunks are word aligned
+        file_obj.seek(chunk_size + (chunk_size & 1), os.SEEK_CUR)
+
+
 def info(filepath: str) -> AudioInfo:
     """Get signal information of input audio file.
 
@@ -94,6 +113,7 @@ def load(
     channels_first: bool = True,
 ) -> Tuple[paddle.Tensor, int]:
     """Load audio data from file. load the audio content start form frame_offset, and get num_frames.
+    Only the requested frames are read, PCM16 WAV files given by path are read by memory map.
 
     Args:
         frame_offset: from 0 to total frames,
@@ -143,12 +163,37 @@ def load(
     sample_rate = file_.getframerate()
     frames = file_.getnframes()  # audio frame
 
-    audio_content = file_.readframes(frames)
-    file_obj.close()
-
-    # default_subtype = "PCM_16", only support PCM16 WAV
-    audio_as_np16 = np.frombuffer(audio_content, dtype=np.int16)
+    frame_offset = min(frame_offset, frames)
+    if num_frames == -1 or frame_offset + num_frames > frames:
+        num_frames = frames - frame_offset
+
+    data_offset = None
+    if not hasattr(filepath, 'read') and file_.getsampwidth() == 2:
+        data_offset = _data_chunk_offset(file_obj)
+    if data_offset is not None:
+        # the data chunk of a truncated file is shorter than its header says
+        frame_bytes = 2 * channels
+        file_frames = (os.fstat(file_obj.fileno()).st_size - data_offset) // (
+            frame_bytes
+        )
+        num_frames = max(min(num_frames, file_frames - frame_offset), 0)
+    if data_offset is not None and num_frames > 0:
+        # only the pages of requested frames are read from disk
+        audio_as_np16 = np.memmap(
+            file_obj,
+            dtype='<i2',
+            mode='r',
+            offset=data_offset + frame_offset * frame_bytes,
+            shape=(num_frames * channels,),
+        )
+    else:
+        file_.setpos(frame_offset)
+        audio_content = file_.readframes(num_frames)
+        # default_subtype = "PCM_16", only support PCM16 WAV
+        audio_as_np16 = np.frombuffer(audio_content, dtype=np.int16)
     audio_as_np32 = audio_as_np16.astype(np.float32)
+    del audio_as_np16
+    file_obj.close()
     if normalize:
         # dtype = "float32"
         audio_norm = audio_as_np32 / (2**15)
@@ -156,9 +201,7 @@ def load(
         # dtype = "int16"
         audio_norm = audio_as_np32
 
-    waveform = np.reshape(audio_norm, (frames, channels))
-    if num_frames != -1:
-        waveform = waveform[frame_offset : frame_offset + num_frames, :]
+    waveform = np.reshape(audio_norm, (-1, channels))
     waveform = paddle.to_tensor(waveform)
     if channels_first:
         waveform = paddle.transpose(waveform, perm=[1, 0])
@@ -11,8 +11,13 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+
+import hashlib
+import os
 from typing import List
 
+import numpy as np
+
 import paddle
 
 from ..features import MFCC, LogMelSpectrogram, MelSpectrogram, Spectrogram
@@ -25,6 +30,30 @@ feat_funcs = {
     'spectrogram': Spectrogram,
 }
 
+# {(feat_type, device, sorted config items): feature extractor}
+_feature_extractors = {}
+
+
+def _get_feature_extractor(feat_type, sample_rate, feat_config):
+    """
+    Get the feature extractor layer of :attr:`feat_type` with config, which
+    is built once and reused, as building it computes the fbank matrix,
+    the window and the DCT matrix.
+    """
+    feat_config = dict(feat_config)
+    if feat_type != 'spectrogram':
+        feat_config['sr'] = sample_rate
+    key = (feat_type, paddle.get_device(), tuple(sorted(feat_config.items())))
+    try:
+        feature_extractor = _feature_extractors.get(key)
+    except TypeError:
+        # unhashable config values, e.g. a list
+        return feat_funcs[feat_type](**feat_config)
+    if feature_extractor is None:
+        feature_extractor = feat_funcs[feat_type](**feat_config)
+        _feature_extractors[key] = feature_extractor
+    return feature_extractor
+
 
 class AudioClassificationDataset(paddle.io.Dataset):
     """
@@ -37,6 +66,7 @@ class AudioClassificationDataset(paddle.io.Dataset):
         labels: List[int],
         feat_type: str = 'raw',
         sample_rate: int = None,
+        feat_store: str = None,
         **kwargs,
     ):
         """
@@ -45,6 +75,10 @@ class AudioClassificationDataset(paddle.io.Dataset):
             labels (:obj:`List[int]`): Labels of audio files.
             feat_type (:obj:`str`, `optional`, defaults to `raw`):
                 It identifies the feature type that user wants to extrace of an audio file.
+            feat_store (:obj:`str`, `optional`, defaults to `None`):
+                A directory to store the features of all audio files. If it is set, features
+                are computed once and written into the directory, and are read by memory map
+                since then, instead of decoding audio files and computing features every epoch.
         """
         super().__init__()
 
@@ -62,32 +96,101 @@ class AudioClassificationDataset(paddle.io.Dataset):
             kwargs  # Pass keyword arguments to customize feature config
         )
 
+        self.feat_store = feat_store
+        self._feat_offsets = None
+        self._feat_shapes = None
+        self._feat_data = None
+        if feat_store is not None:
+            self._load_feat_store()
+
     def _get_data(self, input_file: str):
         raise NotImplementedError
 
-    def _convert_to_record(self, idx):
-        file, label = self.files[idx], self.labels[idx]
+    def _extract_feature(self, idx):
+        file = self.files[idx]
         waveform, sample_rate = paddle.audio.load(file)
         self.sample_rate = sample_rate
 
-        feat_func = feat_funcs[self.feat_type]
-
-        record = {}
         if len(waveform.shape) == 2:
             waveform = waveform.squeeze(0)  # 1D input
         waveform = paddle.to_tensor(waveform, dtype=paddle.float32)
-        if feat_func is not None:
-            waveform = waveform.unsqueeze(0)  # (batch_size, T)
-            if self.feat_type != 'spectrogram':
-                feature_extractor = feat_func(
-                    sr=self.sample_rate, **self.feat_config
+        if feat_funcs[self.feat_type] is None:
+            return waveform
+        waveform = waveform.unsqueeze(0)  # (batch_size, T)
+        feature_extractor = _get_feature_extractor(
+            self.feat_type, self.sample_rate, self.feat_config
+        )
+        return feature_extractor(waveform).squeeze(0)
+
+    def _feat_store_paths(self):
+        # the store is invalidated when the files or the feature config
+        # change, so several datasets can share one directory
+        sha = hashlib.sha256()
+        sha.update(
+            repr((self.feat_type, sorted(self.feat_config.items()))).encode()
+        )
+        for file in self.files:
+            stat = os.stat(file)
+            sha.update(repr((file, stat.st_size, stat.st_mtime_ns)).encode())
+        prefix = os.path.join(
+            self.feat_store, f'{self.feat_type}-{sha.hexdigest()[:16]}'
+        )
+        return prefix + '.bin', prefix + '.npz'
+
+    def _build_feat_store(self, data_path, index_path):
+        os.makedirs(self.feat_store, exist_ok=True)
+        offsets = [0]
+        shapes = []
+        data_tmp_path = f'{data_path}.tmp.{os.getpid()}'
+        index_tmp_path = f'{index_path}.tmp.{os.getpid()}'
+        try:
+            with open(data_tmp_path, 'wb') as f:
+                for idx in range(len(self.files)):
+                    feat = self._extract_feature(idx).numpy()
+                    feat = np.ascontiguousarray(feat, dtype=np.float32)
+                    f.write(feat.tobytes())
+                    offsets.append(offsets[-1] + feat.size)
+                    shapes.append(feat.shape)
+            with open(index_tmp_path, 'wb') as f:
+                np.savez(
+                    f,
+                    offsets=np.array(offsets, dtype=np.int64),
+                    shapes=np.array(shapes, dtype=np.int64),
                 )
-            else:
-                feature_extractor = feat_func(**self.feat_config)
-            record['feat'] = feature_extractor(waveform).squeeze(0)
+            # NOTE: the index is renamed last, a store with index is complete
+            os.replace(data_tmp_path, data_path)
+            os.replace(index_tmp_path, index_path)
+        finally:
+            for path in [data_tmp_path, index_tmp_path]:
+                if os.path.exists(path):
+                    os.remove(path)
+
+    def _load_feat_store(self):
+        data_path, index_path = self._feat_store_paths()
+        if not os.path.exists(index_path):
+            self._build_feat_store(data_path, index_path)
+        with np.load(index_path) as index:
+            self._feat_offsets = index['offsets']
+            self._feat_shapes = index['shapes']
+        self._feat_data_path = data_path
+
+    def _read_feature(self, idx):
+        if self._feat_data is None:
+            # mapped lazily, so that each DataLoader worker maps it itself
+            self._feat_data = np.memmap(
+                self._feat_data_path, dtype=np.float32, mode='r'
+            )
+        start, end = self._feat_offsets[idx], self._feat_offsets[idx + 1]
+        feat = self._feat_data[start:end].reshape(self._feat_shapes[idx])
+        return paddle.to_tensor(feat)
+
+    def _convert_to_record(self, idx):
+        record = {}
+        if self._feat_offsets is not None:
+            record['feat'] = self._read_feature(idx)
         else:
-            record['feat'] = waveform
-        record['label'] = label
+            record['feat'] = self._extract_feature(idx)
+        record['label'] = self.labels[idx]
         return record
 
     def __getitem__(self, idx):
@@ -96,3 +199,8 @@ class AudioClassificationDataset(paddle.io.Dataset):
 
     def __len__(self):
         return len(self.files)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_feat_data'] = None
+        return state
@@ -39,6 +39,7 @@ class ESC50(AudioClassificationDataset):
        split (int, optional): It specify the fold of dev dataset. Default:1.
        feat_type (str, optional): It identifies the feature type that user wants to extract of an audio file. Default:raw.
        archive(dict, optional): it tells where to download the audio archive. Default:None.
+       feat_store(str, optional): the directory to store precomputed features. If it is set, features of all audio files are computed once and read by memory map since then. Default:None.
 
     Returns:
         :ref:`api_paddle_io_Dataset`. An instance of ESC50 dataset.
@@ -41,6 +41,7 @@ class TESS(AudioClassificationDataset):
        split (int, optional): It specify the fold of dev dataset. Defaults to 1.
        feat_type (str, optional): It identifies the feature type that user wants to extract of an audio file. Defaults to raw.
        archive(dict): it tells where to download the audio archive. Defaults to None.
+       feat_store(str, optional): the directory to store precomputed features. If it is set, features of all audio files are computed once and read by memory map since then. Defaults to None.
 
     Returns:
         :ref:`api_paddle_io_Dataset`. An instance of TESS dataset.
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License
 
+import weakref
 from collections import OrderedDict
 from functools import reduce
 
@@ -22,6 +23,37 @@ from ..dist_tensor import DistributedTensor
 from ..operators.common import get_distributed_operator_impl_container
 from .base_cost import Cost
 
+# {cluster: {"dist_op": {key: cost}, "reshard": {key: cost}}}, the costs of
+# dist ops and reshards only depend on their keys and the cluster, so they
+# are shared by all estimators of the same cluster
+_cost_caches = weakref.WeakKeyDictionary()
+
+# attributes which do not affect the cost of an op
+_IGNORED_ATTR_NAMES = {"op_callstack", "op_namescope", "op_role_var"}
+
+
+class _Uncacheable(Exception):
+    pass
+
+
+def _get_cost_cache(cluster):
+    if cluster is None:
+        return {"dist_op": {}, "reshard": {}}
+    cache = _cost_caches.get(cluster)
+    if cache is None:
+        cache = {"dist_op": {}, "reshard": {}}
+        _cost_caches[cluster] = cache
+    return cache
+
+
+def _attr_value_key(value):
+    if isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, (list, tuple)):
+        return tuple(_attr_value_key(v) for v in value)
+    # e.g. blocks and variables
+    raise _Uncacheable()
+
 
 class CostEstimator:
     _sepical_op_type = ["fused_attention", "fused_feedforward"]
@@ -42,9 +74,21 @@ class CostEstimator:
         )  # {`op_id`: {"reshard": [], "dist_op": [], "local_cost": local_cost}}}
         self._bubble_time_mapping = {}
         self._ordered_ops = []
+        self._ordered_ops_version = None
         self.max_memories = {}
         self.max_memory = None
 
+        cost_cache = _get_cost_cache(cluster)
+        self._dist_op_cost_cache = cost_cache["dist_op"]
+        self._reshard_cost_cache = cost_cache["reshard"]
+        # {op id: key of dist op cost}, reused by reestimate for the ops
+        # which are not changed
+        self._op_cost_keys = {}
+        self._op_cost_keys_version = None
+        self._changed_op_ids = None
+        # {(shape, dtype, dims_mapping, mesh shape, process ids): bytes}
+        self._local_bytes_cache = {}
+
     @property
     def loop_count(self):
         return self._loop_count
@@ -147,7 +191,9 @@ class CostEstimator:
                     if self._is_special_var_name(var_name):
                         continue
                     var = get_var_with_recursion(var_name, block, self.program)
-                    reshard_cost = resharder.get_cost(op, var, self.cluster)
+                    reshard_cost = resharder.get_cost(
+                        op, var, self.cluster, self._reshard_cost_cache
+                    )
 
                     # Calc reshard cost
                     if reshard_cost is not None:
@@ -195,13 +241,8 @@ class CostEstimator:
                 op_dist_attr = dist_op.dist_attr
                 processes = op_dist_attr.process_mesh.process_ids
 
-                container = get_distributed_operator_impl_container(
-                    op_dist_attr.impl_type
-                )
-                dist_impl = container.impls[op_dist_attr.impl_idx]
-
-                dist_op_cost = dist_impl.calc_cost(
-                    op.attr('op_role'), dist_op, dist_context, self.cluster
+                dist_op_cost = self._get_dist_op_cost(
+                    op, dist_op, dist_context, block
                 )
                 detail["dist_op_cost"] = dist_op_cost
 
@@ -244,6 +285,85 @@ class CostEstimator:
                                 continue
                             self.local_cost(rank).time += item[rank].time
 
+    def _dist_op_cost_key(self, op, dist_op, block):
+        from ..operators.common import is_parameter_related
+        from ..reshard import get_var_with_recursion
+
+        dist_attr = dist_op.dist_attr
+        process_mesh = dist_attr.process_mesh
+
+        def _args_key(slots, get_arg_names, get_dims_mapping):
+            args = []
+            for slot in slots:
+                for var_name in get_arg_names(slot):
+                    var = get_var_with_recursion(var_name, block, self.program)
+                    dims_mapping = get_dims_mapping(var_name)
+                    args.append(
+                        (
+                            slot,
+                            "@GRAD" in var_name,
+                            is_parameter_related(var_name, block),
+                            tuple(var.shape),
+                            var.dtype,
+                            tuple(dims_mapping)
+                            if dims_mapping is not None
+                            else None,
+                        )
+                    )
+            return tuple(args)
+
+        # NOTE: var names are not considered, so that the same ops of
+        # different layers share the cost
+        attrs = tuple(
+            sorted(
+                (name, _attr_value_key(value))
+                for name, value in op.all_attrs().items()
+                if name not in _IGNORED_ATTR_NAMES
+            )
+        )
+        return (
+            op.type,
+            dist_attr.impl_type,
+            dist_attr.impl_idx,
+            tuple(process_mesh.process_ids),
+            tuple(process_mesh.shape),
+            attrs,
+            _args_key(
+                op.input_names, op.input, dist_attr.get_input_dims_mapping
+            ),
+            _args_key(
+                op.output_names, op.output, dist_attr.get_output_dims_mapping
+            ),
+        )
+
+    def _get_dist_op_cost(self, op, dist_op, dist_context, block):
+        op_id = op.desc.id()
+        if (
+            self._changed_op_ids is None
+            or op_id in self._changed_op_ids
+            or op_id not in self._op_cost_keys
+        ):
+            try:
+                key = self._dist_op_cost_key(op, dist_op, block)
+            except _Uncacheable:
+                key = None
+            self._op_cost_keys[op_id] = key
+        key = self._op_cost_keys[op_id]
+        if key is not None and key in self._dist_op_cost_cache:
+            return self._dist_op_cost_cache[key]
+
+        op_dist_attr = dist_op.dist_attr
+        container = get_distributed_operator_impl_container(
+            op_dist_attr.impl_type
+        )
+        dist_impl = container.impls[op_dist_attr.impl_idx]
+        dist_op_cost = dist_impl.calc_cost(
+            op.attr('op_role'), dist_op, dist_context, self.cluster
+        )
+        if key is not None:
+            self._dist_op_cost_cache[key] = dist_op_cost
+        return dist_op_cost
+
     def prepare(self):
         self._global_cost = Cost()
         self._local_cost_mapping = {}
@@ -274,6 +394,26 @@ class CostEstimator:
         memory = total_count * dtype_factor
         return memory
 
+    def _get_local_bytes(self, var, dims_mapping, process_mesh):
+        key = (
+            tuple(var.shape),
+            var.dtype,
+            tuple(dims_mapping),
+            tuple(process_mesh.shape),
+            tuple(process_mesh.process_ids),
+        )
+        memory = self._local_bytes_cache.get(key)
+        if memory is None:
+            sizes = DistributedTensor.get_local_sizes(
+                var.shape,
+                dims_mapping,
+                process_mesh.shape,
+                process_mesh.process_ids,
+            )
+            memory = self._calculate_bytes(sizes, var.dtype)
+            self._local_bytes_cache[key] = memory
+        return memory
+
     def _estimate_max_memory_by_dist_op(self, dist_context):
         # This estimation will be improved, now reshard and inplace are not considered.
         # Persist var is not free.
@@ -290,10 +430,13 @@ class CostEstimator:
             {}
         )  # var_name: [[process_mesh, dims_mapping], [id]], [[process_mesh, dims_mapping], [id]]}
 
-        for block in self.program.blocks:
-            for op in block.ops:
-                self._ordered_ops.append([op.desc.id(), op])
-        self._ordered_ops.sort(key=lambda x: x[0])
+        if self._ordered_ops_version != self.program._cache_version:
+            self._ordered_ops = []
+            for block in self.program.blocks:
+                for op in block.ops:
+                    self._ordered_ops.append([op.desc.id(), op])
+            self._ordered_ops.sort(key=lambda x: x[0])
+            self._ordered_ops_version = self.program._cache_version
 
         parameters = set()
         for op_id, op in self._ordered_ops:
@@ -326,16 +469,8 @@ class CostEstimator:
 
                 if "memory" not in var_info[var_name][key]:
                     var = dist_op.get_serial_input(var_name)
-                    global_sizes = var.shape
-                    dtype = var.dtype
-                    sizes = DistributedTensor.get_local_sizes(
-                        global_sizes,
-                        input_dims_mapping,
-                        process_mesh.shape,
-                        process_mesh.process_ids,
-                    )
-                    var_info[var_name][key]["memory"] = self._calculate_bytes(
-                        sizes, dtype
+                    var_info[var_name][key]["memory"] = self._get_local_bytes(
+                        var, input_dims_mapping, process_mesh
                     )
                     if var.persistable:
                         name = var_name + key
@@ -365,16 +500,8 @@ class CostEstimator:
 
                 if "memory" not in var_info[var_name][key]:
                     var = dist_op.get_serial_output(var_name)
-                    global_sizes = var.shape
-                    dtype = var.dtype
-                    sizes = DistributedTensor.get_local_sizes(
-                        global_sizes,
-                        output_dims_mapping,
-                        process_mesh.shape,
-                        process_mesh.process_ids,
-                    )
-                    var_info[var_name][key]["memory"] = self._calculate_bytes(
-                        sizes, dtype
+                    var_info[var_name][key]["memory"] = self._get_local_bytes(
+                        var, output_dims_mapping, process_mesh
                     )
                     if var.persistable:
                         name = var_name + key
@@ -505,11 +632,37 @@ class CostEstimator:
             else resharder
         )
 
+        if self._op_cost_keys_version != self.program._cache_version:
+            # ops may be added or modified, all keys are recomputed
+            self._changed_op_ids = None
         block = self.program.global_block()
         self._estimate_core(dist_context, resharder, block)
+        self._op_cost_keys_version = self.program._cache_version
 
         return self.global_cost
 
+    def reestimate(self, dist_context, changed_ops, resharder=None):
+        """
+        Estimate the cost again after the dist attributes of changed_ops are
+        modified since the last estimate. The costs of the other ops are
+        looked up by their keys of the last estimate instead of being
+        recomputed, which is much faster for searching dist attributes of
+        large programs.
+
+        Args:
+            dist_context (DistributedContext): The dist context.
+            changed_ops (list): The ops whose dist attributes are changed.
+            resharder (Resharder, optional): The resharder. Default: None.
+
+        Returns:
+            Cost: The global cost.
+        """
+        self._changed_op_ids = {op.desc.id() for op in changed_ops}
+        try:
+            return self.estimate(dist_context, resharder)
+        finally:
+            self._changed_op_ids = None
+
     def _print_tag(self, max_len, length):
         tag = "+" + "-" * max_len
         for i in range(length):
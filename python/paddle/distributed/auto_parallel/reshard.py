@@ -2691,8 +2691,10 @@ class Resharder:
         # reset some variable when remove operation ended
         Resharder.while_block_info = {}
 
-    def get_cost(self, op, tensor, cluster):
+    def get_cost(self, op, tensor, cluster, cost_cache=None):
         # NOTE: The program should be the serial_program which is not been parted
+        # cost_cache is a dict to memoize the cost of resharding tensors with
+        # the same shape and dist attrs on the same cluster
         global _g_special_ops
         not_supported_op_type = _g_special_ops + ["while"]
         reshard_op_cost = None
@@ -2736,13 +2738,33 @@ class Resharder:
                                 return reshard_op_cost
                         self._has_resharded[tensor_name].append(dist_op)
 
+                    cache_key = None
+                    serial_tensor = dist_tensor.serial_tensor
+                    # NOTE: the unknown batch size is set in find_op_desc_seq
+                    if cost_cache is not None and -1 not in serial_tensor.shape:
+                        tensor_dist_attr = dist_tensor.dist_attr
+                        cache_key = (
+                            tuple(serial_tensor.shape),
+                            serial_tensor.dtype,
+                            tuple(tensor_dist_attr.process_mesh.process_ids),
+                            tuple(tensor_dist_attr.process_mesh.shape),
+                            tuple(tensor_dist_attr.dims_mapping),
+                            tuple(process_mesh.process_ids),
+                            tuple(process_mesh.shape),
+                            tuple(dims_mapping),
+                        )
+                        if cache_key in cost_cache:
+                            return cost_cache[cache_key]
+
                     reshard_op_desc = self.find_op_desc_seq(
                         dist_tensor, dist_attr, serial=True
                     )
-                    dtype = dist_tensor.serial_tensor.dtype
+                    dtype = serial_tensor.dtype
                     reshard_op_cost = self.parse_op_desc_for_cost(
                         reshard_op_desc, dtype, cluster
                     )
+                    if cache_key is not None:
+                        cost_cache[cache_key] = reshard_op_cost
 
         return reshard_op_cost
 
@@ -21,6 +21,29 @@ from .trial import OptimizationTunerTrial as Trial
 from .trial import TrialStatus
 
 
+def _get_recompute_segments(program):
+    """
+    Return the names of recompute segments in the order they appear in the
+    global block of program. The result is cached on the program until the
+    program is modified.
+    """
+    cached = getattr(program, '_recompute_segments_cache', None)
+    if cached is not None and cached[0] == program._cache_version:
+        return cached[1]
+
+    segments = []
+    for op in program.global_block().ops:
+        if not is_recompute_op(op):
+            continue
+
+        seg_name = op.attr('op_namescope')
+        if seg_name not in segments:
+            segments.append(seg_name)
+
+    program._recompute_segments_cache = (program._cache_version, segments)
+    return segments
+
+
 class AlgorithmBase(ABC):
     """
     An Tuning algorithm is a class to find out an optimal configuration
@@ -68,6 +91,14 @@ class AlgorithmBase(ABC):
     def next_trial(self):
         pass
 
+    def next_trials(self, num):
+        """
+        Return at most num trials which could be evaluated independently,
+        i.e. the trials next_trial would return one by one if none of them
+        is pruned by update. Only the next trial is returned by default.
+        """
+        return [self.next_trial()]
+
     @abstractmethod
     def update(self, results):
         """
@@ -125,7 +156,7 @@ class ShardingStageAlgorithm(AlgorithmBase):
             )
             stage_range.sort(reverse=True)
         else:
-            stage_range = list(range(self._max_stage + 1)).sort(reverse=True)
+            stage_range = sorted(range(self._max_stage + 1), reverse=True)
 
         self._stage_range = stage_range[:]
         self._total_num_trial = len(self._stage_range)
@@ -147,6 +178,16 @@ class ShardingStageAlgorithm(AlgorithmBase):
         else:
             return Trial(None, None, None, status=TrialStatus.STOPPED)
 
+    def next_trials(self, num):
+        # trials of all stages are independent, they are only pruned by OOM
+        trial_idx = self._trial_idx
+        trials = []
+        while len(trials) < num and self._trial_idx < self._total_num_trial:
+            trials.append(self.next_trial())
+            self._trial_idx += 1
+        self._trial_idx = trial_idx
+        return trials if trials else [self.next_trial()]
+
     def update(self, results):
 
         et = results.get("ErrorType", None)
@@ -166,14 +207,7 @@ class ReccomputeCheckpointAlgorithm(AlgorithmBase):
         self._changed_configs = ["recompute"]
 
     def collect_model_info(self, main_prog, startup_prog):
-        segments = []
-        for op in main_prog.global_block().ops:
-            if not is_recompute_op(op):
-                continue
-
-            seg_name = op.attr('op_namescope')
-            if seg_name not in segments:
-                segments.append(seg_name)
+        segments = _get_recompute_segments(main_prog)
 
         self._total_num_trial = len(segments)
         self._tuning_segments = list(range(len(segments)))
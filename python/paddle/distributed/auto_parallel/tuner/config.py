@@ -46,6 +46,8 @@ class TuningConfig:
         self._max_num_trial = None
         self._early_stop = None
         self._debug = None
+        self._num_workers = None
+        self._memory_limit = None
 
         self._initialize()
 
@@ -81,6 +83,14 @@ class TuningConfig:
     def debug(self):
         return self._debug
 
+    @property
+    def num_workers(self):
+        return self._num_workers
+
+    @property
+    def memory_limit(self):
+        return self._memory_limit
+
     @property
     def dist_strategy(self):
         return self._dist_strategy
@@ -95,6 +105,11 @@ class TuningConfig:
         self._max_num_trial = tuning_strategy.get("max_num_trial", 50)
         self._early_stop = tuning_strategy.get("early_stop", None)
         self._debug = tuning_strategy.get("debug", False)
+        # number of processes to build the programs of independent trials
+        self._num_workers = tuning_strategy.get("num_workers", 0)
+        # trials whose max memory estimated by cost model exceeds it (in
+        # bytes) are pruned without profiling
+        self._memory_limit = tuning_strategy.get("memory_limit", None)
 
         project_dir = tuning_strategy.get("project_dir", None)
         if not project_dir:
@@ -13,8 +13,10 @@
 # limitations under the License.
 
 import copy
+import hashlib
 import json
 import logging
+import multiprocessing
 
 # import yaml
 import os
@@ -25,9 +27,11 @@ import shutil
 import subprocess
 import sys
 import time
+from concurrent.futures import ProcessPoolExecutor
 
 import paddle
 from paddle.distributed.auto_parallel.completion import Completer
+from paddle.distributed.auto_parallel.cost import CostEstimator
 from paddle.distributed.auto_parallel.dist_context import DistributedContext
 from paddle.distributed.auto_parallel.partitioner import Partitioner
 from paddle.distributed.auto_parallel.process_group import (
@@ -49,6 +53,12 @@ from .algorithms import new_algorithm
 from .config import TuningConfig
 from .trial import TrialStatus
 
+# configs of the strategy which are used to build the programs of a trial
+_TRIAL_CONFIG_NAMES = ["amp", "recompute", "sharding", "gradient_merge"]
+
+# (tuner, trials) to be prepared in forked worker processes
+_worker_context = None
+
 
 def _get_new_params_grads(target_program, ref_program, ref_params_grads):
     ref_block = ref_program.global_block()
@@ -96,6 +106,43 @@ def get_metric(results):
         return -1.0
 
 
+def _strategy_key(strategy):
+    configs = {
+        name: getattr(strategy, name).to_dict() for name in _TRIAL_CONFIG_NAMES
+    }
+    return json.dumps(configs, sort_keys=True, default=str)
+
+
+def _prepare_trial_in_worker(idx):
+    tuner, trials = _worker_context
+    trial = tuner._apply_optimization(trials[idx])
+    return (
+        trial.main_program.desc.serialize_to_string(),
+        trial.startup_program.desc.serialize_to_string(),
+        trial.group_map,
+        trial.max_memory,
+    )
+
+
+class _TrialRecord:
+    """
+    The memoized programs and results of trials with the same strategy.
+    """
+
+    def __init__(self, trial):
+        self.main_program = trial.main_program
+        self.startup_program = trial.startup_program
+        self.group_map = trial.group_map
+        self.max_memory = trial.max_memory
+        self.results = None
+
+    def apply(self, trial):
+        trial.main_program = self.main_program
+        trial.startup_program = self.startup_program
+        trial.group_map = self.group_map
+        trial.max_memory = self.max_memory
+
+
 def parse_results(results):
     if results['Throughtput'] > 0:
         return "Throughtput: {} step / s.".format(results['Throughtput'])
@@ -223,6 +270,8 @@ class OptimizationTuner:
         self._finished_trials = []
         self._best_metric = None
         self._best_iter = float("-inf")
+        # {(program key, strategy key): _TrialRecord}
+        self._trial_records = {}
 
         self._logger = get_logger(logging.INFO)
 
@@ -269,6 +318,11 @@ class OptimizationTuner:
         )
         self._baseline_dist_context._params_grads = params_grads
 
+        sha = hashlib.sha256()
+        sha.update(serial_main_program.desc.serialize_to_string())
+        sha.update(serial_startup_program.desc.serialize_to_string())
+        self._program_key = sha.hexdigest()
+
         if self._config.debug:
             baseline_dir = os.path.join(self.project_dir, "baseline")
             if not os.path.exists(baseline_dir):
@@ -410,8 +464,74 @@ class OptimizationTuner:
             dist_main_prog,
             dist_startup_prog,
         )
+        trial.group_map = parse_process_groups()
+        trial.max_memory = self._estimate_max_memory(dist_context)
         return trial
 
+    def _estimate_max_memory(self, dist_context):
+        if self._config.memory_limit is None:
+            return None
+        estimator = CostEstimator(
+            dist_context.serial_main_program,
+            dist_context.cluster,
+            rank=self.rank,
+        )
+        return estimator._estimate_max_memory_by_dist_op(dist_context)
+
+    def _trial_key(self, trial):
+        return (self._program_key, _strategy_key(trial.space))
+
+    def _prepare_trials(self, trials):
+        """
+        Apply optimization to the trials which are not memoized. The programs
+        are built in forked worker processes if num_workers > 1, so that
+        independent trials are prepared concurrently on CPU.
+        """
+        new_trials = {}
+        for trial in trials:
+            key = self._trial_key(trial)
+            if key not in self._trial_records and key not in new_trials:
+                new_trials[key] = trial
+        if not new_trials:
+            return
+
+        num_workers = min(self._config.num_workers, len(new_trials))
+        if (
+            num_workers > 1
+            and "fork" in multiprocessing.get_all_start_methods()
+        ):
+            global _worker_context
+            _worker_context = (self, list(new_trials.values()))
+            try:
+                with ProcessPoolExecutor(
+                    max_workers=num_workers,
+                    mp_context=multiprocessing.get_context("fork"),
+                ) as pool:
+                    outputs = list(
+                        pool.map(
+                            _prepare_trial_in_worker, range(len(new_trials))
+                        )
+                    )
+            finally:
+                _worker_context = None
+
+            for trial, output in zip(new_trials.values(), outputs):
+                main_desc, startup_desc, group_map, max_memory = output
+                trial.main_program = paddle.static.Program.parse_from_string(
+                    main_desc
+                )
+                trial.startup_program = paddle.static.Program.parse_from_string(
+                    startup_desc
+                )
+                trial.group_map = group_map
+                trial.max_memory = max_memory
+        else:
+            for trial in new_trials.values():
+                self._apply_optimization(trial)
+
+        for key, trial in new_trials.items():
+            self._trial_records[key] = _TrialRecord(trial)
+
     def _get_profile_context(self, trial, result_path):
 
         profile_ctx = {}
@@ -419,7 +539,7 @@ class OptimizationTuner:
         profile_ctx['distributed_env'] = copy.deepcopy(
             paddle.distributed.ParallelEnv()
         )
-        profile_ctx['group_map'] = parse_process_groups()
+        profile_ctx['group_map'] = trial.group_map
         profile_ctx[
             "loss_var_name"
         ] = self._baseline_dist_context.serial_loss.name
@@ -528,9 +648,27 @@ class OptimizationTuner:
     def _evaluate_trial(self, trial):
 
         self._logger.info(f"Trial {trial.name} evaluation start.")
-        self._apply_optimization(trial)
-
-        if self._config.mode == "PROFILE":
+        key = self._trial_key(trial)
+        if key not in self._trial_records:
+            self._prepare_trials([trial])
+        record = self._trial_records[key]
+        record.apply(trial)
+
+        memory_limit = self._config.memory_limit
+        if record.results is not None:
+            # same programs as a finished trial
+            results = record.results
+        elif memory_limit is not None and trial.max_memory > memory_limit:
+            self._logger.info(
+                "Trial {} is pruned since the estimated max memory {} exceeds the limit {}.".format(
+                    trial.name, trial.max_memory, memory_limit
+                )
+            )
+            results = {
+                "Throughtput": -1,
+                "ErrorType": "ResourceExhaustedError",
+            }
+        elif self._config.mode == "PROFILE":
             results = self._profile_trial(trial)
 
         elif self._config.mode == "COSTMODEL":
@@ -542,6 +680,7 @@ class OptimizationTuner:
                 f"invalid evaluation mode: {self._config.mode}"
             )
 
+        record.results = results
         self._logger.info(
             "Trial {} evaluation finish with {}.".format(
                 trial.name, parse_results(results)
@@ -623,34 +762,48 @@ The best trial is: [{}], whose configuration is following:
 
         # main search loop
         i = 0
-        while i < self._config.max_num_trial:
-            # step2: create a new trial
-            trial = self._algorithm.next_trial()
-
-            if trial.status == TrialStatus.STOPPED:
+        stopped = False
+        while not stopped and i < self._config.max_num_trial:
+            # step2: create new trials, which are prepared concurrently
+            # if they are independent
+            trials = self._algorithm.next_trials(
+                max(self._config.num_workers, 1)
+            )[: self._config.max_num_trial - i]
+
+            if trials[0].status == TrialStatus.STOPPED:
                 break
-
-            # step3: evaluate the trial
-            results = self._evaluate_trial(trial)
-
-            # step4: update the algorithm with last result,
-            # which could be used by algorithm to pruning the
-            # remaining search space.
-            self._algorithm.update(results)
-            self._update(i, trial, results)
-
-            # early stop
-            i += 1
-            if (
-                self._config.early_stop
-                and self._config.early_stop <= i - self._best_iter
-            ):
-                self._logger.info(
-                    "Early stop the Tuning since there is no better trial found within [{}] trials".format(
-                        self._config.early_stop
+            self._prepare_trials(trials)
+
+            for trial in trials:
+                # the remaining trials are pruned by the last result
+                if (
+                    trial is not trials[0]
+                    and self._algorithm.next_trial().name != trial.name
+                ):
+                    break
+
+                # step3: evaluate the trial
+                results = self._evaluate_trial(trial)
+
+                # step4: update the algorithm with last result,
+                # which could be used by algorithm to pruning the
+                # remaining search space.
+                self._algorithm.update(results)
+                self._update(i, trial, results)
+
+                # early stop
+                i += 1
+                if (
+                    self._config.early_stop
+                    and self._config.early_stop <= i - self._best_iter
+                ):
+                    self._logger.info(
+                        "Early stop the Tuning since there is no better trial found within [{}] trials".format(
+                            self._config.early_stop
+                        )
                     )
-                )
-                break
+                    stopped = True
+                    break
 
         # step5: summary the best config and return
         self.summary()
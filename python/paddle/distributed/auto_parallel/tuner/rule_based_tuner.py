@@ -1096,6 +1096,9 @@ class RuleBasedTuner:
         # the op clustering result
         self.layers = []
 
+        # the cost estimator of full main program shared by all candidates
+        self._cost_estimator = None
+
         self._is_run = True
         if os.getenv("PADDLE_AUTO_PARALLEL_STAGE") != "tuner":
             self._is_run = True
@@ -1887,7 +1890,19 @@ class RuleBasedTuner:
 
     def _get_sub_program_cost(self, dist_context):
         """Estimate the cost of dist context."""
-        cost_estimator = CostEstimator(self.full_main_program, self._cluster)
+        # NOTE: the estimator is reused so that the op list of the program
+        # and the local tensor sizes are not rebuilt for every candidate.
+        # Every candidate changes the dist attrs of all ops, so estimate
+        # rather than reestimate is used, the op costs are still shared
+        # through the cost caches of the cluster.
+        if (
+            self._cost_estimator is None
+            or self._cost_estimator.program is not self.full_main_program
+        ):
+            self._cost_estimator = CostEstimator(
+                self.full_main_program, self._cluster
+            )
+        cost_estimator = self._cost_estimator
         global_cost = cost_estimator.estimate(dist_context)
         max_memory = cost_estimator._estimate_max_memory_by_dist_op(
             dist_context
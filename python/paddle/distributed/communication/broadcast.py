@@ -18,8 +18,8 @@ from paddle import framework
 from paddle.distributed.communication import stream
 
 from .serialization_utils import (
-    convert_object_to_tensor,
-    convert_tensor_to_object,
+    convert_objects_to_tensor,
+    convert_tensor_to_objects,
 )
 
 
@@ -106,32 +106,20 @@ def broadcast_object_list(object_list, src, group=None):
     ), "broadcast_object_list doesn't support static graph mode."
 
     rank = dist.get_rank()
-    obj_tensors = []
-    obj_nums = len(object_list)
 
+    # pack all objects into one tensor, then broadcast its size and data
     if rank == src:
-        obj_sizes = []
-        for obj in object_list:
-            obj_tensor, obj_size = convert_object_to_tensor(obj)
-            obj_tensors.append(obj_tensor)
-            obj_sizes.append(obj_size)
-        obj_size_tensor = paddle.stack(obj_sizes)
+        obj_data_tensor, obj_size = convert_objects_to_tensor(object_list)
+        obj_size_tensor = paddle.reshape(obj_size, [1])
     else:
-        obj_size_tensor = paddle.empty([obj_nums], dtype="int64")
+        obj_size_tensor = paddle.empty([1], dtype="int64")
     broadcast(obj_size_tensor, src, group)
 
-    if rank == src:
-        # cast to uint8 to keep the same dtype
-        obj_data_tensor = paddle.concat(obj_tensors).cast("uint8")
-    else:
-        data_len = paddle.sum(obj_size_tensor).item()
+    if rank != src:
+        data_len = obj_size_tensor.item()
         obj_data_tensor = paddle.empty([data_len], dtype="uint8")
     broadcast(obj_data_tensor, src, group)
 
-    offset = 0
-    for i in range(obj_nums):
-        data_len = obj_size_tensor[i]
-        object_list[i] = convert_tensor_to_object(
-            obj_data_tensor[offset : offset + data_len], data_len
-        )
-        offset += data_len
+    object_list[:] = convert_tensor_to_objects(
+        obj_data_tensor, obj_size_tensor.item()
+    )
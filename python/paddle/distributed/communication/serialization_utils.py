@@ -12,23 +12,201 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+# NOTE: [ serialized object layout ]
+# An object is serialized into one uint8 buffer laid out as:
+#
+#   | header | buffer sizes | skeleton | padding | buffer 0 | padding | ... |
+#
+# header: skeleton size and number of buffers, see _HEADER.
+# buffer sizes: one uint64 for each buffer.
+# skeleton: the pickled object, in which every tensor and numpy array is
+#   replaced by a persistent id holding its kind, dtype and shape.
+# buffer: raw data of a tensor or numpy array in C order, _ALIGNMENT aligned.
+#
+# Tensors and arrays are copied once into the buffer instead of going
+# through pickle, and are viewed from the received buffer without copying.
+#
+# Several objects are packed into one buffer laid out as:
+#
+#   | number of objects | object sizes | padding | object 0 | padding | ... |
+
 import io
 import pickle
+import struct
 
 import numpy as np
 
 import paddle
+from paddle.fluid import core
+from paddle.fluid.data_feeder import convert_dtype
 
+_ALIGNMENT = 64
+# skeleton size, number of buffers
+_HEADER = struct.Struct('<QQ')
+_SIZE = struct.Struct('<Q')
 
-def convert_object_to_tensor(obj):
-    _pickler = pickle.Pickler
+_KIND_NDARRAY = 0
+_KIND_TENSOR = 1
+
+
+def _align(offset):
+    return (offset + _ALIGNMENT - 1) // _ALIGNMENT * _ALIGNMENT
+
+
+def _is_plain_array(obj):
+    return (
+        isinstance(obj, np.ndarray)
+        and obj.dtype.fields is None
+        and not obj.dtype.hasobject
+    )
+
+
+class _OutOfBandPickler(pickle.Pickler):
+    def __init__(self, f):
+        super().__init__(f, protocol=4)
+        self.buffers = []
+        # keep the same object in one buffer, and keep it alive until
+        # the pickling is done so that ids are not reused
+        self._pids = {}
+
+    def _add_buffer(self, obj, arr, *meta):
+        key = id(obj)
+        if key not in self._pids:
+            self.buffers.append(np.ascontiguousarray(arr))
+            index = len(self.buffers) - 1
+            self._pids[key] = (
+                (meta[0], index, arr.dtype.str, arr.shape) + meta[1:],
+                obj,
+            )
+        return self._pids[key][0]
+
+    def persistent_id(self, obj):
+        if isinstance(obj, core.eager.Tensor):
+            return self._add_buffer(
+                obj,
+                obj.numpy(),
+                _KIND_TENSOR,
+                convert_dtype(obj.dtype),
+                obj.stop_gradient,
+            )
+        elif _is_plain_array(obj):
+            return self._add_buffer(obj, obj, _KIND_NDARRAY)
+        return None
+
+
+class _OutOfBandUnpickler(pickle.Unpickler):
+    def __init__(self, f, buffers):
+        super().__init__(f)
+        self._buffers = buffers
+
+    def persistent_load(self, pid):
+        kind, index, dtype, shape = pid[:4]
+        arr = self._buffers[index].view(dtype).reshape(shape)
+        if kind == _KIND_TENSOR:
+            dtype, stop_gradient = pid[4:]
+            return paddle.to_tensor(
+                arr, dtype=dtype, stop_gradient=stop_gradient
+            )
+        return arr
+
+
+def _serialize(obj):
     f = io.BytesIO()
-    _pickler(f).dump(obj)
-    data = np.frombuffer(f.getvalue(), dtype=np.uint8)
+    pickler = _OutOfBandPickler(f)
+    pickler.dump(obj)
+    skeleton = f.getbuffer()
+    buffers = pickler.buffers
+
+    header_size = _HEADER.size + _SIZE.size * len(buffers)
+    offsets = []
+    offset = header_size + len(skeleton)
+    for buf in buffers:
+        offset = _align(offset)
+        offsets.append(offset)
+        offset += buf.nbytes
+
+    data = np.zeros([offset], dtype=np.uint8)
+    _HEADER.pack_into(data, 0, len(skeleton), len(buffers))
+    data[_HEADER.size : header_size] = np.array(
+        [buf.nbytes for buf in buffers], dtype='<u8'
+    ).view(np.uint8)
+    data[header_size : header_size + len(skeleton)] = np.frombuffer(
+        skeleton, dtype=np.uint8
+    )
+    for buf, offset in zip(buffers, offsets):
+        data[offset : offset + buf.nbytes] = buf.reshape([-1]).view(np.uint8)
+    return data
+
+
+def _deserialize(data):
+    data = np.ascontiguousarray(data, dtype=np.uint8)
+    skeleton_size, num_buffers = _HEADER.unpack_from(data, 0)
+    header_size = _HEADER.size + _SIZE.size * num_buffers
+    sizes = np.frombuffer(
+        data, dtype='<u8', count=num_buffers, offset=_HEADER.size
+    )
+    skeleton = data[header_size : header_size + skeleton_size].tobytes()
+
+    buffers = []
+    offset = header_size + skeleton_size
+    for size in sizes.tolist():
+        offset = _align(offset)
+        buffers.append(data[offset : offset + size])
+        offset += size
+    return _OutOfBandUnpickler(io.BytesIO(skeleton), buffers).load()
+
+
+def _pack_objects(objs):
+    payloads = [_serialize(obj) for obj in objs]
+    header_size = _SIZE.size * (len(payloads) + 1)
+    offsets = []
+    offset = header_size
+    for payload in payloads:
+        offset = _align(offset)
+        offsets.append(offset)
+        offset += payload.size
+
+    data = np.zeros([offset], dtype=np.uint8)
+    data[:header_size] = np.array(
+        [len(payloads)] + [payload.size for payload in payloads], dtype='<u8'
+    ).view(np.uint8)
+    for payload, offset in zip(payloads, offsets):
+        data[offset : offset + payload.size] = payload
+    return data
+
+
+def _unpack_objects(data):
+    data = np.ascontiguousarray(data, dtype=np.uint8)
+    (num_objs,) = _SIZE.unpack_from(data, 0)
+    sizes = np.frombuffer(data, dtype='<u8', count=num_objs, offset=_SIZE.size)
+    objs = []
+    offset = _SIZE.size * (num_objs + 1)
+    for size in sizes.tolist():
+        offset = _align(offset)
+        objs.append(_deserialize(data[offset : offset + size]))
+        offset += size
+    return objs
+
+
+def convert_object_to_tensor(obj):
+    data = _serialize(obj)
     tensor = paddle.to_tensor(data)
     return tensor, tensor.numel()
 
 
 def convert_tensor_to_object(tensor, len_of_tensor):
-    _unpickler = pickle.Unpickler
-    return _unpickler(io.BytesIO(tensor.numpy()[:len_of_tensor])).load()
+    return _deserialize(tensor.numpy()[:len_of_tensor])
+
+
+def convert_objects_to_tensor(objs):
+    """
+    Pack a list of objects into one uint8 tensor, so that they can be
+    exchanged by one collective call.
+    """
+    data = _pack_objects(objs)
+    tensor = paddle.to_tensor(data)
+    return tensor, tensor.numel()
+
+
+def convert_tensor_to_objects(tensor, len_of_tensor):
+    return _unpack_objects(tensor.numpy()[:len_of_tensor])
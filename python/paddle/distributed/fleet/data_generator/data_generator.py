@@ -14,9 +14,96 @@
 
 import sys
 
+import numpy as np
+
 __all__ = []
 
 
+def _flatten_slot(name, data):
+    """
+    Returns (values, lengths) of the slot :attr:`name` of a batch of
+    samples. :attr:`data` is an array of shape [N, K] if every sample has K
+    feasigns in the slot, or a tuple (values, lengths) of the flattened
+    feasigns of all samples and the number of feasigns of each sample.
+    """
+    if not isinstance(name, str):
+        raise ValueError("name%s must be in str type" % type(name))
+    if isinstance(data, tuple):
+        if len(data) != 2:
+            raise ValueError(
+                "the slot %s must be an array or a tuple (values, lengths)"
+                % name
+            )
+        values = np.asarray(data[0]).reshape([-1])
+        lengths = np.asarray(data[1]).reshape([-1])
+        if lengths.dtype.kind not in 'iu':
+            raise ValueError("the lengths of slot %s must be integers" % name)
+        if lengths.sum() != values.size:
+            raise ValueError(
+                "the lengths of slot %s do not match its %d values"
+                % (name, values.size)
+            )
+    else:
+        data = np.asarray(data)
+        if data.ndim == 1:
+            data = data.reshape([-1, 1])
+        if data.ndim != 2:
+            raise ValueError(
+                "the slot %s must be an array of shape [N, K], but got %s"
+                % (name, list(data.shape))
+            )
+        values = data.reshape([-1])
+        lengths = np.full([data.shape[0]], data.shape[1], dtype='int64')
+    if lengths.size > 0 and lengths.min() <= 0:
+        raise ValueError(
+            "the elements of each field can not be empty, you need padding it in process()."
+        )
+    return values, lengths
+
+
+def _join_slots(slots):
+    """
+    Joins the feasign strings of all slots into the MultiSlot text format,
+    one line for each sample, without a loop over samples in python.
+
+    Args:
+        slots(list): a list of (strs, lengths) for each slot, where strs is
+            the list of strings of the flattened feasigns of all samples.
+
+    Returns:
+        str: the lines of all samples.
+    """
+    num_samples = len(slots[0][1])
+    for _, lengths in slots:
+        if len(lengths) != num_samples:
+            raise ValueError(
+                "the sample numbers of slots are inconsistent: %d vs %d"
+                % (num_samples, len(lengths))
+            )
+    if num_samples == 0:
+        return ""
+
+    # each slot of a sample is a block of tokens: its length and feasigns
+    counts = np.stack([lengths + 1 for _, lengths in slots], axis=1)
+    flat_counts = counts.reshape([-1])
+    block_starts = (np.cumsum(flat_counts) - flat_counts).reshape(counts.shape)
+    line_ends = np.cumsum(counts.sum(axis=1))
+
+    # tokens and separators are interleaved, i.e. the token i is at 2 * i
+    tokens = np.empty([int(line_ends[-1]) * 2], dtype=object)
+    tokens[1::2] = " "
+    tokens[line_ends * 2 - 1] = "\n"
+    for index, (strs, lengths) in enumerate(slots):
+        starts = block_starts[:, index]
+        tokens[starts * 2] = list(map(str, lengths.tolist()))
+        offsets = np.cumsum(lengths) - lengths
+        positions = np.repeat(starts + 1 - offsets, lengths) + np.arange(
+            len(strs)
+        )
+        tokens[positions * 2] = strs
+    return "".join(tokens.tolist())
+
+
 class DataGenerator:
     """
     DataGenerator is a general Base class for user to inherit
@@ -134,6 +221,43 @@ class DataGenerator:
             for sample in batch_iter():
                 sys.stdout.write(self._gen_str(sample))
 
+    def run_from_stdin_batch(self):
+        '''
+        This function reads batch_size lines from stdin at a time, parses them
+        into slot arrays of all samples with the generate_sample_batch
+        function, and writes all samples to stdout in one call, which is much
+        faster than run_from_stdin for simple parsing logic.
+
+        Example:
+
+            .. code-block:: python
+
+                import numpy as np
+                import paddle.distributed.fleet.data_generator as dg
+                class MyData(dg.MultiSlotDataGenerator):
+
+                    def generate_sample_batch(self, lines):
+                        ids = np.array([line.split() for line in lines], dtype='int64')
+                        return [("words", ids[:, 1:]), ("label", ids[:, :1])]
+
+                mydata = MyData()
+                mydata.set_batch(1024)
+                mydata.run_from_stdin_batch()
+
+        '''
+        lines = []
+        for line in sys.stdin:
+            lines.append(line)
+            if len(lines) == self.batch_size_:
+                sys.stdout.write(
+                    self._gen_batch_str(self.generate_sample_batch(lines))
+                )
+                lines = []
+        if len(lines) > 0:
+            sys.stdout.write(
+                self._gen_batch_str(self.generate_sample_batch(lines))
+            )
+
     def _gen_str(self, line):
         '''
         Further processing the output of the process() function rewritten by
@@ -150,6 +274,22 @@ class DataGenerator:
             "pls use MultiSlotDataGenerator or PairWiseDataGenerator"
         )
 
+    def _gen_batch_str(self, slots):
+        '''
+        The batched version of _gen_str, which processes the output of the
+        generate_sample_batch() function rewritten by user.
+
+        Args:
+            slots(list|tuple): the output of generate_sample_batch().
+
+        Returns:
+            Return the lines of all samples that can be read directly by the
+            datafeed.
+        '''
+        raise NotImplementedError(
+            "pls use MultiSlotDataGenerator or MultiSlotStringDataGenerator"
+        )
+
     def generate_sample(self, line):
         '''
         This function needs to be overridden by the user to process the
@@ -192,6 +332,48 @@ class DataGenerator:
             + "[(name, [feasign, ...]), ...] or ((name, [feasign, ...]), ...)"
         )
 
+    def generate_sample_batch(self, lines):
+        '''
+        This function needs to be overridden by the user to process a batch
+        of original data rows into slot arrays, it is used by
+        run_from_stdin_batch.
+
+        Args:
+            lines(list): the original data rows
+
+        Returns:
+            Returns the slots of all samples.
+              The data format is list or tuple:
+            [(name, array), ...] or [(name, (values, lengths)), ...]
+              where array is a numpy array of shape [N, K] if each of the N
+              samples has K feasigns in the slot, values is the flattened
+              feasigns of all samples and lengths is the feasign number of
+              each sample.
+
+            For example, the slots of 2 samples:
+            [("words", ([1926, 8, 17, 1, 2], [3, 2])), ("label", [[1], [0]])]
+              are the same as the samples generated by generate_sample:
+            [("words", [1926, 8, 17]), ("label", [1])]
+            [("words", [1, 2]), ("label", [0])]
+
+        Example:
+
+            .. code-block:: python
+
+                import numpy as np
+                import paddle.distributed.fleet.data_generator as dg
+                class MyData(dg.MultiSlotDataGenerator):
+
+                    def generate_sample_batch(self, lines):
+                        ids = np.array([line.split() for line in lines], dtype='int64')
+                        return [("words", ids[:, 1:]), ("label", ids[:, :1])]
+
+        '''
+        raise NotImplementedError(
+            "Please rewrite this function to return a list or tuple: "
+            + "[(name, array), ...] or [(name, (values, lengths)), ...]"
+        )
+
     def generate_batch(self, samples):
         '''
         This function needs to be overridden by the user to process the
@@ -280,6 +462,37 @@ class MultiSlotStringDataGenerator(DataGenerator):
             output += " ".join(out_str)
         return output + "\n"
 
+    def _gen_batch_str(self, slots):
+        '''
+        The batched version of _gen_str, which outputs the lines of all
+        samples in the slots at once.
+
+        The input slots will be in this format:
+            >>> [(name, array), ...] or [(name, (values, lengths)), ...]
+
+        For example, if the input is like this:
+            >>> [("words", (["1926", "08", "17", "1"], [3, 1])), ("label", [["1"], ["0"]])]
+        the output will be:
+            >>> 3 1926 08 17 1 1
+            >>> 1 1 1 0
+
+        Args:
+            slots(list|tuple): the output of generate_sample_batch() rewritten by user.
+
+        Returns:
+            Return the lines of all samples that can be read directly by the MultiSlotDataFeed.
+        '''
+        if not isinstance(slots, (list, tuple)) or not slots:
+            raise ValueError(
+                "the output of generate_sample_batch() must be in list or tuple type"
+                "Examples: [('words', [['1926', '08'], ['17', '1']]), ('label', [['1'], ['0']])]"
+            )
+        flat_slots = []
+        for name, data in slots:
+            values, lengths = _flatten_slot(name, data)
+            flat_slots.append((list(map(str, values.tolist())), lengths))
+        return _join_slots(flat_slots)
+
 
 class MultiSlotDataGenerator(DataGenerator):
     def _gen_str(self, line):
@@ -383,3 +596,63 @@ class MultiSlotDataGenerator(DataGenerator):
                             )
                     output += " " + str(elem)
         return output + "\n"
+
+    def _gen_batch_str(self, slots):
+        '''
+        The batched version of _gen_str, which outputs the lines of all
+        samples in the slots at once, and updates proto_info information in
+        the same way as _gen_str.
+
+        The input slots will be in this format:
+            >>> [(name, array), ...] or [(name, (values, lengths)), ...]
+
+        For example, if the input is like this:
+            >>> [("words", ([1926, 8, 17, 1], [3, 1])), ("label", [[1], [0]])]
+        the output will be:
+            >>> 3 1926 8 17 1 1
+            >>> 1 1 1 0
+
+        Args:
+            slots(list|tuple): the output of generate_sample_batch() rewritten by user.
+
+        Returns:
+            Return the lines of all samples that can be read directly by the MultiSlotDataFeed.
+        '''
+        if not isinstance(slots, (list, tuple)) or not slots:
+            raise ValueError(
+                "the output of generate_sample_batch() must be in list or tuple type"
+                "Example: [('words', [[1926, 8], [17, 1]]), ('label', [[1], [0]])]"
+            )
+        if self._proto_info is not None and len(slots) != len(self._proto_info):
+            raise ValueError(
+                "the complete field set of two given line are inconsistent."
+            )
+
+        flat_slots = []
+        proto_info = []
+        for index, (name, data) in enumerate(slots):
+            values, lengths = _flatten_slot(name, data)
+            if values.dtype.kind == 'f':
+                slot_type = "float"
+            elif values.dtype.kind in 'iu':
+                slot_type = "uint64"
+            else:
+                raise ValueError(
+                    "the type of element%s must be in int or float"
+                    % values.dtype
+                )
+            if self._proto_info is not None:
+                if name != self._proto_info[index][0]:
+                    raise ValueError(
+                        "the field name of two given line are not match: require<%s>, get<%s>."
+                        % (self._proto_info[index][0], name)
+                    )
+                if self._proto_info[index][1] == "float":
+                    slot_type = "float"
+            proto_info.append((name, slot_type))
+            flat_slots.append((list(map(str, values.tolist())), lengths))
+
+        output = _join_slots(flat_slots)
+        if output:
+            self._proto_info = proto_info
+        return output
@@ -18,6 +18,8 @@ import multiprocessing
 import os
 import re
 import shutil
+import subprocess
+import threading
 import time
 
 # (TODO: GhostScreaming) It will be removed later.
@@ -380,6 +382,180 @@ class LocalFS(FS):
         return dirs
 
 
+# max number of paths in one batched hadoop command, which keeps the
+# command line far below the limit of the shell
+_MAX_PATHS_PER_CMD = 256
+
+_FS_SCHEME_RE = re.compile(r'^[a-zA-Z][a-zA-Z0-9+.-]*:(//[^/]*)?')
+
+
+# e.g. "ls: `/path': No such file or directory"
+_NOT_FOUND_RE = re.compile(r"`(.*)': No such file or directory")
+
+
+def _normalize_fs_path(fs_path):
+    return os.path.normpath(fs_path)
+
+
+def _strip_fs_scheme(fs_path):
+    # NOTE: hadoop may print the listed paths qualified differently from the
+    # given paths, e.g. hdfs://host:port/path for hdfs:/path
+    return os.path.normpath(_FS_SCHEME_RE.sub('', fs_path) or '/')
+
+
+def _split_paths(fs_paths):
+    for i in range(0, len(fs_paths), _MAX_PATHS_PER_CMD):
+        yield fs_paths[i : i + _MAX_PATHS_PER_CMD]
+
+
+class _FSStatCache:
+    """
+    A TTL cache of remote path metadata, i.e. whether a path exists and
+    whether it is a directory. It is only invalidated by the mutations of
+    the client which owns it, changes made by others are seen after at most
+    :attr:`ttl` milliseconds. The cache is disabled if :attr:`ttl` is 0.
+    """
+
+    def __init__(self, ttl=0):
+        self._ttl = float(ttl) / 1000.0
+        # {normalized path: (expire time, {'exist': bool, 'dir': bool})}
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self):
+        return self._ttl > 0
+
+    def get(self, fs_path, key):
+        """
+        Returns the cached `key` of `fs_path`, or None if it is not cached.
+        """
+        if not self.enabled:
+            return None
+        entry = self._entries.get(_normalize_fs_path(fs_path))
+        if entry is None or entry[0] < time.time():
+            return None
+        return entry[1].get(key)
+
+    def set(self, fs_path, **values):
+        if not self.enabled:
+            return
+        path = _normalize_fs_path(fs_path)
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is None or entry[0] < now:
+                entry = (now + self._ttl, {})
+                self._entries[path] = entry
+            entry[1].update(values)
+
+    def invalidate(self, fs_path):
+        """
+        Drop the cached metadata of `fs_path`, its descendants which may be
+        created or removed with it, and its ancestors which may be created
+        by `mkdir -p`.
+        """
+        if not self._entries:
+            return
+        path = _normalize_fs_path(fs_path)
+        prefix = path.rstrip('/') + '/'
+        with self._lock:
+            for p in list(self._entries.keys()):
+                if (
+                    p == path
+                    or p.startswith(prefix)
+                    or path.startswith(p.rstrip('/') + '/')
+                ):
+                    del self._entries[p]
+
+    def clear(self):
+        with self._lock:
+            self._entries = {}
+
+
+class _ShellSession:
+    """
+    A long-lived shell process which runs commands one by one, so that the
+    caller process, e.g. a trainer holding a lot of memory, is forked only
+    once instead of for every command.
+
+    The shell is re-created in forked child processes and after it exits.
+    """
+
+    _END_MARK = '__PADDLE_FS_CMD_END__'
+
+    def __init__(self):
+        self._proc = None
+        self._pid = None
+        self._lock = threading.Lock()
+        self._end_re = re.compile(r'^(.*)%s (-?[0-9]+)$' % self._END_MARK)
+
+    def _start(self):
+        self._proc = subprocess.Popen(
+            ['/bin/bash'],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            encoding='utf-8',
+            errors='replace',
+        )
+        self._pid = os.getpid()
+
+    def run(self, cmd, redirect_stderr=False):
+        """
+        Run `cmd` in the shell.
+
+        Returns:
+            Tuple: the return code and the output of `cmd`.
+        """
+        with self._lock:
+            if self._pid != os.getpid():
+                # the shell belongs to the parent process
+                self._proc = None
+            if self._proc is not None and self._proc.poll() is not None:
+                self.close()
+            if self._proc is None:
+                self._start()
+
+            redirect = ' 2>&1' if redirect_stderr else ''
+            # NOTE: the end mark follows the output directly, so that output
+            # without trailing newline is not changed
+            self._proc.stdin.write(
+                "{ %s\n} < /dev/null%s; printf '%s %%d\\n' $?\n"
+                % (cmd, redirect, self._END_MARK)
+            )
+            self._proc.stdin.flush()
+
+            lines = []
+            while True:
+                line = self._proc.stdout.readline()
+                if not line:
+                    # the shell exits unexpectedly
+                    self.close()
+                    return -1, '\n'.join(lines)
+                m = self._end_re.match(line.rstrip('\n'))
+                if m is None:
+                    lines.append(line.rstrip('\n'))
+                    continue
+                if m.group(1):
+                    lines.append(m.group(1))
+                return int(m.group(2)), '\n'.join(lines)
+
+    def close(self):
+        proc, self._proc = self._proc, None
+        if proc is None or self._pid != os.getpid():
+            return
+        try:
+            proc.stdin.close()
+            proc.wait(timeout=5)
+        except Exception:
+            proc.kill()
+            proc.wait()
+        proc.stdout.close()
+
+    def __del__(self):
+        self.close()
+
+
 def _handle_errors(max_time_out=None):
     def decorator(f):
         @functools.wraps(f)
@@ -429,6 +605,17 @@ class HDFSClient(FS):
         hadoop_home(str): Hadoop home.
         configs(dict): Hadoop config. It is a dictionary and needs to contain the
             keys: "fs.default.name" and "hadoop.job.ugi".
+        time_out(int): Timeout of retrying a failed operation in milliseconds.
+            Default is 5 minutes.
+        sleep_inter(int): Interval between retries in milliseconds. Default is 1000.
+        stat_cache_ttl(int): Time to live of the cached metadata of paths in
+            milliseconds, e.g. whether a path exists or is a directory. The cache
+            is invalidated by the operations of this client which modify the
+            paths, changes made by others are seen after at most `stat_cache_ttl`
+            milliseconds. Default is 0, which disables the cache.
+        long_lived(bool): Whether to run hadoop commands in a long-lived shell
+            process instead of forking the current process for every command.
+            Default is False.
 
     Examples:
 
@@ -451,8 +638,10 @@ class HDFSClient(FS):
         hadoop_home,
         configs,
         time_out=5 * 60 * 1000,  # ms
-        sleep_inter=1000,
-    ):  # ms
+        sleep_inter=1000,  # ms
+        stat_cache_ttl=0,  # ms
+        long_lived=False,
+    ):
         self.pre_commands = []
         hadoop_bin = '%s/bin/hadoop' % hadoop_home
         self.pre_commands.append(hadoop_bin)
@@ -470,6 +659,8 @@ class HDFSClient(FS):
         self._bd_err_re = re.compile(
             r'\s?responseErrorMsg\s?\:.*, errorCode\:\s?[0-9]+, path\:'
         )
+        self._stat_cache = _FSStatCache(stat_cache_ttl)
+        self._session = _ShellSession() if long_lived else None
 
     def _run_cmd(self, cmd, redirect_stderr=False, retry_times=5):
         exe_cmd = f"{self._base_cmd} -{cmd}"
@@ -477,9 +668,14 @@ class HDFSClient(FS):
         output = None
         retry_sleep_second = 3
         for x in range(retry_times + 1):
-            ret, output = core.shell_execute_cmd(exe_cmd, 0, 0, redirect_stderr)
+            if self._session is not None:
+                ret, output = self._session.run(exe_cmd, redirect_stderr)
+            else:
+                ret, output = core.shell_execute_cmd(
+                    exe_cmd, 0, 0, redirect_stderr
+                )
             ret = int(ret)
-            if ret == 0:
+            if ret == 0 or x == retry_times:
                 break
             time.sleep(retry_sleep_second)
         if ret == 134:
@@ -570,9 +766,240 @@ class HDFSClient(FS):
                 dirs.append(p)
             else:
                 files.append(p)
+            self._stat_cache.set(
+                os.path.join(fs_path, p), exist=True, dir=arr[0][0] == 'd'
+            )
 
         return dirs, files
 
+    def _get_stats(self, fs_paths):
+        """
+        Returns a list of (exist, is_dir) of `fs_paths`, the paths which are
+        not cached are listed by batched `ls -d` commands.
+        """
+        stats = {}
+        uncached = []
+        for fs_path in fs_paths:
+            exist = self._stat_cache.get(fs_path, 'exist')
+            is_dir = self._stat_cache.get(fs_path, 'dir')
+            if exist is False:
+                stats[fs_path] = (False, False)
+            elif exist and is_dir is not None:
+                stats[fs_path] = (True, is_dir)
+            elif fs_path not in uncached:
+                uncached.append(fs_path)
+
+        for paths in _split_paths(uncached):
+            stats.update(self._ls_stats(paths))
+        return [stats[fs_path] for fs_path in fs_paths]
+
+    @_handle_errors()
+    def _ls_stats(self, fs_paths):
+        cmd = "ls -d {}".format(" ".join(fs_paths))
+        # NOTE: the return code is not 0 if any path does not exist, which is
+        # not retried, other errors are retried by _handle_errors
+        ret, lines = self._run_cmd(cmd, redirect_stderr=True, retry_times=0)
+        if ret != 0 and self._test_match(lines):
+            raise ExecuteError(cmd)
+
+        listed = {}
+        missing = set()
+        for line in lines:
+            m = _NOT_FOUND_RE.search(line)
+            if m is not None:
+                missing.add(_strip_fs_scheme(m.group(1)))
+                continue
+            arr = line.split()
+            if len(arr) != 8:
+                continue
+            listed[_strip_fs_scheme(arr[7])] = arr[0][0] == 'd'
+
+        stats = {}
+        for fs_path in fs_paths:
+            key = _strip_fs_scheme(fs_path)
+            if key in listed:
+                stats[fs_path] = (True, listed[key])
+            elif key in missing:
+                stats[fs_path] = (False, False)
+            else:
+                # e.g. connection errors, only the paths reported as missing
+                # are known not to exist
+                raise ExecuteError(cmd)
+        for fs_path, (exist, is_dir) in stats.items():
+            self._stat_cache.set(fs_path, exist=exist, dir=is_dir)
+        return stats
+
+    def batch_is_exist(self, fs_paths):
+        """
+        Whether the remote HDFS paths exist, paths are tested by one hadoop
+        command instead of one command for each path.
+
+        Args:
+            fs_paths(list): The HDFS file paths.
+
+        Returns:
+            List: A list of bool, whether each path exists.
+
+        Examples:
+
+            .. code-block:: text
+
+                from paddle.distributed.fleet.utils import HDFSClient
+
+                hadoop_home = "/home/client/hadoop-client/hadoop/"
+                configs = {
+                    "fs.default.name": "hdfs://xxx.hadoop.com:54310",
+                    "hadoop.job.ugi": "hello,hello123"
+                }
+
+                client = HDFSClient(hadoop_home, configs)
+                ret = client.batch_is_exist(["hdfs:/test_a", "hdfs:/test_b"])
+        """
+        return [exist for exist, _ in self._get_stats(fs_paths)]
+
+    def batch_is_dir(self, fs_paths):
+        """
+        Whether the remote HDFS paths are directories, paths are tested by one
+        hadoop command instead of one command for each path.
+
+        Args:
+            fs_paths(list): The HDFS file paths.
+
+        Returns:
+            List: A list of bool, whether each path exists and is a directory.
+
+        Examples:
+
+            .. code-block:: text
+
+                from paddle.distributed.fleet.utils import HDFSClient
+
+                hadoop_home = "/home/client/hadoop-client/hadoop/"
+                configs = {
+                    "fs.default.name": "hdfs://xxx.hadoop.com:54310",
+                    "hadoop.job.ugi": "hello,hello123"
+                }
+
+                client = HDFSClient(hadoop_home, configs)
+                ret = client.batch_is_dir(["hdfs:/test_a", "hdfs:/test_b"])
+        """
+        return [is_dir for _, is_dir in self._get_stats(fs_paths)]
+
+    def batch_ls_dir(self, fs_paths):
+        """
+        List directorys and files under each of `fs_paths`, directories are
+        listed by one hadoop command instead of one command for each path.
+
+        Args:
+            fs_paths(list): The HDFS file paths.
+
+        Returns:
+            List: A list of 2-tuples, the same as `ls_dir` of each path.
+
+        Examples:
+
+            .. code-block:: text
+
+                from paddle.distributed.fleet.utils import HDFSClient
+
+                hadoop_home = "/home/client/hadoop-client/hadoop/"
+                configs = {
+                    "fs.default.name": "hdfs://xxx.hadoop.com:54310",
+                    "hadoop.job.ugi": "hello,hello123"
+                }
+
+                client = HDFSClient(hadoop_home, configs)
+                for subdirs, files in client.batch_ls_dir(["hdfs:/a", "hdfs:/b"]):
+                    print(subdirs, files)
+        """
+        results = {}
+        to_list = []
+        for fs_path, (exist, is_dir) in zip(
+            fs_paths, self._get_stats(fs_paths)
+        ):
+            if not exist:
+                results[fs_path] = ([], [])
+            elif not is_dir:
+                results[fs_path] = ([], [os.path.basename(fs_path)])
+            elif fs_path not in to_list:
+                to_list.append(fs_path)
+
+        for paths in _split_paths(to_list):
+            results.update(self._batch_ls_dir(paths))
+        return [results[fs_path] for fs_path in fs_paths]
+
+    @_handle_errors()
+    def _batch_ls_dir(self, fs_paths):
+        cmd = "ls {}".format(" ".join(fs_paths))
+        ret, lines = self._run_cmd(cmd)
+        if ret != 0:
+            for fs_path in fs_paths:
+                self._stat_cache.invalidate(fs_path)
+            raise ExecuteError(cmd)
+
+        results = {}
+        parents = {}
+        for fs_path in fs_paths:
+            results[fs_path] = ([], [])
+            parents[_strip_fs_scheme(fs_path)] = fs_path
+        for line in lines:
+            arr = line.split()
+            if len(arr) != 8:
+                continue
+            parent = parents.get(_strip_fs_scheme(os.path.dirname(arr[7])))
+            if parent is None:
+                continue
+
+            p = os.path.basename(arr[7])
+            is_dir = arr[0][0] == 'd'
+            results[parent][0 if is_dir else 1].append(p)
+            self._stat_cache.set(
+                os.path.join(parent, p), exist=True, dir=is_dir
+            )
+        return results
+
+    def batch_mkdirs(self, fs_paths):
+        """
+        Create remote HDFS directories, the directories which do not exist are
+        created by one hadoop command instead of one command for each path.
+
+        Args:
+            fs_paths(list): The HDFS directory paths.
+
+        Examples:
+
+            .. code-block:: text
+
+                from paddle.distributed.fleet.utils import HDFSClient
+
+                hadoop_home = "/home/client/hadoop-client/hadoop/"
+                configs = {
+                    "fs.default.name": "hdfs://xxx.hadoop.com:54310",
+                    "hadoop.job.ugi": "hello,hello123"
+                }
+
+                client = HDFSClient(hadoop_home, configs)
+                client.batch_mkdirs(["hdfs:/test_a", "hdfs:/test_b"])
+        """
+        to_create = []
+        for fs_path, (exist, _) in zip(fs_paths, self._get_stats(fs_paths)):
+            if not exist and fs_path not in to_create:
+                to_create.append(fs_path)
+
+        for paths in _split_paths(to_create):
+            self._mkdirs_p(paths)
+
+    @_handle_errors()
+    def _mkdirs_p(self, fs_paths):
+        cmd = "mkdir -p {}".format(" ".join(fs_paths))
+        try:
+            ret, _ = self._run_cmd(cmd)
+            if ret != 0:
+                raise ExecuteError(cmd)
+        finally:
+            for fs_path in fs_paths:
+                self._stat_cache.invalidate(fs_path)
+
     def _test_match(self, lines):
         for l in lines:
             m = self._bd_err_re.match(l)
@@ -607,6 +1034,9 @@ class HDFSClient(FS):
                 client = HDFSClient(hadoop_home, configs)
                 ret = client.is_file("hdfs:/test_hdfs_client")
         """
+        if self._stat_cache.enabled:
+            return self._get_stats([fs_path])[0][1]
+
         if not self.is_exist(fs_path):
             return False
 
@@ -651,6 +1081,10 @@ class HDFSClient(FS):
                 client = HDFSClient(hadoop_home, configs)
                 ret = client.is_file("hdfs:/test_hdfs_client")
         """
+        if self._stat_cache.enabled:
+            exist, is_dir = self._get_stats([fs_path])[0]
+            return exist and not is_dir
+
         if not self.is_exist(fs_path):
             return False
 
@@ -683,6 +1117,9 @@ class HDFSClient(FS):
                 client = HDFSClient(hadoop_home, configs)
                 ret = client.is_exist("hdfs:/test_hdfs_client")
         """
+        if self._stat_cache.enabled:
+            return self._get_stats([fs_path])[0][0]
+
         cmd = f"test -e {fs_path} "
         ret, out = self._run_cmd(cmd, redirect_stderr=True, retry_times=1)
         if ret != 0:
@@ -786,6 +1223,7 @@ class HDFSClient(FS):
         # complete the processes
         for proc in procs:
             proc.join()
+        self._stat_cache.invalidate(fs_path)
 
     @_handle_errors()
     def _try_upload(self, local_path, fs_path):
@@ -798,6 +1236,8 @@ class HDFSClient(FS):
         except Exception as e:
             self.delete(fs_path)
             raise e
+        finally:
+            self._stat_cache.invalidate(fs_path)
 
     # can't retry
     def download(self, fs_path, local_path, multi_processes=5, overwrite=False):
@@ -901,6 +1341,7 @@ class HDFSClient(FS):
 
         cmd = f"mkdir {fs_path} "
         ret, out = self._run_cmd(cmd, redirect_stderr=True)
+        self._stat_cache.invalidate(fs_path)
         if ret != 0:
             for l in out:
                 if "No such file or directory" in l:
@@ -910,10 +1351,7 @@ class HDFSClient(FS):
                 raise ExecuteError(cmd)
 
         if out_hdfs and not self.is_exist(fs_path):
-            cmd = f"mkdir -p {fs_path}"
-            ret, _ = self._run_cmd(cmd)
-            if ret != 0:
-                raise ExecuteError(cmd)
+            self._mkdirs_p([fs_path])
 
     def mv(self, fs_src_path, fs_dst_path, overwrite=False, test_exists=True):
         """
@@ -958,6 +1396,8 @@ class HDFSClient(FS):
         ret = 0
         try:
             ret, _ = self._run_cmd(cmd, retry_times=1)
+            self._stat_cache.invalidate(fs_src_path)
+            self._stat_cache.invalidate(fs_dst_path)
             if ret != 0:
                 raise ExecuteError(cmd)
         except Exception as e:
@@ -968,12 +1408,14 @@ class HDFSClient(FS):
     def _rmr(self, fs_path):
         cmd = f"rmr {fs_path}"
         ret, _ = self._run_cmd(cmd)
+        self._stat_cache.invalidate(fs_path)
         if ret != 0:
             raise ExecuteError(cmd)
 
     def _rm(self, fs_path):
         cmd = f"rm {fs_path}"
         ret, _ = self._run_cmd(cmd)
+        self._stat_cache.invalidate(fs_path)
         if ret != 0:
             raise ExecuteError(cmd)
 
@@ -1044,6 +1486,7 @@ class HDFSClient(FS):
     def _touchz(self, fs_path):
         cmd = f"touchz {fs_path}"
         ret, _ = self._run_cmd(cmd)
+        self._stat_cache.invalidate(fs_path)
         if ret != 0:
             raise ExecuteError(cmd)
 
@@ -1153,6 +1596,15 @@ class AFSClient(FS):
     """
     A tool of AFS. Use AfsWrapper.
 
+    Args:
+        time_out(int): Timeout in milliseconds. Default is 5 minutes.
+        sleep_inter(int): Interval between retries in milliseconds. Default is 1000.
+        stat_cache_ttl(int): Time to live of the cached metadata of paths in
+            milliseconds, e.g. whether a path exists or is a directory. The cache
+            is invalidated by the operations of this client which modify the
+            paths, changes made by others are seen after at most `stat_cache_ttl`
+            milliseconds. Default is 0, which disables the cache.
+
     Examples:
 
         .. code-block:: text
@@ -1163,9 +1615,15 @@ class AFSClient(FS):
             client.ls_dir("hdfs:/test_hdfs_client")
     """
 
-    def __init__(self, time_out=5 * 60 * 1000, sleep_inter=1000):  # ms  # ms
+    def __init__(
+        self,
+        time_out=5 * 60 * 1000,  # ms
+        sleep_inter=1000,  # ms
+        stat_cache_ttl=0,  # ms
+    ):
         self._fs = core.AfsWrapper()
         self._time_out = time_out
+        self._stat_cache = _FSStatCache(stat_cache_ttl)
 
     def init(self, fs_name, fs_user, fs_passwd, fs_conf):
         self._fs.init(fs_name, fs_user, fs_passwd, fs_conf)
@@ -1254,11 +1712,11 @@ class AFSClient(FS):
         return self._is_dir(fs_path)
 
     def _is_dir(self, fs_path):
-        list_path = self._fs.list(fs_path)
-        if (len(list_path)) > 0:
-            return True
-        else:
-            return False
+        is_dir = self._stat_cache.get(fs_path, 'dir')
+        if is_dir is None:
+            is_dir = len(self._fs.list(fs_path)) > 0
+            self._stat_cache.set(fs_path, dir=is_dir)
+        return is_dir
 
     def is_file(self, fs_path):
         """
@@ -1306,7 +1764,59 @@ class AFSClient(FS):
                 client.init("hdfs://xxx.hadoop.com:54310", "hello", "hello123", "./fs_conf")
                 ret = client.is_exist("hdfs:/test_hdfs_client")
         """
-        return self._fs.exist(fs_path)
+        exist = self._stat_cache.get(fs_path, 'exist')
+        if exist is None:
+            exist = self._fs.exist(fs_path)
+            self._stat_cache.set(fs_path, exist=exist)
+        return exist
+
+    def batch_is_exist(self, fs_paths):
+        """
+        Whether the remote AFS paths exist, results are cached if
+        `stat_cache_ttl` is set.
+
+        Args:
+            fs_paths(list): The AFS file paths.
+
+        Returns:
+            List: A list of bool, whether each path exists.
+        """
+        return [self.is_exist(fs_path) for fs_path in fs_paths]
+
+    def batch_is_dir(self, fs_paths):
+        """
+        Whether the remote AFS paths are directories, results are cached if
+        `stat_cache_ttl` is set.
+
+        Args:
+            fs_paths(list): The AFS file paths.
+
+        Returns:
+            List: A list of bool, whether each path exists and is a directory.
+        """
+        return [self.is_dir(fs_path) for fs_path in fs_paths]
+
+    def batch_ls_dir(self, fs_paths):
+        """
+        List directorys and files under each of `fs_paths`.
+
+        Args:
+            fs_paths(list): The AFS file paths.
+
+        Returns:
+            List: A list of 2-tuples, the same as `ls_dir` of each path.
+        """
+        return [self.ls_dir(fs_path) for fs_path in fs_paths]
+
+    def batch_mkdirs(self, fs_paths):
+        """
+        Create remote AFS directories.
+
+        Args:
+            fs_paths(list): The AFS directory paths.
+        """
+        for fs_path in fs_paths:
+            self.mkdirs(fs_path)
 
     def upload_dir(self, local_dir, dest_dir, overwrite=False):
         """
@@ -1326,6 +1836,7 @@ class AFSClient(FS):
         if not self.is_exist(dest_dir):
             self.mkdirs(dest_dir)
         self._fs.upload(local_dir, dest_dir)
+        self._stat_cache.invalidate(dest_dir)
 
     # can't retry
     def upload(self, local_path, fs_path, multi_processes=1, overwrite=False):
@@ -1354,6 +1865,7 @@ class AFSClient(FS):
             raise FSFileNotExistsError(f"{local_path} not exists")
 
         self._fs.upload(local_path, fs_path)
+        self._stat_cache.invalidate(fs_path)
 
     def download(self, fs_path, local_path, multi_processes=1, overwrite=False):
         """
@@ -1427,6 +1939,7 @@ class AFSClient(FS):
         if self.is_exist(fs_path):
             return
         self._fs.mkdir(fs_path)
+        self._stat_cache.invalidate(fs_path)
 
     def mv(self, fs_src_path, fs_dst_path, overwrite=False, test_exists=True):
         """
@@ -1459,6 +1972,8 @@ class AFSClient(FS):
                 raise FSFileExistsError(f"{fs_dst_path} exists already")
 
         self._fs.mv(fs_src_path, fs_dst_path)
+        self._stat_cache.invalidate(fs_src_path)
+        self._stat_cache.invalidate(fs_dst_path)
 
     def delete(self, fs_path):
         """
@@ -1482,6 +1997,7 @@ class AFSClient(FS):
         if not self.is_exist(fs_path):
             return
         self._fs.remove(fs_path)
+        self._stat_cache.invalidate(fs_path)
 
     def touch(self, fs_path, exist_ok=True):
         """
@@ -1507,7 +2023,9 @@ class AFSClient(FS):
                 return
             raise FSFileExistsError
 
-        return self._fs.touchz(fs_path)
+        ret = self._fs.touchz(fs_path)
+        self._stat_cache.invalidate(fs_path)
+        return ret
 
     def need_upload_download(self):
         return True
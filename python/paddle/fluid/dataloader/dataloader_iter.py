@@ -54,6 +54,12 @@ from .worker import (
     _ResumeIteration,
 )
 from .flat import _flatten_batch, _restore_batch
+from .shm_ring import (
+    _use_shm_ring,
+    _create_slab_status,
+    _SlabBatch,
+    _SharedMemorySlabReader,
+)
 from paddle.profiler.timer import benchmark
 
 __all__ = ['get_worker_info']
@@ -374,6 +380,20 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
         self._persistent_workers = loader._persistent_workers
         self._resume_worker_cnt = 0
 
+        # NOTE: [ warm prefetch ] in persistent workers mode, once indices
+        # of current epoch are drained, indices of the next epoch are sent
+        # to workers while current epoch is still consumed. _epoch_end_idx
+        # records the _send_idx where next epoch starts, batches after it
+        # are not counted in _batches_outstanding and will be kept in
+        # _task_infos until next _reset
+        self._warm_prefetch = (
+            self._persistent_workers
+            and self._dataset_kind == _DatasetKind.MAP
+            and not hasattr(self._batch_sampler, 'set_epoch')
+        )
+        self._epoch_end_idx = None
+        self._warm_batches = 0
+
         assert (
             self._num_workers > 0
         ), "Multi-process DataLoader " "invalid num_workers({})".format(
@@ -430,6 +450,21 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
             (self._worker_shm_buffer_size) * 2 * self._num_workers
         )
 
+        # NOTE: see [ shared memory slab ring ] in worker.py, each worker
+        # owns enough slabs to hold its share of outstanding batches, one
+        # more slab for batches cached out of order in _task_infos
+        self._slab_status = None
+        self._slab_reader = None
+        self._slabs_per_worker = 0
+        if self._use_shared_memory and _use_shm_ring():
+            self._slabs_per_worker = (
+                self._outstanding_capacity + self._num_workers - 1
+            ) // self._num_workers + 1
+            self._slab_status = _create_slab_status(
+                self._num_workers, self._slabs_per_worker
+            )
+            self._slab_reader = _SharedMemorySlabReader(self._slab_status)
+
         # init workers and indices queues and put 2 indices in each indices queue
         self._init_workers()
         for _ in range(self._outstanding_capacity):
@@ -475,6 +510,8 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
                     self._use_shared_memory,
                     self._base_seed,
                     self._worker_shm_buffer_size,
+                    self._slab_status,
+                    self._slabs_per_worker,
                 ),
             )
             worker.daemon = True
@@ -556,22 +593,47 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
                 else:
                     data = self._reader.read_next()
 
-        # 3. reset all states
-        self._send_idx = 0
-        self._rcvd_idx = 0
-        self._batches_outstanding = 0
-        self._task_infos = {}
-        self._structure_infos = []
-
-        # set all worker status available
-        self._worker_status = [True] * self._num_workers
-
-        # 4. reset _sampler_iter and put prefetch indices to start next epoch
-        # init workers and indices queues and put 2 indices in each indices queue
-        self._sampler_iter = iter(self._index_sampler)
-        for _ in range(self._outstanding_capacity):
+        # 3. reset all states, batches prefetched for this epoch are kept
+        # and renumbered from 0, see [ warm prefetch ]
+        with self._thread_lock:
+            warm_task_infos = {}
+            if self._epoch_end_idx is not None:
+                epoch_end_idx = self._epoch_end_idx
+                for idx in list(self._task_infos.keys()):
+                    if idx >= epoch_end_idx:
+                        info = self._task_infos.pop(idx)
+                        warm_task_infos[idx - epoch_end_idx] = info
+                self._send_idx -= epoch_end_idx
+            else:
+                self._send_idx = 0
+            self._release_task_infos()
+            self._rcvd_idx = 0
+            self._batches_outstanding = self._warm_batches
+            self._task_infos = warm_task_infos
+            self._structure_infos = []
+
+            # set all worker status available
+            self._worker_status = [True] * self._num_workers
+
+            # 4. reset _sampler_iter and put prefetch indices to start next
+            # epoch, _sampler_iter has been reset for next epoch already if
+            # it was drained in warm prefetch mode
+            if self._epoch_end_idx is None:
+                self._sampler_iter = iter(self._index_sampler)
+            self._epoch_end_idx = None
+            self._warm_batches = 0
+        for _ in range(self._outstanding_capacity - self._batches_outstanding):
             self._try_put_indices()
 
+    def _release_task_infos(self):
+        # batches cached out of order will be discarded, give their
+        # slabs back to workers
+        if self._slab_reader is None:
+            return
+        for info in self._task_infos.values():
+            if len(info) == 3 and isinstance(info[1], _SlabBatch):
+                self._slab_reader.release(info[1])
+
     def _shutdown_worker(self, worker_id, shutdown=False):
         if self._worker_status[worker_id] or (
             self._persistent_workers and shutdown
@@ -600,6 +662,8 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
                         q.close()
             finally:
                 core._erase_process_pids(id(self))
+                if self._slab_reader is not None:
+                    self._slab_reader.close()
                 self._shutdown = True
 
     def _thread_loop(self, legacy_expected_place):
@@ -624,7 +688,10 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
                     try:
                         # pack as LoDTensorArray
                         array = core.LoDTensorArray()
-                        if self._use_shared_memory:
+                        if isinstance(batch, _SlabBatch):
+                            for tensor in self._slab_reader.read(batch):
+                                array.append(tensor)
+                        elif self._use_shared_memory:
                             for tensor in batch:
                                 array.append(tensor)
                         else:
@@ -684,8 +751,16 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
                         if self._batches_outstanding < len(self._places):
                             return None
 
+            # batches of next epoch prefetched in warm prefetch mode
+            # should only be output after next _reset
+            epoch_drained = (
+                self._epoch_end_idx is not None
+                and self._rcvd_idx >= self._epoch_end_idx
+            )
+
             if (
-                self._rcvd_idx in self._task_infos
+                not epoch_drained
+                and self._rcvd_idx in self._task_infos
                 and len(self._task_infos[self._rcvd_idx]) == 3
             ):
                 info = self._task_infos.pop(self._rcvd_idx)
@@ -762,7 +837,7 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
                     self._exit_thread_unexpectedly()
                     batch.reraise()
 
-                if idx == self._rcvd_idx:
+                if idx == self._rcvd_idx and not epoch_drained:
                     del self._task_infos[idx]
                     self._structure_infos.append(structure)
                     return batch
@@ -784,10 +859,27 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
         # function which is not in data reading pipeline, this lock almost no
         # influence on performance
         with self._thread_lock:
-            try:
-                indices = next(self._sampler_iter)
-            except StopIteration:
-                return
+            if self._epoch_end_idx is not None:
+                # see [ warm prefetch ], only prefetch the first
+                # _prefetch_factor batches of next epoch
+                if self._warm_batches >= self._prefetch_factor:
+                    return
+                try:
+                    indices = next(self._sampler_iter)
+                except StopIteration:
+                    return
+            else:
+                try:
+                    indices = next(self._sampler_iter)
+                except StopIteration:
+                    if not self._warm_prefetch:
+                        return
+                    self._epoch_end_idx = self._send_idx
+                    self._sampler_iter = iter(self._index_sampler)
+                    try:
+                        indices = next(self._sampler_iter)
+                    except StopIteration:
+                        return
 
             for i in range(self._num_workers):
                 worker_idx = next(self._workers_idx_cycle)
@@ -798,7 +890,10 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
 
             self._indices_queues[worker_idx].put((self._send_idx, indices))
             self._task_infos[self._send_idx] = (worker_idx,)
-            self._batches_outstanding += 1
+            if self._epoch_end_idx is None:
+                self._batches_outstanding += 1
+            else:
+                self._warm_batches += 1
             self._send_idx += 1
 
     def __del__(self):
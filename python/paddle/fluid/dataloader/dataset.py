@@ -40,6 +40,16 @@ class Dataset:
     :code:`__len__`: return dataset sample number. This method is required
     by some implements of :code:`paddle.io.BatchSampler`
 
+    Subclasses can optionally implement :code:`__getitems__`, which gets
+    a batch of samples with a given list of indices and returns the batch
+    collated in the same format as :code:`paddle.io.DataLoader` default
+    collate function does, e.g. stacked numpy arrays or tensors for each
+    field. If it is implemented, :code:`paddle.io.DataLoader` with default
+    :attr:`collate_fn` reads each batch with one :code:`__getitems__`
+    calling instead of calling :code:`__getitem__` for each index, which
+    is much faster for datasets which can gather samples in a vectorized
+    way, e.g. datasets backed by numpy arrays or memory mapped files.
+
     see :code:`paddle.io.DataLoader`.
 
     Examples:
@@ -289,6 +299,10 @@ class TensorDataset(Dataset):
     def __getitem__(self, index):
         return tuple(tensor[index] for tensor in self.tensors)
 
+    def __getitems__(self, indices):
+        index = paddle.to_tensor(indices, dtype='int64')
+        return [paddle.gather(tensor, index) for tensor in self.tensors]
+
     def __len__(self):
         return self.tensors[0].shape[0]
 
@@ -370,6 +384,22 @@ class ComposeDataset(Dataset):
             sample.extend(to_list(dataset[idx]))
         return tuple(sample)
 
+    @property
+    def __getitems__(self):
+        # only available when all composed datasets support batched getting
+        if not all(
+            getattr(dataset, '__getitems__', None) is not None
+            for dataset in self.datasets
+        ):
+            return None
+        return self._getitems
+
+    def _getitems(self, indices):
+        batch = []
+        for dataset in self.datasets:
+            batch.extend(to_list(dataset.__getitems__(indices)))
+        return batch
+
 
 class ChainDataset(IterableDataset):
     """
@@ -460,6 +490,16 @@ class Subset(Dataset):
     def __getitem__(self, idx):
         return self.dataset[self.indices[idx]]
 
+    @property
+    def __getitems__(self):
+        # only available when the whole dataset supports batched getting
+        if getattr(self.dataset, '__getitems__', None) is None:
+            return None
+        return self._getitems
+
+    def _getitems(self, indices):
+        return self.dataset.__getitems__([self.indices[i] for i in indices])
+
     def __len__(self):
         return len(self.indices)
 
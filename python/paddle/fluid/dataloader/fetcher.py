@@ -14,6 +14,7 @@
 
 import logging
 from ..log_helper import get_logger
+from .collate import default_collate_fn
 from collections.abc import Sequence, Mapping
 
 _WARNING_TO_LOG = True
@@ -119,8 +120,24 @@ class _MapDatasetFetcher(_DatasetFetcher):
     def __init__(self, dataset, auto_collate_batch, collate_fn, drop_last):
         super().__init__(dataset, auto_collate_batch, collate_fn, drop_last)
 
+    def _use_getitems(self):
+        return (
+            self.collate_fn in (None, default_collate_fn)
+            and getattr(self.dataset, '__getitems__', None) is not None
+        )
+
     def fetch(self, batch_indices, done_event=None):
         if self.auto_collate_batch:
+            # NOTE: datasets implement the optional `__getitems__` return
+            #       the batch already collated as `default_collate_fn`
+            #       does, user defined collate_fn still needs a list of
+            #       samples, so the batched path is only taken with the
+            #       default collate_fn
+            if self._use_getitems():
+                if done_event is not None and done_event.is_set():
+                    return None
+                return self.dataset.__getitems__(list(batch_indices))
+
             data = []
             for idx in batch_indices:
                 if done_event is None or not done_event.is_set():
@@ -0,0 +1,276 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import multiprocessing
+import os
+
+import numpy as np
+
+import paddle
+
+from .. import core
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:
+    # NOTE: shared_memory is only available since python 3.8
+    shared_memory = None
+
+# NOTE: every slot in a slab starts at a multiple of _SLAB_ALIGNMENT bytes,
+# which keeps numpy views over the slab aligned for vectorized copies
+_SLAB_ALIGNMENT = 64
+
+# slab status flags, a slab is written by its owner worker only when it is
+# _SLAB_FREE, and released by the main process after the batch is consumed
+_SLAB_FREE = 0
+_SLAB_BUSY = 1
+
+
+def _use_shm_ring():
+    if shared_memory is None:
+        return False
+    return os.environ.get('FLAGS_dataloader_use_shm_ring', False) in [
+        1,
+        '1',
+        True,
+        'True',
+        'true',
+    ]
+
+
+def _align(nbytes):
+    return (nbytes + _SLAB_ALIGNMENT - 1) // _SLAB_ALIGNMENT * _SLAB_ALIGNMENT
+
+
+def _create_slab_status(num_workers, slabs_per_worker):
+    # NOTE: start the resource tracker before workers are started, so that
+    # workers share it with the main process, slabs registered by workers
+    # are unregistered when they are unlinked, and leaked slabs of killed
+    # workers are unlinked by the tracker at exit
+    try:
+        from multiprocessing import resource_tracker
+
+        resource_tracker.ensure_running()
+    except Exception:
+        pass
+    # lock-free status flags shared by main process and workers, each flag
+    # only has one writer at a time: the owner worker sets it busy before
+    # putting a batch into the result queue, and the main process sets it
+    # free after copying the batch out
+    return multiprocessing.RawArray('b', num_workers * slabs_per_worker)
+
+
+class _SlabBatch:
+    """
+    Lightweight descriptor sent through the workers' result queue in place
+    of the batch data, the data itself stays in the shared memory slab
+    :attr:`name` and is described by :attr:`metas` as a list of
+    (offset, shape, dtype) tuples for each flattened slot.
+    """
+
+    __slots__ = ['slab_id', 'name', 'metas']
+
+    def __init__(self, slab_id, name, metas):
+        self.slab_id = slab_id
+        self.name = name
+        self.metas = metas
+
+    def __getstate__(self):
+        return (self.slab_id, self.name, self.metas)
+
+    def __setstate__(self, state):
+        self.slab_id, self.name, self.metas = state
+
+
+class _SharedMemorySlabRing:
+    """
+    Worker side ring of pre-allocated shared memory slabs. Each slab holds
+    one flattened batch, slots of the batch are copied into the slab with a
+    single memcpy and only a small :code:`_SlabBatch` descriptor is pickled
+    through the result queue.
+
+    Slabs are allocated lazily and grown on demand, a slab which is too small
+    for the incoming batch is unlinked and re-created with a new name.
+
+    Args:
+        worker_id(int): id of the worker which owns this ring.
+        slabs_per_worker(int): slab number in this ring.
+        status(multiprocessing.RawArray): slab status flags of all workers.
+    """
+
+    def __init__(self, worker_id, slabs_per_worker, status):
+        self._worker_id = worker_id
+        self._slabs_per_worker = slabs_per_worker
+        self._status = status
+        self._slabs = [None] * slabs_per_worker
+
+    def _slab_id(self, local_id):
+        return self._worker_id * self._slabs_per_worker + local_id
+
+    def _acquire(self, nbytes):
+        # prefer a free slab which is already large enough, otherwise
+        # grow the first free slab found
+        candidate = None
+        for local_id, slab in enumerate(self._slabs):
+            if self._status[self._slab_id(local_id)] != _SLAB_FREE:
+                continue
+            if slab is not None and slab.size >= nbytes:
+                return local_id
+            if candidate is None:
+                candidate = local_id
+        if candidate is None:
+            return None
+
+        old_slab = self._slabs[candidate]
+        if old_slab is not None:
+            old_slab.close()
+            old_slab.unlink()
+        # over allocate a little to avoid re-creating slab on every
+        # slightly larger batch, e.g. the last batch of an epoch
+        self._slabs[candidate] = shared_memory.SharedMemory(
+            create=True, size=_align(nbytes + nbytes // 8)
+        )
+        return candidate
+
+    def write(self, flat_batch):
+        """
+        Copy flattened batch slots into a free slab.
+
+        Returns:
+            _SlabBatch: the descriptor of written slab, or None if the
+                batch cannot be written into slab (no free slab or slot
+                cannot be represented as plain numpy array), caller
+                should fall back to the default transport.
+        """
+        arrays = []
+        nbytes = 0
+        for slot in flat_batch:
+            if isinstance(slot, (paddle.Tensor, core.eager.Tensor)):
+                slot = slot.numpy()
+            if not isinstance(slot, np.ndarray) or slot.dtype.hasobject:
+                return None
+            arrays.append(slot)
+            nbytes += _align(slot.nbytes)
+
+        local_id = self._acquire(max(nbytes, _SLAB_ALIGNMENT))
+        if local_id is None:
+            return None
+
+        slab = self._slabs[local_id]
+        metas = []
+        offset = 0
+        for arr in arrays:
+            view = np.ndarray(
+                arr.shape, dtype=arr.dtype, buffer=slab.buf, offset=offset
+            )
+            view[...] = arr
+            del view
+            metas.append((offset, arr.shape, arr.dtype.str))
+            offset += _align(arr.nbytes)
+
+        slab_id = self._slab_id(local_id)
+        self._status[slab_id] = _SLAB_BUSY
+        return _SlabBatch(slab_id, slab.name, metas)
+
+    def close(self):
+        for slab in self._slabs:
+            if slab is not None:
+                slab.close()
+                try:
+                    slab.unlink()
+                except FileNotFoundError:
+                    pass
+        self._slabs = [None] * self._slabs_per_worker
+
+
+class _SharedMemorySlabReader:
+    """
+    Main process side reader of worker slabs, attaches slabs by name and
+    caches the mapping, so a slab is mapped only once as long as its owner
+    worker does not re-create it.
+
+    Args:
+        status(multiprocessing.RawArray): slab status flags of all workers.
+    """
+
+    def __init__(self, status):
+        self._status = status
+        self._attached = {}
+
+    def _attach(self, slab_id, name):
+        slab = self._attached.get(slab_id)
+        if slab is not None and slab.name == name:
+            return slab
+        if slab is not None:
+            slab.close()
+        # NOTE: attaching registers the slab to the resource tracker shared
+        # with its owner worker again, which is a no-op, do not unregister
+        # it here, otherwise the worker fails to unregister it on unlinking
+        slab = shared_memory.SharedMemory(name=name)
+        self._attached[slab_id] = slab
+        return slab
+
+    def read(self, slab_batch):
+        """
+        Wrap the slots of :attr:`slab_batch` as numpy views over the slab
+        and set them into LoDTensors, the slab is released to its owner
+        worker once the tensors are built.
+
+        Returns:
+            list(core.LoDTensor): the flattened batch slots.
+        """
+        try:
+            slab = self._attach(slab_batch.slab_id, slab_batch.name)
+            tensors = []
+            for offset, shape, dtype in slab_batch.metas:
+                view = np.ndarray(
+                    shape, dtype=np.dtype(dtype), buffer=slab.buf, offset=offset
+                )
+                tensor = core.LoDTensor()
+                tensor.set(view, core.CPUPlace())
+                del view
+                tensors.append(tensor)
+            return tensors
+        finally:
+            self.release(slab_batch)
+
+    def read_numpy(self, slab_batch):
+        """
+        Copy the slots of :attr:`slab_batch` out of the slab as numpy
+        arrays, the slab is released to its owner worker after copying.
+
+        Returns:
+            list(numpy.ndarray): the flattened slots.
+        """
+        try:
+            slab = self._attach(slab_batch.slab_id, slab_batch.name)
+            return [
+                np.ndarray(
+                    shape, dtype=np.dtype(dtype), buffer=slab.buf, offset=offset
+                ).copy()
+                for offset, shape, dtype in slab_batch.metas
+            ]
+        finally:
+            self.release(slab_batch)
+
+    def release(self, slab_batch):
+        self._status[slab_batch.slab_id] = _SLAB_FREE
+
+    def close(self):
+        for slab in self._attached.values():
+            try:
+                slab.close()
+            except BufferError:
+                pass
+        self._attached = {}
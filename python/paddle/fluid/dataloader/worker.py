@@ -27,6 +27,7 @@ from ..multiprocess_utils import (
 )
 from ..framework import _non_static_mode, _in_eager_without_dygraph_check
 from .flat import _flatten_batch
+from .shm_ring import _SharedMemorySlabRing
 
 import queue
 
@@ -276,7 +277,10 @@ def _worker_loop(
     use_shared_memory,
     base_seed,
     shm_cahce_size=0,
+    slab_status=None,
+    slabs_per_worker=0,
 ):
+    slab_ring = None
     try:
         # NOTE: [ mmap files clear ] When the child process exits unexpectedly,
         # some shared memory objects may have been applied for but have not yet
@@ -289,6 +293,15 @@ def _worker_loop(
 
         core._set_max_memory_map_allocation_pool_size(shm_cahce_size)
 
+        # NOTE: [ shared memory slab ring ] batches are copied into
+        # pre-allocated shared memory slabs owned by this worker and only
+        # a small descriptor goes through out_queue, which avoids creating
+        # a new shared memory tensor for every slot of every batch
+        if use_shared_memory and slab_status is not None:
+            slab_ring = _SharedMemorySlabRing(
+                worker_id, slabs_per_worker, slab_status
+            )
+
         # set different numpy seed for each worker
         try:
             import numpy as np
@@ -374,7 +387,12 @@ def _worker_loop(
                 if isinstance(batch, _WorkerException):
                     out_queue.put((idx, batch, None))
                 batch, structure = _flatten_batch(batch)
-                if use_shared_memory:
+                slab_batch = None
+                if slab_ring is not None:
+                    slab_batch = slab_ring.write(batch)
+                if slab_batch is not None:
+                    out_queue.put((idx, slab_batch, structure))
+                elif use_shared_memory:
 
                     def numpy2lodtensor(arr):
                         lodtensor = core.Tensor()
@@ -396,5 +414,7 @@ def _worker_loop(
     except:
         raise
     finally:
+        if slab_ring is not None:
+            slab_ring.close()
         if use_shared_memory:
             _cleanup_mmap()
@@ -532,40 +532,57 @@ def _prepare_fleet_executor():
 
 
 def _get_strong_program_cache_key_for_new_exe(program, feed, fetch_list):
-    return program.desc.cached_hash_str() + _get_program_cache_key(
-        feed, fetch_list
+    return (
+        program.desc.cached_hash_str(),
+        _get_feed_fetch_var_names(feed, fetch_list),
     )
 
 
 def _get_strong_program_cache_key(program, feed, fetch_list):
-    # TODO(zhiqiu): use hash_str to generate cache key as above
-    def _get_varname_from_block(block):
-        block_str = []
-        for var_name in list(block.vars.keys()):
-            block_str.append(var_name)
-        return "\n".join(block_str)
-
+    # NOTE: the version of program is bumped whenever its vars or ops are
+    # changed by the python API, so that the key is cheap to compute even for
+    # programs with a lot of vars, the var number of block 0 is also checked
+    # in case that vars are added or removed directly
     inner_program = (
         program._program
         if isinstance(program, compiler.CompiledProgram)
         else program
     )
     return (
-        _get_varname_from_block(inner_program.blocks[0])
-        + str(id(program))
-        + _get_program_cache_key(feed, fetch_list)
+        id(program),
+        inner_program._cache_version,
+        len(inner_program.blocks[0].vars),
+        _get_feed_fetch_var_names(feed, fetch_list),
     )
 
 
-def _get_program_cache_key(feed, fetch_list):
-    feed_var_names = []
+def _get_feed_fetch_var_names(feed, fetch_list):
+    feed_var_names = ()
     if isinstance(feed, dict):
-        feed_var_names = list(feed.keys())
+        feed_var_names = tuple(feed.keys())
     elif isinstance(feed, list) or isinstance(feed, tuple):
         for i, each in enumerate(feed):
-            feed_var_names += list(each.keys())
-    fetch_var_names = list(map(_to_name_str, fetch_list))
-    return str(feed_var_names + fetch_var_names)
+            feed_var_names += tuple(each.keys())
+    fetch_var_names = tuple(map(_to_name_str, fetch_list))
+    return feed_var_names + fetch_var_names
+
+
+def _get_feed_targets(program):
+    """
+    Returns a list of (var, col) for the leading feed ops in the global block
+    of :attr:`program`, i.e. the fed variables and their column in the feed
+    list, so that it is not looked up on every run.
+    """
+    global_block = program.global_block()
+    feed_targets = []
+    for op in global_block.ops:
+        if op.desc.type() != 'feed':
+            break
+        feed_target_name = op.desc.output('Out')[0]
+        feed_targets.append(
+            (global_block.var(feed_target_name), op.desc.attr('col'))
+        )
+    return feed_targets
 
 
 def _as_lodtensor(data, place, dtype=None):
@@ -658,6 +675,7 @@ class _StandaloneExecutor:
         self._main_program = main_program
         self._scope = scope
         self._new_exe = self._create_new_executor()
+        self._feed_targets = _get_feed_targets(main_program)
 
     def run(self, scope, feed_names, fetch_list, return_numpy=True):
         """
@@ -739,6 +757,28 @@ class _StandaloneExecutor:
         return res
 
 
+def _can_use_interpreter_core(program, place):
+    compiled = isinstance(program, compiler.CompiledProgram) or isinstance(
+        program._graph, compiler.CompiledProgram
+    )
+    if compiled:
+        compiled_program = (
+            program
+            if isinstance(program, compiler.CompiledProgram)
+            else program._graph
+        )
+
+        # Unsupported case 1: inference
+        if compiled_program._is_inference:
+            warnings.warn(
+                "Standalone executor is not used for inference",
+                UserWarning,
+            )
+            return False
+
+    return True
+
+
 class _ExecutorCache:
     class _CachedData:
         def __init__(
@@ -900,7 +940,7 @@ class _ExecutorCache:
         )
         if enable_inplace or enable_addto:
             # inplace should skip feed and fetch var
-            skip_var_names = eval(_get_program_cache_key(feed, fetch_list))
+            skip_var_names = list(_get_feed_fetch_var_names(feed, fetch_list))
             _apply_inplace_addto_pass(
                 program, enable_inplace, enable_addto, skip_var_names
             )
@@ -910,6 +950,73 @@ class _ExecutorCache:
         return new_program, new_exe
 
 
+class _PreparedProgram:
+    """
+    A program prepared by :code:`Executor.prepare` for a fixed set of feed
+    and fetch variables. Its :code:`run` feeds the data and runs the cached
+    standalone executor directly, skipping the cache key computation, the
+    feed check and the program preparation of :code:`Executor.run`.
+
+    The prepared program does not track changes of the original program,
+    prepare it again after modifying the program.
+    """
+
+    def __init__(
+        self,
+        executor,
+        program,
+        new_exe,
+        feed_names,
+        fetch_list,
+        feed_var_name,
+        scope,
+    ):
+        self._executor = executor
+        self._program = program
+        self._new_exe = new_exe
+        self._feed_names = feed_names
+        self._fetch_list = fetch_list
+        self._feed_var_name = feed_var_name
+        self._scope = scope
+
+    @property
+    def feed_names(self):
+        return list(self._feed_names)
+
+    def run(self, feed=None, return_numpy=True):
+        """
+        Run the prepared program with :attr:`feed`.
+
+        Args:
+            feed(dict, optional): A dict which maps the prepared feed names to
+                their data, the data of feed names pruned from the program
+                are ignored. Default None.
+            return_numpy(bool, optional): Whether to convert the fetched
+                tensors to numpy.ndarray. Default True.
+
+        Returns:
+            List: The fetched results, in the order of the prepared
+            :code:`fetch_list`.
+        """
+        if self._executor._closed:
+            raise RuntimeError("Attempted to use a closed Executor")
+        if feed is None:
+            feed = {}
+        self._executor._feed_data(
+            self._program,
+            feed,
+            self._feed_var_name,
+            self._scope,
+            self._new_exe._feed_targets,
+        )
+        self._executor._feed_lr_scheduler(self._program, self._scope)
+        res = self._new_exe.run(
+            self._scope, self._feed_names, self._fetch_list, return_numpy
+        )
+        core.update_autotune_status()
+        return res
+
+
 class Executor:
     """
     :api_attr: Static Graph
@@ -1059,24 +1166,45 @@ class Executor:
             f"use_program_cache is force set to {use_program_cache} by FLAGS_FORCE_USE_PROGRAM_CACHE"
         )
 
-    def _feed_data(self, program, feed, feed_var_name, scope):
+    def _feed_data(
+        self, program, feed, feed_var_name, scope, feed_targets=None
+    ):
         # feed var to framework
-        global_block = program.global_block()
-        for op in global_block.ops:
-            if op.desc.type() == 'feed':
-                feed_target_name = op.desc.output('Out')[0]
-                cur_feed = feed[feed_target_name]
-                var = global_block.var(feed_target_name)
-                if var.dtype != core.VarDesc.VarType.STRINGS:
-                    if not isinstance(cur_feed, core.LoDTensor):
-                        cur_feed = _as_lodtensor(
-                            cur_feed, self.place, var.dtype
-                        )
-                    check_feed_shape_type(var, cur_feed)
-                idx = op.desc.attr('col')
-                core.set_feed_variable(scope, cur_feed, feed_var_name, idx)
-            else:
-                break
+        if feed_targets is None:
+            feed_targets = _get_feed_targets(program)
+        for var, idx in feed_targets:
+            cur_feed = feed[var.name]
+            if var.dtype != core.VarDesc.VarType.STRINGS:
+                if not isinstance(cur_feed, core.LoDTensor):
+                    cur_feed = _as_lodtensor(cur_feed, self.place, var.dtype)
+                check_feed_shape_type(var, cur_feed)
+            core.set_feed_variable(scope, cur_feed, feed_var_name, idx)
+
+    def _feed_lr_scheduler(self, program, scope):
+        if not hasattr(program, 'lr_scheduler'):
+            return
+        from paddle.optimizer.lr import LRScheduler
+
+        assert isinstance(
+            program.lr_scheduler, LRScheduler
+        ), "must be LRScheduler"
+        lr_scheduler = program.lr_scheduler
+        lr_value = lr_scheduler()
+        lr_var = program.global_block().vars[lr_scheduler._var_name]
+        data = np.array([lr_value]).astype(convert_dtype(lr_var.dtype))
+        tensor = core.get_variable_tensor(scope, lr_scheduler._var_name)
+        # NOTE(dev): `tensor.set(data, self.place)` always call TensorCopySync that is a blocking behavior. So we use `_copy_from` to replace it.
+        cpu_tensor = _as_lodtensor(data, core.CPUPlace())
+        if core.is_cuda_graph_capturing():
+            warnings.warn(
+                "Caution!!! When capturing CUDA Graph, the learning rate scheduler would not "
+                "take any effect! Please set the learning rate manually before each batch!"
+            )
+        elif core.is_compiled_with_ipu():
+            # for ipu, tensor is allocated on cpu
+            tensor._copy_from(cpu_tensor, tensor._place())
+        else:
+            tensor._copy_from(cpu_tensor, self.place)
 
     def _fetch_data(self, fetch_list, fetch_var_name, scope):
         outs = [
@@ -1450,6 +1578,114 @@ class Executor:
         core.update_autotune_status()
         return res
 
+    def prepare(
+        self,
+        program=None,
+        feed_names=None,
+        fetch_list=None,
+        feed_var_name='feed',
+        fetch_var_name='fetch',
+        scope=None,
+    ):
+        """
+        Prepare :attr:`program` for running repeatedly with the same feed and
+        fetch variables. The returned handle's :code:`run(feed)` skips the
+        per-call work of :code:`Executor.run`, e.g. computing the program
+        cache key and looking for the feed operators, which is useful when
+        the program is large and each step is short.
+
+        Only programs which can be run by the standalone executor are
+        supported, and pruning by :code:`use_prune` is not supported.
+
+        Args:
+            program(Program|CompiledProgram, optional): The program to run. If
+                it is not provided, the default main program is used.
+                Default None.
+            feed_names(list|tuple, optional): Names of the variables to be fed
+                on every run. Default None, which means no variable is fed.
+            fetch_list(list, optional): Variables or names of variables to be
+                fetched on every run. Default None.
+            feed_var_name(str, optional): Name of the feed holder variable.
+                Default 'feed'.
+            fetch_var_name(str, optional): Name of the fetch holder variable.
+                Default 'fetch'.
+            scope(Scope, optional): The scope to run in. If it is not
+                provided, the global scope is used. Default None.
+
+        Returns:
+            A prepared program, whose :code:`run(feed=None, return_numpy=True)`
+            returns the same results as :code:`Executor.run` with the prepared
+            arguments.
+
+        Examples:
+            .. code-block:: python
+
+                import numpy
+                import paddle
+
+                paddle.enable_static()
+                exe = paddle.static.Executor(paddle.CPUPlace())
+
+                data = paddle.static.data(name='X', shape=[None, 1], dtype='float32')
+                hidden = paddle.static.nn.fc(data, 10)
+                loss = paddle.mean(hidden)
+                paddle.optimizer.SGD(learning_rate=0.01).minimize(loss)
+
+                exe.run(paddle.static.default_startup_program())
+                prepared = exe.prepare(feed_names=['X'], fetch_list=[loss])
+                for _ in range(10):
+                    x = numpy.random.random(size=(10, 1)).astype('float32')
+                    loss_data, = prepared.run(feed={'X': x})
+        """
+        if self._closed:
+            raise RuntimeError("Attempted to use a closed Executor")
+        if program is None:
+            program = default_main_program()
+        if isinstance(program, Program) and (
+            program._pipeline_opt or program._heter_pipeline_opt
+        ):
+            raise NotImplementedError(
+                "Executor.prepare does not support pipeline programs, "
+                "please use Executor.run instead."
+            )
+        if not _can_use_interpreter_core(program, self.place):
+            raise NotImplementedError(
+                "Executor.prepare only supports programs which can be run "
+                "by the standalone executor, please use Executor.run instead."
+            )
+
+        fetch_list, optimize_ops = self._split_optimize_ops_in_fetch_list(
+            self._check_fetch_list(fetch_list)
+        )
+        if optimize_ops:
+            raise NotImplementedError(
+                "Executor.prepare does not support pruning by optimize ops "
+                "in fetch_list, please use Executor.run instead."
+            )
+        if scope is None:
+            scope = global_scope()
+
+        # the feed data is only used for its names while preparing
+        feed = self._update_feed(program, dict.fromkeys(feed_names or []))
+        program, new_exe = self._executor_cache.get_program_and_executor(
+            program,
+            feed,
+            fetch_list,
+            feed_var_name,
+            fetch_var_name,
+            self.place,
+            scope,
+        )
+        return _PreparedProgram(
+            self,
+            program,
+            new_exe,
+            list(feed.keys()),
+            new_exe._check_fetch(fetch_list),
+            feed_var_name,
+            scope,
+        )
+
     def _run_impl(
         self,
         program,
@@ -1574,27 +1810,6 @@ class Executor:
             feed = self._update_feed(pruned_program, feed)
             program = pruned_program
 
-        def _can_use_interpreter_core(program, place):
-            compiled = isinstance(
-                program, compiler.CompiledProgram
-            ) or isinstance(program._graph, compiler.CompiledProgram)
-            if compiled:
-                compiled_program = (
-                    program
-                    if isinstance(program, compiler.CompiledProgram)
-                    else program._graph
-                )
-
-                # Unsupported case 1: inference
-                if compiled_program._is_inference:
-                    warnings.warn(
-                        "Standalone executor is not used for inference",
-                        UserWarning,
-                    )
-                    return False
-
-            return True
-
         if _can_use_interpreter_core(program, self.place):
 
             if feed is None:
@@ -1619,30 +1834,10 @@ class Executor:
                 scope,
             )
 
-            self._feed_data(program, feed, feed_var_name, scope)
-            if hasattr(program, 'lr_scheduler'):
-                from paddle.optimizer.lr import LRScheduler
-
-                assert isinstance(
-                    program.lr_scheduler, LRScheduler
-                ), "must be LRScheduler"
-                lr_scheduler = program.lr_scheduler
-                lr_value = lr_scheduler()
-                lr_var = program.global_block().vars[lr_scheduler._var_name]
-                data = np.array([lr_value]).astype(convert_dtype(lr_var.dtype))
-                tensor = core.get_variable_tensor(scope, lr_scheduler._var_name)
-                # NOTE(dev): `tensor.set(data, self.place)` always call TensorCopySync that is a blocking behavior. So we use `_copy_from` to replace it.
-                cpu_tensor = _as_lodtensor(data, core.CPUPlace())
-                if core.is_cuda_graph_capturing():
-                    warnings.warn(
-                        "Caution!!! When capturing CUDA Graph, the learning rate scheduler would not "
-                        "take any effect! Please set the learning rate manually before each batch!"
-                    )
-                elif core.is_compiled_with_ipu():
-                    # for ipu, tensor is allocated on cpu
-                    tensor._copy_from(cpu_tensor, tensor._place())
-                else:
-                    tensor._copy_from(cpu_tensor, self.place)
+            self._feed_data(
+                program, feed, feed_var_name, scope, new_exe._feed_targets
+            )
+            self._feed_lr_scheduler(program, scope)
 
             return new_exe.run(
                 scope, list(feed.keys()), fetch_list, return_numpy
@@ -39,6 +39,7 @@ import warnings
 import functools
 from .variable_index import _getitem_impl_, _setitem_impl_
 import threading
+import itertools
 
 __all__ = [
     'Program',
@@ -111,6 +112,9 @@ global_var = GlobalThreadLocal()
 _global_expected_place_ = None
 _current_device = None
 global_prog_seed = 0
+# versions of all programs are drawn from it, so that (id(program), version)
+# is never reused even if the id of a released program is reused
+_program_version_counter = itertools.count()
 _current_pipeline_stage = None
 _already_patch_eager_tensor = False
 _already_patch_varbase = False
@@ -1462,6 +1466,7 @@ class Variable(metaclass=VariableMetaClass):
                 pass
 
         self.block.vars[name] = self
+        self.block.program._bump_version()
         self.op = None
         self.stop_gradient = stop_gradient
         self.is_data = is_data
@@ -3916,6 +3921,7 @@ class Block:
         self.vars[new_name] = var
         del self.vars[name]
         self._sync_with_cpp()
+        self.program._bump_version()
         return var
 
     def _remove_var(self, name, sync=True):
@@ -3923,6 +3929,7 @@ class Block:
             self._sync_with_cpp()
         self.desc._remove_var(name.encode())
         del self.vars[name]
+        self.program._bump_version()
 
     def create_parameter(self, *args, **kwargs):
         global_block = self.program.global_block()
@@ -4056,6 +4063,7 @@ class Block:
                 )
 
             self.ops.append(op)
+            self.program._bump_version()
 
         return op
 
@@ -4086,6 +4094,7 @@ class Block:
         op_desc = self.desc._insert_op(index)
         op = Operator(block=self, desc=op_desc, *args, **kwargs)
         self.ops.insert(index, op)
+        self.program._bump_version()
         return op
 
     def _remove_op(self, index, sync=True):
@@ -4102,6 +4111,7 @@ class Block:
             self._sync_with_cpp()
         self.desc._remove_op(index, index + 1)
         del self.ops[index]
+        self.program._bump_version()
 
     def _slice_ops(self, start, end):
         """
@@ -4142,6 +4152,7 @@ class Block:
                 attrs=kwargs.get("attrs", None),
             )
             self.ops.insert(0, op)
+            self.program._bump_version()
 
         return op
 
@@ -4231,6 +4242,7 @@ class Block:
         assert len(self.ops) == len(ops_in_cpp)
         for index in range(len(self.ops)):
             assert self.ops[index].desc == ops_in_cpp[index]
+        self.program._bump_version()
 
     def _copy_param_info_from(self, other):
         """
@@ -5286,6 +5298,9 @@ class Program:
     """
 
     def __init__(self):
+        # bumped whenever vars or ops of any block are added, removed or
+        # renamed through the python API, see `_bump_version`
+        self._cache_version = next(_program_version_counter)
         self.desc = core.ProgramDesc()
         self.blocks = [Block(self, 0)]
         self.current_block_idx = 0
@@ -6482,8 +6497,23 @@ class Program:
         self.desc.append_block(parent.desc)
         self.current_block_idx = new_block_idx
         self.blocks.append(Block(self, self.current_block_idx))
+        self._bump_version()
         return self.current_block()
 
+    def _bump_version(self):
+        """
+        Mark the program as modified, the version is used by the executor as
+        a cheap cache key of the program instead of its content.
+
+        Notes: This is a very low level API. Users should not invoke it
+        directly, except after modifying the desc of the program in C++
+        space without calling `_sync_with_cpp`.
+
+        Returns:
+            None
+        """
+        self._cache_version = next(_program_version_counter)
+
     def _rollback(self):
         """
         Exit a code block, i.e., roll back to the parent block.
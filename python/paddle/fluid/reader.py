@@ -400,12 +400,23 @@ class DataLoader:
             as True only when the shared memory space on your machine(e.g.
             space of '/dev/shm' on Linux operating sysytem) is large enough.
             Shared memory will only be enabled in multi-process mode(num_workers
-            > 0). Default True.
+            > 0). If environment variable ``FLAGS_dataloader_use_shm_ring`` is
+            set, each worker writes batches into a ring of pre-allocated
+            shared memory slabs instead of creating shared memory tensors
+            for every batch. Default True.
         timeout(int, optional): the timeout value for getting data form output queue
             of subprocesses. Default 0.
         worker_init_fn(callable, optional): init function which will be called with
             worker id on each subproces starting if not set as None. Default
             None.
+        persistent_workers(bool, optional): whether to keep worker subprocesses
+            alive across epochs, if set as True, workers and their dataset
+            fetchers are created only once, and for map-style datasets the
+            first :attr:`prefetch_factor` batches of the next epoch are
+            prefetched while the current epoch drains. Next epoch prefetching
+            is skipped if :attr:`batch_sampler` defines ``set_epoch``, for
+            its sampling order is only settled by ``set_epoch`` calling.
+            Default False.
 
     Returns:
         DataLoader: an iterable object for data iterating, each elemnet of the generated data is a Tensor.
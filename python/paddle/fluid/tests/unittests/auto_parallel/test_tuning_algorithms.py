@@ -0,0 +1,109 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import paddle
+from paddle.distributed.auto_parallel.tuner.algorithms import (
+    _get_recompute_segments,
+    new_algorithm,
+)
+from paddle.distributed.auto_parallel.tuner.config import TuningConfig
+from paddle.distributed.auto_parallel.tuner.optimization_tuner import (
+    _strategy_key,
+)
+from paddle.distributed.auto_parallel.tuner.trial import TrialStatus
+from paddle.distributed.fleet import auto
+
+paddle.enable_static()
+
+
+class TestShardingStageAlgorithm(unittest.TestCase):
+    def new_algorithm(self):
+        strategy = auto.Strategy()
+        strategy.sharding.enable = True
+        strategy.sharding.enable_tuning = True
+        strategy.sharding.tuning_range = [0, 1, 2, 3]
+        return new_algorithm("sharding", TuningConfig(strategy))
+
+    def test_next_trials(self):
+        algorithm = self.new_algorithm()
+        trials = algorithm.next_trials(3)
+        self.assertEqual(
+            [trial.name for trial in trials],
+            [
+                "trial-sharding-stage3",
+                "trial-sharding-stage2",
+                "trial-sharding-stage1",
+            ],
+        )
+        self.assertEqual(algorithm.next_trial().name, trials[0].name)
+
+        algorithm.update({"Throughtput": 1.0})
+        self.assertEqual(algorithm.next_trial().name, trials[1].name)
+        algorithm.update(
+            {"Throughtput": -1, "ErrorType": "ResourceExhaustedError"}
+        )
+        # the remaining trials are pruned by OOM
+        self.assertEqual(algorithm.next_trial().status, TrialStatus.STOPPED)
+        self.assertEqual(
+            algorithm.next_trials(3)[0].status, TrialStatus.STOPPED
+        )
+
+    def test_strategy_key(self):
+        strategy = auto.Strategy()
+        key = _strategy_key(strategy)
+        self.assertEqual(key, _strategy_key(auto.Strategy()))
+        strategy.tuning.enable = True
+        self.assertEqual(key, _strategy_key(strategy))
+        strategy.sharding.stage = 2
+        self.assertNotEqual(key, _strategy_key(strategy))
+
+
+class TestRecomputeSegments(unittest.TestCase):
+    def test_cache(self):
+        main_program = paddle.static.Program()
+        with paddle.static.program_guard(main_program):
+            x = paddle.static.data(name='x', shape=[-1, 4], dtype='float32')
+            for _ in range(3):
+                x = paddle.nn.functional.relu(x)
+        ops = main_program.global_block().ops
+        ops[0]._set_attr('op_namescope', '/auto_parallel/rc_0')
+        ops[1]._set_attr('op_namescope', '/auto_parallel/rc_1')
+        ops[2]._set_attr('op_namescope', '/auto_parallel/rc_0')
+
+        segments = _get_recompute_segments(main_program)
+        self.assertEqual(
+            segments, ['/auto_parallel/rc_0', '/auto_parallel/rc_1']
+        )
+        self.assertIs(_get_recompute_segments(main_program), segments)
+
+        # the cache is invalidated when the program is modified
+        with paddle.static.program_guard(main_program):
+            paddle.nn.functional.relu(x)
+        main_program.global_block().ops[-1]._set_attr(
+            'op_namescope', '/auto_parallel/rc_2'
+        )
+        self.assertEqual(
+            _get_recompute_segments(main_program),
+            [
+                '/auto_parallel/rc_0',
+                '/auto_parallel/rc_1',
+                '/auto_parallel/rc_2',
+            ],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
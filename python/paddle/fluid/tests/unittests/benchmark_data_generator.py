@@ -0,0 +1,81 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+import unittest
+
+import numpy as np
+
+from paddle.distributed import fleet
+
+# A micro benchmark of formatting samples into the MultiSlot text format,
+# per sample by `_gen_str` versus per batch by `_gen_batch_str`.
+
+
+def timeit_per_call(callback, iters, calls_per_iter=1):
+    callback()
+    start = time.perf_counter()
+    for _ in range(iters):
+        callback()
+    elapse = time.perf_counter() - start
+    return elapse / iters / calls_per_iter
+
+
+class TestDataGeneratorThroughput(unittest.TestCase):
+    def setUp(self):
+        self.batch_size = 1024
+        rng = np.random.default_rng(2023)
+        lengths = rng.integers(1, 20, [self.batch_size])
+        words = rng.integers(0, 1 << 40, [int(lengths.sum())])
+        dense = rng.random([self.batch_size, 8]).astype('float32')
+        label = rng.integers(0, 2, [self.batch_size, 1])
+
+        self.slots = [
+            ("words", (words, lengths)),
+            ("dense", dense),
+            ("label", label),
+        ]
+        offsets = np.cumsum(lengths) - lengths
+        self.samples = [
+            [
+                ("words", words[offset : offset + length].tolist()),
+                ("dense", dense[i].tolist()),
+                ("label", label[i].tolist()),
+            ]
+            for i, (offset, length) in enumerate(zip(offsets, lengths))
+        ]
+
+    def test_timeit_gen_str(self):
+        """
+        output example
+        >>> MultiSlotDataGenerator per sample: 76771 samples/s, per batch: 111991 samples/s
+        """
+        generator = fleet.MultiSlotDataGenerator()
+
+        def gen_per_sample():
+            for sample in self.samples:
+                generator._gen_str(sample)
+
+        per_sample = timeit_per_call(gen_per_sample, 10, self.batch_size)
+        per_batch = timeit_per_call(
+            lambda: generator._gen_batch_str(self.slots), 10, self.batch_size
+        )
+        print(
+            'MultiSlotDataGenerator per sample: {:.0f} samples/s, '
+            'per batch: {:.0f} samples/s'.format(1 / per_sample, 1 / per_batch)
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
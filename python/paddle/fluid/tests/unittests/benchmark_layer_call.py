@@ -0,0 +1,109 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+import unittest
+
+import paddle
+
+# A micro benchmark of the python overhead of `Layer.__call__` and
+# attribute lookup of sublayers and parameters, the layers do no
+# computation so the time is all spent in dispatching.
+
+
+class Noop(paddle.nn.Layer):
+    def forward(self, x):
+        return x
+
+
+class NoopParam(paddle.nn.Layer):
+    def __init__(self):
+        super().__init__()
+        self.weight = self.create_parameter([1])
+
+    def forward(self, x):
+        return x
+
+
+class DeepNet(paddle.nn.Layer):
+    def __init__(self, depth):
+        super().__init__()
+        self.depth = depth
+        for i in range(depth):
+            setattr(self, 'layer_{}'.format(i), NoopParam())
+
+    def forward(self, x):
+        for i in range(self.depth):
+            x = getattr(self, 'layer_{}'.format(i))(x)
+        return x
+
+
+def timeit_per_call(callback, iters, calls_per_iter=1):
+    callback()
+    start = time.perf_counter()
+    for _ in range(iters):
+        callback()
+    elapse = time.perf_counter() - start
+    return elapse / iters / calls_per_iter
+
+
+class TestLayerCallOverhead(unittest.TestCase):
+    def setUp(self):
+        paddle.disable_static()
+        self.x = paddle.ones([1])
+
+    def test_timeit_call(self):
+        """
+        output example
+        >>> One call of Layer.__call__ cost 0.292 us
+        """
+        layer = Noop()
+        cost = timeit_per_call(lambda: layer(self.x), 100000)
+        print('One call of Layer.__call__ cost {:.3f} us'.format(cost * 1e6))
+
+    def test_timeit_call_with_hook(self):
+        layer = Noop()
+        layer.register_forward_pre_hook(lambda layer, input: None)
+        cost = timeit_per_call(lambda: layer(self.x), 100000)
+        print(
+            'One call of Layer.__call__ with hook cost {:.3f} us'.format(
+                cost * 1e6
+            )
+        )
+
+    def test_timeit_getattr(self):
+        """
+        output example
+        >>> One lookup of sublayer cost 0.105 us
+        """
+        net = DeepNet(1)
+        cost = timeit_per_call(lambda: net.layer_0, 100000)
+        print('One lookup of sublayer cost {:.3f} us'.format(cost * 1e6))
+        layer = net.layer_0
+        cost = timeit_per_call(lambda: layer.weight, 100000)
+        print('One lookup of parameter cost {:.3f} us'.format(cost * 1e6))
+
+    def test_timeit_deep_net(self):
+        depth = 1000
+        net = DeepNet(depth)
+        cost = timeit_per_call(lambda: net(self.x), 100, depth)
+        print(
+            'One sublayer of {} sublayers cost {:.3f} us'.format(
+                depth, cost * 1e6
+            )
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
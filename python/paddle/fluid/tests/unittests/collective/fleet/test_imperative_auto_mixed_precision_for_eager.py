@@ -402,6 +402,48 @@ class TestAmpScaler(unittest.TestCase):
     def test_step_update_exception(self):
         self.step_update_exception()
 
+    def test_unscale_param_groups(self):
+        with fluid.dygraph.guard():
+            model = paddle.nn.Linear(4, 4)
+            extra = paddle.nn.Linear(4, 4)
+            optimizer = paddle.optimizer.SGD(
+                learning_rate=0.01,
+                parameters=[{'params': model.parameters()}],
+            )
+            scaler = paddle.amp.GradScaler(init_loss_scaling=1024)
+
+            def unscale():
+                optimizer.clear_grad()
+                extra.clear_gradients()
+                loss = paddle.mean(extra(model(paddle.rand([2, 4]))))
+                scaler.scale(loss).backward()
+                params = model.parameters() + extra.parameters()
+                scaled_grads = [p.grad.numpy() for p in params]
+                scaler.unscale_(optimizer)
+                scaler.update()
+                return scaled_grads, [p.grad.numpy() for p in params]
+
+            scaled_grads, grads = unscale()
+            for scaled_grad, grad in zip(scaled_grads[:2], grads[:2]):
+                np.testing.assert_allclose(grad, scaled_grad / 1024, rtol=1e-6)
+            # parameters not in the optimizer are not unscaled
+            for scaled_grad, grad in zip(scaled_grads[2:], grads[2:]):
+                np.testing.assert_array_equal(grad, scaled_grad)
+
+            # cached parameter list is refreshed after adding a group
+            optimizer.add_param_group({'params': extra.parameters()})
+            scaled_grads, grads = unscale()
+            for scaled_grad, grad in zip(scaled_grads, grads):
+                np.testing.assert_allclose(grad, scaled_grad / 1024, rtol=1e-6)
+
+            # the float64 parameters are split out after a dtype change
+            extra.to(dtype='float64')
+            parameter_list, other_parameters = scaler._get_grouped_parameters(
+                optimizer
+            )
+            self.assertEqual(len(parameter_list), 2)
+            self.assertEqual(len(other_parameters), 2)
+
     def test_get_and_set(self):
         with fluid.dygraph.guard():
             scaler = paddle.amp.GradScaler(
@@ -283,12 +283,25 @@ class TestMLPReshard(unittest.TestCase):
         )
         # test cache
         global_cost = cost_estimator.estimate(dist_context)
-        max_memory = cost_estimator._estimate_max_memory_by_dist_op(
-            dist_context
+        self.assertEqual(
+            max_memory,
+            cost_estimator._estimate_max_memory_by_dist_op(dist_context),
         )
         assert global_cost.time > 0
         assert max_memory > 0
 
+        # test memoized op costs
+        global_time = global_cost.time
+        self.assertEqual(
+            cost_estimator.reestimate(dist_context, []).time, global_time
+        )
+        new_estimator = CostEstimator(train_program, cluster)
+        self.assertIs(
+            new_estimator._dist_op_cost_cache,
+            cost_estimator._dist_op_cost_cache,
+        )
+        self.assertEqual(new_estimator.estimate(dist_context).time, global_time)
+
         resharder = Resharder(
             partitioned_main_prog,
             partitioned_startup_prog,
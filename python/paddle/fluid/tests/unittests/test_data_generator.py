@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 import unittest
 
+import numpy as np
+
 from paddle.distributed import fleet
 
 
@@ -186,5 +188,61 @@ class TestMultiSlotDataGeneratorZip(unittest.TestCase):
         my_ms_dg.run_from_memory()
 
 
+class TestMultiSlotDataGeneratorBatch(unittest.TestCase):
+    def check_batch(self, generator, slots, samples):
+        expected = "".join(generator._gen_str(sample) for sample in samples)
+        proto_info = generator._proto_info
+        generator._proto_info = None
+        self.assertEqual(generator._gen_batch_str(slots), expected)
+        self.assertEqual(generator._proto_info, proto_info)
+
+    def test_MultiSlotDataGenerator_batch(self):
+        slots = [
+            ("words", (np.array([1926, 8, 17, 1, 2]), np.array([3, 2]))),
+            ("weight", np.array([[0.5], [1.0]], dtype='float32')),
+            ("label", np.array([1, 0])),
+        ]
+        samples = [
+            [("words", [1926, 8, 17]), ("weight", [0.5]), ("label", [1])],
+            [("words", [1, 2]), ("weight", [1.0]), ("label", [0])],
+        ]
+        self.check_batch(fleet.MultiSlotDataGenerator(), slots, samples)
+
+    def test_MultiSlotStringDataGenerator_batch(self):
+        slots = [
+            ("words", (["1926", "08", "17", "1"], [3, 1])),
+            ("label", [["1"], ["0"]]),
+        ]
+        samples = [
+            [("words", ["1926", "08", "17"]), ("label", ["1"])],
+            [("words", ["1"]), ("label", ["0"])],
+        ]
+        self.check_batch(fleet.MultiSlotStringDataGenerator(), slots, samples)
+
+    def test_float_type_is_kept(self):
+        generator = fleet.MultiSlotDataGenerator()
+        generator._gen_batch_str([("weight", np.array([[0.5]]))])
+        generator._gen_batch_str([("weight", np.array([[1]]))])
+        self.assertEqual(generator._proto_info, [("weight", "float")])
+
+    def test_MultiSlotDataGenerator_batch_error(self):
+        generator = fleet.MultiSlotDataGenerator()
+        error_slots = [
+            [],
+            [(1, np.array([[1]]))],
+            [("words", np.array([["1"]]))],
+            [("words", np.zeros([2, 0], dtype='int64'))],
+            [("words", (np.array([1, 2]), np.array([1, 2])))],
+            [("words", np.array([[1], [2]])), ("label", np.array([[1]]))],
+        ]
+        for slots in error_slots:
+            with self.assertRaises(ValueError):
+                generator._gen_batch_str(slots)
+
+        generator._gen_batch_str([("words", np.array([[1]]))])
+        with self.assertRaises(ValueError):
+            generator._gen_batch_str([("label", np.array([[1]]))])
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,137 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import numpy as np
+
+import paddle
+from paddle.io import ComposeDataset, DataLoader, Dataset, Subset, TensorDataset
+
+SAMPLE_NUM = 20
+BATCH_SIZE = 4
+
+
+class ArrayDataset(Dataset):
+    def __init__(self, sample_num):
+        self.images = np.arange(sample_num * 3).reshape([sample_num, 3])
+        self.images = self.images.astype('float32')
+        self.labels = np.arange(sample_num).reshape([sample_num, 1])
+        self.getitem_calls = 0
+        self.getitems_calls = 0
+
+    def __getitem__(self, idx):
+        self.getitem_calls += 1
+        return self.images[idx], self.labels[idx]
+
+    def __getitems__(self, indices):
+        self.getitems_calls += 1
+        return [self.images[indices], self.labels[indices]]
+
+    def __len__(self):
+        return len(self.labels)
+
+
+class PlainDataset(Dataset):
+    def __init__(self, sample_num):
+        self.sample_num = sample_num
+
+    def __getitem__(self, idx):
+        return np.array([idx]).astype('int64')
+
+    def __len__(self):
+        return self.sample_num
+
+
+class TestGetItemsFetch(unittest.TestCase):
+    def setUp(self):
+        paddle.disable_static()
+
+    def test_batched_fetch(self):
+        dataset = ArrayDataset(SAMPLE_NUM)
+        loader = DataLoader(dataset, batch_size=BATCH_SIZE, num_workers=0)
+        for i, (image, label) in enumerate(loader):
+            self.assertEqual(image.shape, [BATCH_SIZE, 3])
+            np.testing.assert_array_equal(
+                label.numpy().flatten(),
+                np.arange(i * BATCH_SIZE, (i + 1) * BATCH_SIZE),
+            )
+        self.assertEqual(dataset.getitem_calls, 0)
+        self.assertEqual(dataset.getitems_calls, SAMPLE_NUM // BATCH_SIZE)
+
+    def test_custom_collate_fn(self):
+        dataset = ArrayDataset(SAMPLE_NUM)
+
+        def collate_fn(samples):
+            return [
+                np.stack([s[0] for s in samples]),
+                np.stack([s[1] for s in samples]),
+            ]
+
+        loader = DataLoader(
+            dataset, batch_size=BATCH_SIZE, collate_fn=collate_fn
+        )
+        for image, label in loader:
+            self.assertEqual(image.shape, [BATCH_SIZE, 3])
+        self.assertEqual(dataset.getitems_calls, 0)
+        self.assertEqual(dataset.getitem_calls, SAMPLE_NUM)
+
+    def test_subset(self):
+        dataset = ArrayDataset(SAMPLE_NUM)
+        subset = Subset(dataset, list(range(SAMPLE_NUM - 1, -1, -2)))
+        image, label = subset.__getitems__([0, 1])
+        np.testing.assert_array_equal(
+            label.flatten(), [SAMPLE_NUM - 1, SAMPLE_NUM - 3]
+        )
+        self.assertIsNone(Subset(PlainDataset(4), [0, 1]).__getitems__)
+
+    def test_compose_dataset(self):
+        dataset = ComposeDataset(
+            [ArrayDataset(SAMPLE_NUM), ArrayDataset(SAMPLE_NUM)]
+        )
+        batch = dataset.__getitems__([1, 3])
+        self.assertEqual(len(batch), 4)
+        for i, field in enumerate(dataset[3]):
+            np.testing.assert_array_equal(batch[i][1], field)
+
+        dataset = ComposeDataset(
+            [ArrayDataset(SAMPLE_NUM), PlainDataset(SAMPLE_NUM)]
+        )
+        self.assertIsNone(dataset.__getitems__)
+        loader = DataLoader(dataset, batch_size=BATCH_SIZE)
+        for image, label, idx in loader:
+            np.testing.assert_array_equal(
+                label.numpy().flatten(), idx.numpy().flatten()
+            )
+
+    def test_tensor_dataset(self):
+        images = paddle.rand([SAMPLE_NUM, 3])
+        labels = paddle.arange(SAMPLE_NUM).reshape([SAMPLE_NUM, 1])
+        dataset = TensorDataset([images, labels])
+        image, label = dataset.__getitems__([2, 5, 7])
+        np.testing.assert_array_equal(image.numpy(), images.numpy()[[2, 5, 7]])
+        np.testing.assert_array_equal(label.numpy().flatten(), [2, 5, 7])
+
+        loader = DataLoader(dataset, batch_size=BATCH_SIZE, shuffle=True)
+        seen = []
+        for image, label in loader:
+            self.assertEqual(image.shape, [BATCH_SIZE, 3])
+            seen.append(label.numpy().flatten())
+        np.testing.assert_array_equal(
+            np.sort(np.concatenate(seen)), np.arange(SAMPLE_NUM)
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
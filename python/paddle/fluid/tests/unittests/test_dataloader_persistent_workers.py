@@ -0,0 +1,107 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import numpy as np
+
+import paddle
+from paddle.io import BatchSampler, DataLoader, Dataset, DistributedBatchSampler
+
+SAMPLE_NUM = 37
+BATCH_SIZE = 4
+EPOCH_NUM = 3
+
+
+class IndexDataset(Dataset):
+    def __init__(self, sample_num):
+        self.sample_num = sample_num
+
+    def __getitem__(self, idx):
+        return np.array([idx]).astype('int64')
+
+    def __len__(self):
+        return self.sample_num
+
+
+class TestPersistentWorkersWarmPrefetch(unittest.TestCase):
+    def setUp(self):
+        paddle.disable_static()
+
+    def run_epochs(self, loader, break_at=None):
+        results = []
+        for epoch in range(EPOCH_NUM):
+            epoch_data = []
+            for i, data in enumerate(loader):
+                if break_at is not None and epoch == 0 and i == break_at:
+                    break
+                epoch_data.append(data.numpy().flatten())
+            results.append(np.concatenate(epoch_data))
+        return results
+
+    def test_epoch_boundary(self):
+        loader = DataLoader(
+            IndexDataset(SAMPLE_NUM),
+            batch_size=BATCH_SIZE,
+            num_workers=2,
+            prefetch_factor=2,
+            persistent_workers=True,
+        )
+        self.assertTrue(iter(loader)._warm_prefetch)
+        for epoch_data in self.run_epochs(loader):
+            np.testing.assert_array_equal(epoch_data, np.arange(SAMPLE_NUM))
+
+    def test_early_break(self):
+        loader = DataLoader(
+            IndexDataset(SAMPLE_NUM),
+            batch_size=BATCH_SIZE,
+            num_workers=2,
+            persistent_workers=True,
+        )
+        results = self.run_epochs(loader, break_at=8)
+        np.testing.assert_array_equal(results[0], np.arange(8 * BATCH_SIZE))
+        for epoch_data in results[1:]:
+            np.testing.assert_array_equal(epoch_data, np.arange(SAMPLE_NUM))
+
+    def test_shuffle(self):
+        batch_sampler = BatchSampler(
+            IndexDataset(SAMPLE_NUM), batch_size=BATCH_SIZE, shuffle=True
+        )
+        loader = DataLoader(
+            IndexDataset(SAMPLE_NUM),
+            batch_sampler=batch_sampler,
+            num_workers=2,
+            persistent_workers=True,
+        )
+        for epoch_data in self.run_epochs(loader):
+            np.testing.assert_array_equal(
+                np.sort(epoch_data), np.arange(SAMPLE_NUM)
+            )
+
+    def test_no_warm_prefetch_with_set_epoch(self):
+        dataset = IndexDataset(SAMPLE_NUM)
+        batch_sampler = DistributedBatchSampler(dataset, batch_size=BATCH_SIZE)
+        loader = DataLoader(
+            dataset,
+            batch_sampler=batch_sampler,
+            num_workers=2,
+            persistent_workers=True,
+        )
+        self.assertFalse(iter(loader)._warm_prefetch)
+        for epoch_data in self.run_epochs(loader):
+            np.testing.assert_array_equal(epoch_data, np.arange(SAMPLE_NUM))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,136 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import sys
+import unittest
+
+import numpy as np
+
+import paddle
+from paddle.fluid.dataloader.shm_ring import (
+    _create_slab_status,
+    _SharedMemorySlabReader,
+    _SharedMemorySlabRing,
+)
+from paddle.io import DataLoader, Dataset
+
+
+class RandomDataset(Dataset):
+    def __init__(self, sample_num):
+        self.sample_num = sample_num
+
+    def __getitem__(self, idx):
+        np.random.seed(idx)
+        image = np.random.random([3, 8, 8]).astype('float32')
+        label = np.array([idx]).astype('int64')
+        return image, label
+
+    def __len__(self):
+        return self.sample_num
+
+
+@unittest.skipIf(
+    sys.version_info < (3, 8), "shared_memory requires python 3.8+"
+)
+class TestSharedMemorySlabRing(unittest.TestCase):
+    def setUp(self):
+        self.status = _create_slab_status(2, 2)
+        self.ring = _SharedMemorySlabRing(1, 2, self.status)
+        self.reader = _SharedMemorySlabReader(self.status)
+
+    def tearDown(self):
+        self.reader.close()
+        self.ring.close()
+
+    def test_round_trip(self):
+        batch = [
+            np.random.random([4, 3]).astype('float32'),
+            np.arange(5).astype('int64'),
+            np.zeros([0, 2]).astype('float64'),
+        ]
+        slab_batch = self.ring.write(batch)
+        self.assertIsNotNone(slab_batch)
+        self.assertEqual(slab_batch.slab_id, 2)
+        self.assertEqual(self.status[slab_batch.slab_id], 1)
+
+        tensors = self.reader.read(slab_batch)
+        self.assertEqual(self.status[slab_batch.slab_id], 0)
+        for tensor, arr in zip(tensors, batch):
+            np.testing.assert_array_equal(np.array(tensor), arr)
+
+    def test_ring_exhausted(self):
+        batch = [np.ones([2, 2]).astype('float32')]
+        first = self.ring.write(batch)
+        second = self.ring.write(batch)
+        self.assertNotEqual(first.slab_id, second.slab_id)
+        # all slabs busy, caller should fall back
+        self.assertIsNone(self.ring.write(batch))
+
+        self.reader.release(first)
+        third = self.ring.write(batch)
+        self.assertEqual(third.slab_id, first.slab_id)
+        self.assertEqual(third.name, first.name)
+
+    def test_grow_slab(self):
+        small = self.ring.write([np.ones([2]).astype('float32')])
+        self.reader.read(small)
+        self.reader.read(self.ring.write([np.ones([2]).astype('float32')]))
+
+        large_arr = np.random.random([256, 256]).astype('float32')
+        large = self.ring.write([large_arr])
+        self.assertNotEqual(large.name, small.name)
+        np.testing.assert_array_equal(
+            np.array(self.reader.read(large)[0]), large_arr
+        )
+
+    def test_object_fallback(self):
+        self.assertIsNone(
+            self.ring.write([np.array(['a', None], dtype=object)])
+        )
+
+
+@unittest.skipIf(
+    sys.version_info < (3, 8), "shared_memory requires python 3.8+"
+)
+class TestDataLoaderWithShmRing(unittest.TestCase):
+    def setUp(self):
+        os.environ['FLAGS_dataloader_use_shm_ring'] = '1'
+
+    def tearDown(self):
+        del os.environ['FLAGS_dataloader_use_shm_ring']
+
+    def run_main(self, persistent_workers):
+        paddle.disable_static()
+        dataset = RandomDataset(40)
+        loader = DataLoader(
+            dataset,
+            batch_size=4,
+            num_workers=2,
+            persistent_workers=persistent_workers,
+        )
+        for _ in range(2):
+            labels = []
+            for image, label in loader():
+                self.assertEqual(image.shape, [4, 3, 8, 8])
+                labels.append(label.numpy().flatten())
+            np.testing.assert_array_equal(np.concatenate(labels), np.arange(40))
+
+    def test_main(self):
+        for persistent_workers in [False, True]:
+            self.run_main(persistent_workers)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,117 @@
+#   Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import numpy as np
+
+import paddle
+from paddle.fluid.executor import _get_strong_program_cache_key
+
+paddle.enable_static()
+
+
+class TestExecutorPrepare(unittest.TestCase):
+    def build_program(self):
+        main_program = paddle.static.Program()
+        startup_program = paddle.static.Program()
+        with paddle.static.program_guard(main_program, startup_program):
+            x = paddle.static.data(name='x', shape=[-1, 4], dtype='float32')
+            y = paddle.static.data(name='y', shape=[-1, 1], dtype='float32')
+            out = paddle.static.nn.fc(x, 1)
+            loss = paddle.mean(paddle.square(out - y))
+            paddle.optimizer.SGD(learning_rate=0.1).minimize(loss)
+        return main_program, startup_program, loss
+
+    def test_prepare(self):
+        main_program, startup_program, loss = self.build_program()
+        exe = paddle.static.Executor(paddle.CPUPlace())
+        feeds = [
+            {
+                'x': np.random.random([8, 4]).astype('float32'),
+                'y': np.random.random([8, 1]).astype('float32'),
+            }
+            for _ in range(3)
+        ]
+
+        paddle.seed(2023)
+        scope = paddle.static.Scope()
+        with paddle.static.scope_guard(scope):
+            exe.run(startup_program)
+            expected = [
+                exe.run(main_program, feed=feed, fetch_list=[loss])[0]
+                for feed in feeds
+            ]
+
+        paddle.seed(2023)
+        scope = paddle.static.Scope()
+        with paddle.static.scope_guard(scope):
+            exe.run(startup_program)
+        # names not in the program are ignored
+        with self.assertWarns(UserWarning):
+            prepared = exe.prepare(
+                main_program,
+                feed_names=['x', 'y', 'z'],
+                fetch_list=[loss],
+                scope=scope,
+            )
+        self.assertEqual(prepared.feed_names, ['x', 'y'])
+        for feed, expected_loss in zip(feeds, expected):
+            (loss_data,) = prepared.run(feed=feed)
+            np.testing.assert_allclose(loss_data, expected_loss, rtol=1e-6)
+
+        exe.close()
+        with self.assertRaises(RuntimeError):
+            prepared.run(feed=feeds[0])
+
+    def test_program_cache_key(self):
+        main_program, _, loss = self.build_program()
+        key = _get_strong_program_cache_key(main_program, {'x': None}, [loss])
+        self.assertEqual(
+            key,
+            _get_strong_program_cache_key(main_program, {'x': None}, [loss]),
+        )
+        self.assertNotEqual(
+            key, _get_strong_program_cache_key(main_program, {}, [loss])
+        )
+
+        # the key changes when the program is modified
+        with paddle.static.program_guard(main_program):
+            paddle.scale(loss, 2.0)
+        self.assertNotEqual(
+            key,
+            _get_strong_program_cache_key(main_program, {'x': None}, [loss]),
+        )
+
+        version = main_program._cache_version
+        main_program.global_block()._remove_op(
+            len(main_program.global_block().ops) - 1
+        )
+        self.assertGreater(main_program._cache_version, version)
+
+    def test_serialize_program(self):
+        main_program, _, loss = self.build_program()
+        x = main_program.global_block().var('x')
+        # Program._version() is still the version of the program desc
+        self.assertIsInstance(main_program._version(), int)
+        data = paddle.static.serialize_program(
+            [x], [loss], program=main_program
+        )
+        program = paddle.static.deserialize_program(data)
+        self.assertIn('x', program.global_block().vars)
+        self.assertIn(loss.name, program.global_block().vars)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,228 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import stat
+import sys
+import tempfile
+import unittest
+
+from paddle.distributed.fleet.utils.fs import FSTimeOut, HDFSClient
+
+# A fake `hadoop fs` which operates on the local file system, and logs every
+# invocation into $FAKE_HADOOP_LOG.
+FAKE_HADOOP = r'''#!{python}
+import os
+import shutil
+import sys
+
+with open(os.environ['FAKE_HADOOP_LOG'], 'a') as f:
+    f.write(' '.join(sys.argv[1:]) + '\n')
+
+if os.environ.get('FAKE_HADOOP_FAIL'):
+    sys.stderr.write("ls: Call to namenode failed on connection exception\n")
+    sys.exit(1)
+
+args = [a for a in sys.argv[2:] if not a.startswith('-D')]
+cmd, args = args[0], args[1:]
+
+
+def line(path):
+    mode = 'drwxr-xr-x' if os.path.isdir(path) else '-rw-r--r--'
+    print(mode, '-', 'user', 'group', 0, '2023-01-01', '00:00', path)
+
+
+def missing(name, path):
+    sys.stderr.write("%s: `%s': No such file or directory\n" % (name, path))
+    return 1
+
+
+ret = 0
+if cmd == '-ls':
+    only_self = args[0] == '-d'
+    for path in args[1:] if only_self else args:
+        if not os.path.exists(path):
+            ret = missing('ls', path)
+        elif only_self or not os.path.isdir(path):
+            line(path)
+        else:
+            for name in sorted(os.listdir(path)):
+                line(os.path.join(path, name))
+elif cmd == '-test':
+    check = os.path.isdir if args[0] == '-d' else os.path.exists
+    ret = 0 if check(args[1]) else 1
+elif cmd == '-mkdir':
+    for path in args[1:] if args[0] == '-p' else args:
+        if args[0] == '-p':
+            os.makedirs(path, exist_ok=True)
+        elif not os.path.exists(os.path.dirname(path)):
+            ret = missing('mkdir', path)
+        else:
+            os.mkdir(path)
+elif cmd == '-touchz':
+    open(args[0], 'a').close()
+elif cmd in ['-rm', '-rmr']:
+    if os.path.isdir(args[0]):
+        shutil.rmtree(args[0])
+    else:
+        os.remove(args[0])
+elif cmd == '-mv':
+    os.rename(args[0], args[1])
+elif cmd == '-cat':
+    with open(args[0]) as f:
+        sys.stdout.write(f.read())
+sys.exit(ret)
+'''
+
+
+class TestHDFSClientStatCache(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        hadoop_home = os.path.join(self.temp_dir.name, 'hadoop')
+        os.makedirs(os.path.join(hadoop_home, 'bin'))
+        hadoop_bin = os.path.join(hadoop_home, 'bin', 'hadoop')
+        with open(hadoop_bin, 'w') as f:
+            f.write(FAKE_HADOOP.replace('{python}', sys.executable))
+        os.chmod(hadoop_bin, os.stat(hadoop_bin).st_mode | stat.S_IEXEC)
+
+        self.log_path = os.path.join(self.temp_dir.name, 'hadoop.log')
+        os.environ['FAKE_HADOOP_LOG'] = self.log_path
+        self.hadoop_home = hadoop_home
+        self.root = os.path.join(self.temp_dir.name, 'fs')
+        os.makedirs(os.path.join(self.root, 'a', 'sub'))
+        open(os.path.join(self.root, 'a', 'file'), 'w').close()
+
+    def tearDown(self):
+        del os.environ['FAKE_HADOOP_LOG']
+        self.temp_dir.cleanup()
+
+    def path(self, *names):
+        return os.path.join(self.root, *names)
+
+    def num_calls(self):
+        if not os.path.exists(self.log_path):
+            return 0
+        with open(self.log_path) as f:
+            return len(f.readlines())
+
+    def client(self, **kwargs):
+        return HDFSClient(
+            self.hadoop_home,
+            {'fs.default.name': 'hdfs://fake'},
+            time_out=2000,
+            sleep_inter=100,
+            **kwargs,
+        )
+
+    def test_batch(self):
+        fs = self.client(long_lived=True)
+        paths = [self.path('a'), self.path('a', 'file'), self.path('none')]
+        self.assertEqual(fs.batch_is_exist(paths), [True, True, False])
+        self.assertEqual(fs.batch_is_dir(paths), [True, False, False])
+        self.assertEqual(self.num_calls(), 2)
+
+        self.assertEqual(
+            fs.batch_ls_dir(paths),
+            [(['sub'], ['file']), ([], ['file']), ([], [])],
+        )
+
+        fs.batch_mkdirs([self.path('b', 'c'), self.path('a'), self.path('d')])
+        self.assertTrue(os.path.isdir(self.path('b', 'c')))
+        self.assertTrue(os.path.isdir(self.path('d')))
+
+        # single path operations work as before
+        self.assertTrue(fs.is_file(self.path('a', 'file')))
+        self.assertEqual(fs.ls_dir(self.path('b')), (['c'], []))
+        self.assertEqual(fs.list_dirs(self.path('a')), ['sub'])
+
+    def test_stat_cache(self):
+        fs = self.client(stat_cache_ttl=60 * 1000, long_lived=True)
+        self.assertTrue(fs.is_dir(self.path('a')))
+        num_calls = self.num_calls()
+        self.assertTrue(fs.is_exist(self.path('a')))
+        self.assertFalse(fs.is_file(self.path('a')))
+        self.assertEqual(self.num_calls(), num_calls)
+
+        # children are cached by listing their parent
+        fs.ls_dir(self.path('a'))
+        num_calls = self.num_calls()
+        self.assertEqual(
+            fs.batch_is_dir([self.path('a', 'sub'), self.path('a', 'file')]),
+            [True, False],
+        )
+        self.assertEqual(self.num_calls(), num_calls)
+
+        # mutations of the client invalidate the cache
+        self.assertFalse(fs.is_exist(self.path('a', 'new')))
+        fs.touch(self.path('a', 'new'))
+        self.assertTrue(fs.is_file(self.path('a', 'new')))
+        fs.delete(self.path('a'))
+        self.assertFalse(fs.is_exist(self.path('a', 'sub')))
+        self.assertFalse(fs.is_exist(self.path('a')))
+        self.assertFalse(fs.is_exist(self.path('x')))
+        fs.batch_mkdirs([self.path('x', 'y')])
+        self.assertTrue(fs.is_dir(self.path('x')))
+        fs.mv(self.path('x'), self.path('z'))
+        self.assertFalse(fs.is_exist(self.path('x', 'y')))
+        self.assertTrue(fs.is_dir(self.path('z', 'y')))
+
+        # changes made by others are not seen until the cache expires
+        os.rmdir(self.path('z', 'y'))
+        self.assertTrue(fs.is_dir(self.path('z', 'y')))
+        fs._stat_cache.clear()
+        self.assertFalse(fs.is_dir(self.path('z', 'y')))
+
+    def test_failure_not_cached(self):
+        fs = self.client(stat_cache_ttl=60 * 1000)
+        # children listed by ls_dir are cached under the given path
+        fs.ls_dir(self.path('a'))
+        self.assertTrue(fs._stat_cache.get(self.path('a', 'sub'), 'dir'))
+
+        os.environ['FAKE_HADOOP_FAIL'] = '1'
+        try:
+            fs._time_out = 300
+            with self.assertRaises(FSTimeOut):
+                fs.batch_is_exist([self.path('b')])
+        finally:
+            del os.environ['FAKE_HADOOP_FAIL']
+        self.assertIsNone(fs._stat_cache.get(self.path('b'), 'exist'))
+
+        # only the paths reported as missing are cached as not existing
+        self.assertEqual(fs.batch_is_exist([self.path('b')]), [False])
+        self.assertIs(fs._stat_cache.get(self.path('b'), 'exist'), False)
+
+    def test_long_lived(self):
+        fs = self.client(long_lived=True)
+        with open(self.path('a', 'file'), 'w') as f:
+            f.write('line1\nline2')
+        # output without trailing newline is kept
+        self.assertEqual(fs.cat(self.path('a', 'file')), 'line1\nline2')
+        ret, _ = fs._run_cmd('test -e ' + self.path('none'), retry_times=0)
+        self.assertEqual(ret, 1)
+
+        # the shell is re-created after it exits
+        fs._session._proc.kill()
+        fs._session._proc.wait()
+        self.assertTrue(fs.is_exist(self.path('a')))
+
+    def test_shell_execute_cmd(self):
+        fs = self.client(stat_cache_ttl=60 * 1000)
+        self.assertEqual(
+            fs.batch_is_dir([self.path('a'), self.path('none')]), [True, False]
+        )
+        self.assertEqual(self.num_calls(), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
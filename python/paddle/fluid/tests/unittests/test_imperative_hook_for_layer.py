@@ -13,13 +13,16 @@
 # limitations under the License.
 
 import unittest
+from unittest import mock
 
 import numpy as np
 from test_imperative_lod_tensor_to_selected_rows import SimpleNet
 
+import paddle
 from paddle import fluid
 from paddle.fluid import core
 from paddle.fluid.dygraph import base
+from paddle.profiler import utils
 
 call_forward_post_hook = False
 call_forward_pre_hook = False
@@ -210,5 +213,43 @@ class Test_Forward_Hook(unittest.TestCase):
                 self.assertFalse(call_forward_pre_hook)
 
 
+class TestLayerCallState(unittest.TestCase):
+    def test_hook_registration(self):
+        with fluid.dygraph.guard(fluid.CPUPlace()):
+            linear = paddle.nn.Linear(2, 2)
+            x = paddle.ones([1, 2])
+            out = linear(x)
+            self.assertFalse(linear._has_forward_hooks)
+
+            helper = linear.register_forward_post_hook(forward_post_hook1)
+            self.assertTrue(linear._has_forward_hooks)
+            np.testing.assert_allclose(linear(x).numpy(), out.numpy() * 2)
+            helper.remove()
+            self.assertFalse(linear._has_forward_hooks)
+            np.testing.assert_allclose(linear(x).numpy(), out.numpy())
+
+            # hooks deleted directly are found by the slow path
+            linear.register_forward_pre_hook(lambda layer, input: input)
+            linear._forward_pre_hooks.clear()
+            np.testing.assert_allclose(linear(x).numpy(), out.numpy())
+            self.assertFalse(linear._has_forward_hooks)
+
+    def test_profiler_toggle(self):
+        with fluid.dygraph.guard(fluid.CPUPlace()):
+            linear = paddle.nn.Linear(2, 2)
+            x = paddle.ones([1, 2])
+            with mock.patch.object(
+                linear, '_dygraph_call_func', return_value=None
+            ) as slow_call:
+                linear(x)
+                self.assertEqual(slow_call.call_count, 0)
+                with mock.patch.object(utils, '_is_profiler_used', True):
+                    linear(x)
+                self.assertEqual(slow_call.call_count, 1)
+                with base._switch_declarative_mode_guard_(True):
+                    linear(x)
+                self.assertEqual(slow_call.call_count, 2)
+
+
 if __name__ == '__main__':
     unittest.main()
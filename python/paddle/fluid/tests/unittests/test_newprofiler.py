@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import json
 import os
 import tempfile
 import unittest
@@ -23,6 +24,7 @@ import paddle.nn.functional as F
 from paddle import nn, profiler
 from paddle.io import DataLoader, Dataset
 from paddle.profiler import utils
+from paddle.profiler.timer import benchmark
 
 
 class TestProfiler(unittest.TestCase):
@@ -425,5 +427,105 @@ class TestTimerOnly(unittest.TestCase):
         p.stop()
 
 
+class TestStepTelemetry(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        benchmark().disable_telemetry()
+        self.temp_dir.cleanup()
+
+    def train(self, steps):
+        dataset = RandomDataset(steps * 4)
+        simple_net = SimpleNet()
+        opt = paddle.optimizer.SGD(
+            learning_rate=1e-3, parameters=simple_net.parameters()
+        )
+        loader = DataLoader(dataset, batch_size=4, drop_last=True)
+        for image, label in loader():
+            with benchmark().phase('forward'):
+                out = simple_net(image)
+                avg_loss = paddle.mean(F.cross_entropy(out, label))
+            with benchmark().phase('backward'):
+                avg_loss.backward()
+            with benchmark().phase('optimizer'):
+                opt.minimize(avg_loss)
+                simple_net.clear_gradients()
+            benchmark().step(num_samples=4)
+
+    def test_ring_buffer(self):
+        path = os.path.join(self.temp_dir.name, 'telemetry.jsonl')
+        telemetry = benchmark().enable_telemetry(
+            capacity=8, export_path=path, export_interval=5
+        )
+        self.train(12)
+        records = telemetry.records()
+        self.assertEqual(records['step'].tolist(), list(range(4, 12)))
+        self.assertTrue(np.all(records['reader_cost'] > 0))
+        self.assertTrue(np.all(records['forward_cost'] > 0))
+        self.assertTrue(
+            np.all(records['batch_cost'] >= records['forward_cost'])
+        )
+        self.assertTrue(np.all(records['h2d_cost'] == 0))
+        percentiles = telemetry.percentiles()
+        self.assertLessEqual(
+            percentiles['batch_cost']['p50'], percentiles['batch_cost']['p99']
+        )
+
+        # exported at step 5 and 10, the rest is exported on disabling
+        benchmark().disable_telemetry()
+        with open(path) as f:
+            lines = [json.loads(line) for line in f]
+        self.assertEqual([line['step'] for line in lines], list(range(12)))
+        self.assertEqual(lines[0]['num_samples'], 4)
+        self.assertIsNone(benchmark().telemetry)
+
+    def test_prometheus(self):
+        path = os.path.join(self.temp_dir.name, 'telemetry.prom')
+        benchmark().enable_telemetry(
+            export_path=path,
+            export_format='prometheus',
+            export_interval=3,
+            labels={'rank': 1},
+        )
+        self.train(3)
+        with open(path) as f:
+            text = f.read()
+        self.assertIn('paddle_steps_total{rank="1"} 3', text)
+        self.assertIn(
+            'paddle_step_batch_cost_seconds{rank="1",quantile="0.95"}', text
+        )
+        self.assertIn('paddle_step_reader_cost_seconds_count{rank="1"} 3', text)
+
+    def test_hapi_fit(self):
+        telemetry = benchmark().enable_telemetry()
+        model = paddle.Model(
+            SimpleNet(),
+            inputs=[paddle.static.InputSpec([None, 100], 'float32', 'image')],
+            labels=[paddle.static.InputSpec([None, 1], 'int64', 'label')],
+        )
+        model.prepare(
+            paddle.optimizer.SGD(
+                learning_rate=1e-3, parameters=model.parameters()
+            ),
+            nn.CrossEntropyLoss(),
+        )
+        # steps are finished by hapi without Profiler
+        model.fit(RandomDataset(5 * 4), batch_size=4, epochs=1, verbose=0)
+        records = telemetry.records()
+        self.assertEqual(records['step'].tolist(), list(range(5)))
+        self.assertTrue(np.all(records['num_samples'] == 4))
+        self.assertTrue(np.all(records['forward_cost'] > 0))
+        self.assertTrue(np.all(records['optimizer_cost'] > 0))
+
+    def test_disabled(self):
+        self.assertIsNone(benchmark().telemetry)
+        with benchmark().phase('forward'):
+            pass
+        self.assertRaises(
+            ValueError, benchmark().enable_telemetry, export_format='csv'
+        )
+
+
 if __name__ == '__main__':
     unittest.main()
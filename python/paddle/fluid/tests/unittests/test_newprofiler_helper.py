@@ -14,6 +14,8 @@
 
 import unittest
 
+import numpy as np
+
 from paddle.profiler import statistic_helper
 
 
@@ -130,6 +132,37 @@ class TestStatisticHelper(unittest.TestCase):
         dst = statistic_helper.subtract_ranges(src1, src2)
         self.assertEqual(dst, [(10, 11)])
 
+    def test_random_ranges(self):
+        def covered(ranges):
+            mask = np.zeros([200], dtype=bool)
+            for start, end in ranges:
+                mask[start:end] = True
+            return mask
+
+        rng = np.random.RandomState(2023)
+        for _ in range(20):
+            starts1 = rng.randint(0, 150, size=[100])
+            src1 = np.stack([starts1, starts1 + rng.randint(1, 30, 100)], 1)
+            starts2 = rng.randint(0, 150, size=[80])
+            src2 = np.stack([starts2, starts2 + rng.randint(1, 30, 80)], 1)
+            mask1 = covered(src1)
+            mask2 = covered(src2)
+
+            dst = statistic_helper.merge_self_ranges(src1)
+            np.testing.assert_array_equal(covered(dst), mask1)
+            self.assertTrue(
+                all(r1[1] < r2[0] for r1, r2 in zip(dst[:-1], dst[1:]))
+            )
+            dst = statistic_helper.merge_ranges(src1, src2)
+            np.testing.assert_array_equal(covered(dst), mask1 | mask2)
+            dst = statistic_helper.intersection_ranges(src1, src2)
+            np.testing.assert_array_equal(covered(dst), mask1 & mask2)
+            self.assertEqual(
+                statistic_helper.sum_ranges(dst), np.sum(mask1 & mask2)
+            )
+            dst = statistic_helper.subtract_ranges(src1, src2)
+            np.testing.assert_array_equal(covered(dst), mask1 & ~mask2)
+
 
 if __name__ == '__main__':
     unittest.main()
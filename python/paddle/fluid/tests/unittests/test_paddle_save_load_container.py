@@ -0,0 +1,145 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import tempfile
+import unittest
+from io import BytesIO
+
+import numpy as np
+
+import paddle
+from paddle import nn
+
+
+class LinearNet(nn.Layer):
+    def __init__(self):
+        super().__init__()
+        self._linear = nn.Linear(16, 8)
+        self._linear_fp16 = nn.Linear(8, 4)
+
+    def forward(self, x):
+        return self._linear_fp16(self._linear(x))
+
+
+class TestSaveLoadTensorContainer(unittest.TestCase):
+    def setUp(self):
+        paddle.disable_static()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, 'model.pdparams')
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def build_state(self):
+        layer = LinearNet()
+        layer._linear_fp16.to(dtype='float16')
+        state_dict = layer.state_dict()
+        obj = {
+            'model': state_dict,
+            'epoch': 10,
+            'array': np.arange(12).reshape([3, 4]),
+            'list': [paddle.to_tensor([1.0, 2.0]), 'str', (1, 2)],
+            'scalar': paddle.to_tensor(3.0),
+            'empty': paddle.zeros([0, 3]),
+        }
+        return layer, state_dict, obj
+
+    def check_state_dict(self, loaded, state_dict):
+        self.assertEqual(list(loaded.keys()), list(state_dict.keys()))
+        for key, value in state_dict.items():
+            self.assertEqual(loaded[key].name, value.name)
+            self.assertEqual(loaded[key].dtype, value.dtype)
+            np.testing.assert_array_equal(loaded[key].numpy(), value.numpy())
+
+    def test_save_load(self):
+        layer, state_dict, obj = self.build_state()
+        paddle.save(obj, self.path, use_tensor_container=True)
+
+        for mmap in [False, True]:
+            loaded = paddle.load(self.path, mmap=mmap)
+            self.check_state_dict(loaded['model'], state_dict)
+            self.assertEqual(loaded['epoch'], 10)
+            self.assertIsInstance(loaded['array'], np.ndarray)
+            np.testing.assert_array_equal(loaded['array'], obj['array'])
+            np.testing.assert_array_equal(loaded['list'][0].numpy(), [1, 2])
+            self.assertEqual(loaded['list'][1:], ['str', (1, 2)])
+            self.assertEqual(loaded['scalar'].shape, [])
+            self.assertEqual(loaded['empty'].shape, [0, 3])
+
+        layer.set_state_dict(paddle.load(self.path, mmap=True)['model'])
+
+    def test_mmap_copy_on_write(self):
+        _, state_dict, obj = self.build_state()
+        paddle.save(obj, self.path, use_tensor_container=True)
+        loaded = paddle.load(self.path, mmap=True)
+        key = list(state_dict.keys())[0]
+        self.assertTrue(loaded['model'][key].place.is_cpu_place())
+        loaded['model'][key].set_value(
+            np.zeros(state_dict[key].shape, dtype='float32')
+        )
+        reloaded = paddle.load(self.path)
+        np.testing.assert_array_equal(
+            reloaded['model'][key].numpy(), state_dict[key].numpy()
+        )
+
+    def test_partial_load(self):
+        _, state_dict, obj = self.build_state()
+        paddle.save(obj, self.path, use_tensor_container=True)
+        loaded = paddle.load(self.path, keys=['epoch', 'array'])
+        self.assertEqual(list(loaded.keys()), ['epoch', 'array'])
+        with self.assertRaises(KeyError):
+            paddle.load(self.path, keys=['not_exist'])
+
+        # keys also works on the pickle format by filtering the result
+        pickle_path = os.path.join(self.temp_dir.name, 'pickle.pdparams')
+        paddle.save(state_dict, pickle_path)
+        key = list(state_dict.keys())[-1]
+        loaded = paddle.load(pickle_path, keys=[key])
+        self.assertEqual(list(loaded.keys()), [key])
+
+    def test_return_numpy(self):
+        _, state_dict, obj = self.build_state()
+        paddle.save(obj, self.path, use_tensor_container=True)
+        loaded = paddle.load(self.path, return_numpy=True)
+        for key, value in state_dict.items():
+            self.assertIsInstance(loaded['model'][key], np.ndarray)
+            np.testing.assert_array_equal(loaded['model'][key], value.numpy())
+
+    def test_memory_buffer(self):
+        _, state_dict, obj = self.build_state()
+        byio = BytesIO()
+        paddle.save(state_dict, byio, use_tensor_container=True)
+        paddle.save(obj, byio, use_tensor_container=True)
+        byio.seek(0)
+        self.check_state_dict(paddle.load(byio), state_dict)
+        self.assertEqual(paddle.load(byio)['epoch'], 10)
+
+        byio.seek(0)
+        with self.assertRaises(ValueError):
+            paddle.load(byio, mmap=True)
+
+    def test_mmap_pickle_format(self):
+        _, state_dict, _ = self.build_state()
+        paddle.save(state_dict, self.path)
+        with self.assertRaises(ValueError):
+            paddle.load(self.path, mmap=True)
+
+    def test_save_layer(self):
+        with self.assertRaises(ValueError):
+            paddle.save(LinearNet(), self.path, use_tensor_container=True)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -37,6 +37,11 @@ from paddle.fluid.framework import (
     _varbase_creator,
 )
 
+from .io_container import (
+    _is_tensor_container,
+    _load_tensor_container,
+    _save_tensor_container,
+)
 from .io_utils import (
     _is_file_path,
     _is_memory_buffer,
@@ -228,6 +233,8 @@ def _parse_load_config(configs):
         'params_filename',
         'keep_name_table',
         'return_numpy',
+        'mmap',
+        'keys',
     ]
 
     # input check
@@ -248,12 +255,22 @@ def _parse_load_config(configs):
     inner_config.params_filename = configs.get('params_filename', None)
     inner_config.keep_name_table = configs.get('keep_name_table', None)
     inner_config.return_numpy = configs.get('return_numpy', False)
+    inner_config.mmap = configs.get('mmap', False)
+    inner_config.keys = configs.get('keys', None)
+    if inner_config.keys is not None and not isinstance(
+        inner_config.keys, (list, tuple)
+    ):
+        inner_config.keys = [inner_config.keys]
 
     return inner_config
 
 
 def _parse_save_config(configs):
-    supported_configs = ['use_binary_format', 'pickle_protocol']
+    supported_configs = [
+        'use_binary_format',
+        'pickle_protocol',
+        'use_tensor_container',
+    ]
 
     # input check
     for key in configs:
@@ -271,6 +288,9 @@ def _parse_save_config(configs):
     inner_config = _SaveLoadConfig()
     inner_config.use_binary_format = configs.get('use_binary_format', False)
     inner_config.pickle_protocol = configs.get('pickle_protocol', None)
+    inner_config.use_tensor_container = configs.get(
+        'use_tensor_container', False
+    )
 
     return inner_config
 
@@ -669,6 +689,10 @@ def save(obj, path, protocol=4, **configs):
           use_binary_format(bool): When the saved object is static graph variable, you can specify ``use_binary_for_var``.
           If True, save the file in the c++ binary format when saving a single static graph variable; otherwise, save it in pickle format.
           Default: False
+          use_tensor_container(bool): If True, save the object in tensor container format, tensors in the object are written
+          as aligned raw data straight from tensor memory without converting to numpy copies, and only a small index is pickled.
+          A file in tensor container format can be loaded partially by ``keys`` or memory mapped by ``mmap`` in ``paddle.load`` .
+          Default: False
 
     Returns:
         None
@@ -818,6 +842,10 @@ def save(obj, path, protocol=4, **configs):
             with _open_file_buffer(path, "wb") as f:
                 f.write(obj.desc.serialize_to_string())
 
+        elif config.use_tensor_container:
+            with _open_file_buffer(path, 'wb') as f:
+                _save_tensor_container(obj, f, protocol)
+
         elif _is_state_dict(obj):
             if _non_static_mode():
                 _legacy_save(obj, path, protocol)
@@ -930,6 +958,10 @@ def load(path, **configs):
             by default.
             (3) return_numpy(bool): If specified as True, return tensor as numpy.ndarray, otherwise return tensor as paddle.Tensor.
             Default False.
+            (4) mmap(bool): Only for files saved with ``use_tensor_container=True`` . If specified as True, tensors are returned
+            as CPU tensors backed by a copy-on-write memory map of the file, data is paged in lazily when it is accessed. Default False.
+            (5) keys(list): Only load the given top-level keys of the saved dict. For files saved with ``use_tensor_container=True`` ,
+            only the bytes of tensors under the given keys are read. Default None.
 
     Returns:
         Object(Object): a target object can be used in paddle
@@ -1053,6 +1085,14 @@ def load(path, **configs):
     if _is_memory_buffer(path) or os.path.isfile(path):
         config = _parse_load_config(configs)
         exception_type = pickle.UnpicklingError
+        with _open_file_buffer(path, 'rb') as f:
+            if _is_tensor_container(f):
+                return _load_tensor_container(path, f, config)
+        if config.mmap:
+            raise ValueError(
+                "`mmap=True` of `paddle.load` only supports files saved with "
+                "`use_tensor_container=True`."
+            )
         try:
             with _open_file_buffer(path, 'rb') as f:
                 # When value of dict is lager than 4GB ,there is a Bug on 'MAC python3'
@@ -1124,6 +1164,12 @@ def load(path, **configs):
     else:
         load_result = _legacy_load(path, **configs)
 
+    if isinstance(load_result, dict) and configs.get('keys', None) is not None:
+        keys = configs['keys']
+        if not isinstance(keys, (list, tuple)):
+            keys = [keys]
+        load_result = type(load_result)((k, load_result[k]) for k in keys)
+
     return load_result
 
 
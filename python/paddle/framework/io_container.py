@@ -0,0 +1,278 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# NOTE: [ tensor container format ]
+# The tensor container is a single file laid out as:
+#
+#   | prefix | header | padding | blob 0 | padding | blob 1 | ... |
+#
+# prefix: magic, format version and header length, see _PREFIX_STRUCT.
+# header: a pickled dict of
+#   - records: one (kind, name, dtype, shape, offset, nbytes) tuple for
+#     each tensor, offset is relative to the start of the first blob.
+#   - skeleton: pickled bytes of the saved object, in which every tensor
+#     is replaced by a persistent id pointing to its record.
+# blob: raw data of a tensor in C order, each blob is _ALIGNMENT aligned
+#   so that blobs can be viewed through a memory map without copying.
+#
+# Tensors are written one by one straight from their memory, and loading
+# reads (or maps) only the blobs referenced by the requested keys.
+
+import io
+import pickle
+import struct
+
+import numpy as np
+
+import paddle
+from paddle.fluid import core
+from paddle.fluid.data_feeder import _PADDLE_DTYPE_2_NUMPY_DTYPE
+from paddle.fluid.framework import (
+    EagerParamBase,
+    _current_expected_place,
+    _non_static_mode,
+)
+
+from .io_utils import _is_file_path
+
+__all__ = []
+
+_MAGIC = b'PDTENSOR'
+_VERSION = 1
+_ALIGNMENT = 64
+# magic, version, reserved, header length
+_PREFIX_STRUCT = struct.Struct('<8sIIQ')
+
+_KIND_TENSOR = 'tensor'
+_KIND_LOD_TENSOR = 'lod_tensor'
+_KIND_NDARRAY = 'ndarray'
+
+
+def _align(offset):
+    return (offset + _ALIGNMENT - 1) // _ALIGNMENT * _ALIGNMENT
+
+
+def _dense_numpy_dtype(dense):
+    return np.dtype(_PADDLE_DTYPE_2_NUMPY_DTYPE[dense._dtype()])
+
+
+class _ContainerPickler(pickle.Pickler):
+    def __init__(self, f, protocol):
+        super().__init__(f, protocol)
+        self.records = []
+        self.sources = []
+
+    def _add_record(self, kind, name, dtype, shape, source):
+        nbytes = int(np.prod(shape, dtype=np.int64)) * dtype.itemsize
+        self.records.append([kind, name, dtype.str, tuple(shape), 0, nbytes])
+        self.sources.append(source)
+        return len(self.records) - 1
+
+    def persistent_id(self, obj):
+        if isinstance(obj, (core.eager.Tensor, EagerParamBase)):
+            dense = obj.value().get_tensor()
+            return self._add_record(
+                _KIND_TENSOR,
+                obj.name,
+                _dense_numpy_dtype(dense),
+                dense.shape(),
+                dense,
+            )
+        elif isinstance(obj, core.LoDTensor):
+            return self._add_record(
+                _KIND_LOD_TENSOR,
+                None,
+                _dense_numpy_dtype(obj),
+                obj.shape(),
+                obj,
+            )
+        elif isinstance(obj, np.ndarray) and not obj.dtype.hasobject:
+            return self._add_record(
+                _KIND_NDARRAY, None, obj.dtype, obj.shape, obj
+            )
+        elif isinstance(obj, paddle.nn.Layer):
+            raise ValueError(
+                "paddle do not support saving `paddle.nn.Layer` object."
+            )
+        return None
+
+
+def _write_blob(f, source):
+    # NOTE: np.asarray on a CPU DenseTensor returns a view of the tensor
+    # memory, tensors on other places are copied to host one at a time
+    arr = np.ascontiguousarray(np.asarray(source))
+    f.write(arr.reshape(-1).view(np.uint8).data)
+
+
+def _save_tensor_container(obj, f, protocol):
+    pickler_buffer = io.BytesIO()
+    pickler = _ContainerPickler(pickler_buffer, protocol)
+    pickler.dump(obj)
+
+    offset = 0
+    for record in pickler.records:
+        offset = _align(offset)
+        record[4] = offset
+        offset += record[5]
+
+    header = pickle.dumps(
+        {
+            'records': [tuple(r) for r in pickler.records],
+            'skeleton': pickler_buffer.getvalue(),
+        },
+        protocol=protocol,
+    )
+    f.write(_PREFIX_STRUCT.pack(_MAGIC, _VERSION, 0, len(header)))
+    f.write(header)
+    written = _PREFIX_STRUCT.size + len(header)
+    data_start = _align(written)
+    f.write(b'\0' * (data_start - written))
+
+    written = 0
+    for record, source in zip(pickler.records, pickler.sources):
+        f.write(b'\0' * (record[4] - written))
+        _write_blob(f, source)
+        written = record[4] + record[5]
+
+
+def _is_tensor_container(f):
+    pos = f.tell()
+    magic = f.read(len(_MAGIC))
+    f.seek(pos)
+    return magic == _MAGIC
+
+
+class _TensorRef:
+    def __init__(self, index):
+        self.index = index
+
+
+class _ContainerUnpickler(pickle.Unpickler):
+    def persistent_load(self, pid):
+        return _TensorRef(pid)
+
+
+class _ContainerReader:
+    def __init__(self, path, f, use_mmap):
+        self._f = f
+        start = f.tell()
+        magic, version, _, header_len = _PREFIX_STRUCT.unpack(
+            f.read(_PREFIX_STRUCT.size)
+        )
+        if version > _VERSION:
+            raise ValueError(
+                "The tensor container version {} of file {} is not supported "
+                "by current paddle, which supports version <= {}.".format(
+                    version, path, _VERSION
+                )
+            )
+        header = pickle.loads(f.read(header_len), encoding='latin1')
+        self.records = header['records']
+        self.skeleton = header['skeleton']
+        self._data_start = start + _align(_PREFIX_STRUCT.size + header_len)
+        self._data_end = self._data_start + max(
+            [r[4] + r[5] for r in self.records], default=0
+        )
+
+        self._mmap = None
+        if use_mmap:
+            # copy-on-write mapping, pages are read lazily when tensors are
+            # accessed, and in-place updates never go back to the file
+            self._mmap = np.memmap(path, dtype=np.uint8, mode='c')
+
+    def read_array(self, index):
+        kind, name, dtype, shape, offset, nbytes = self.records[index]
+        dtype = np.dtype(dtype)
+        begin = self._data_start + offset
+        if self._mmap is not None:
+            return self._mmap[begin : begin + nbytes].view(dtype).reshape(shape)
+        arr = np.empty(shape, dtype=dtype)
+        self._f.seek(begin)
+        self._f.readinto(arr.reshape(-1).view(np.uint8).data)
+        return arr
+
+    def finish(self):
+        # leave the file position at the end of container, so that objects
+        # saved one after another into the same buffer can be loaded in turn
+        self._f.seek(self._data_end)
+
+
+def _to_loaded_tensor(arr, kind, name, config, zero_copy):
+    if kind == _KIND_NDARRAY or config.return_numpy:
+        return arr
+
+    if zero_copy:
+        tensor = core.LoDTensor()
+        tensor.set(arr, core.CPUPlace(), True)
+    else:
+        tensor = core.LoDTensor()
+        tensor.set(arr, _current_expected_place())
+
+    if not _non_static_mode():
+        return tensor
+    var = core.eager.Tensor()
+    var.value().get_tensor()._share_data_with(tensor)
+    if name is not None:
+        # This function does modify the name of return value.
+        # Loading the same variable multiple times may cause the same name.
+        var.name = name
+    return var
+
+
+def _materialize(obj, reader, config):
+    if isinstance(obj, _TensorRef):
+        kind, name = reader.records[obj.index][:2]
+        arr = reader.read_array(obj.index)
+        return _to_loaded_tensor(arr, kind, name, config, zero_copy=config.mmap)
+    elif isinstance(obj, dict):
+        for key in obj:
+            obj[key] = _materialize(obj[key], reader, config)
+        return obj
+    elif isinstance(obj, list):
+        for i, value in enumerate(obj):
+            obj[i] = _materialize(value, reader, config)
+        return obj
+    elif isinstance(obj, tuple):
+        values = [_materialize(v, reader, config) for v in obj]
+        # namedtuple is constructed with positional fields
+        if hasattr(obj, '_fields'):
+            return type(obj)(*values)
+        return type(obj)(values)
+    return obj
+
+
+def _load_tensor_container(path, f, config):
+    if config.mmap and not _is_file_path(path):
+        raise ValueError(
+            "`mmap=True` of `paddle.load` only supports loading from file path."
+        )
+    reader = _ContainerReader(path, f, config.mmap)
+    obj = _ContainerUnpickler(io.BytesIO(reader.skeleton)).load()
+
+    if config.keys is not None:
+        if not isinstance(obj, dict):
+            raise ValueError(
+                "`keys` of `paddle.load` requires the saved object to be a "
+                "dict, but received {}.".format(type(obj))
+            )
+        missing = [key for key in config.keys if key not in obj]
+        if missing:
+            raise KeyError(
+                "Keys {} are not found in file {}.".format(missing, path)
+            )
+        obj = type(obj)((key, obj[key]) for key in config.keys)
+
+    obj = _materialize(obj, reader, config)
+    reader.finish()
+    return obj
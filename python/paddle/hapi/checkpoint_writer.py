@@ -0,0 +1,155 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import atexit
+import copy
+import os
+import queue
+import threading
+
+from paddle.fluid import core
+
+__all__ = []
+
+
+def _snapshot_tensor(tensor):
+    # copy device tensors into page-locked host memory so that the copy
+    # is fast and the background writer never touches device memory
+    if tensor.place.is_gpu_place():
+        place = core.CUDAPinnedPlace()
+    else:
+        place = core.CPUPlace()
+    snapshot = tensor._copy_to(place, True)
+    snapshot.name = tensor.name
+    return snapshot
+
+
+def _snapshot_state(state):
+    """
+    Take a snapshot of a (nested) state, tensors are copied to host and
+    other values are deep copied, so that training can go on updating
+    parameters and optimizer states while the snapshot is being written.
+    """
+    if isinstance(state, core.eager.Tensor):
+        return _snapshot_tensor(state)
+    elif isinstance(state, dict):
+        return type(state)((k, _snapshot_state(v)) for k, v in state.items())
+    elif isinstance(state, (list, tuple)):
+        return type(state)(_snapshot_state(v) for v in state)
+    return copy.deepcopy(state)
+
+
+def _save_dygraph_state(obj, path):
+    # NOTE: same as `paddle.save` in dygraph mode, but independent of the
+    # graph mode, which is thread local and may not be dygraph mode in the
+    # background writer thread
+    from paddle.framework.io import _is_state_dict, _legacy_save, _pickle_save
+
+    if _is_state_dict(obj):
+        _legacy_save(obj, path, protocol=4)
+    else:
+        with open(path, 'wb') as f:
+            _pickle_save(obj, f, protocol=4)
+
+
+def _fsync(path):
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _atomic_save(save_fn, obj, path):
+    # write to a temporary file in the same directory then rename it, so
+    # that readers never see a partially written checkpoint
+    tmp_path = f'{path}.tmp.{os.getpid()}'
+    try:
+        save_fn(obj, tmp_path)
+        _fsync(tmp_path)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+class _AsyncCheckpointWriter:
+    """
+    Write checkpoints in a background thread.
+
+    Each call of :code:`submit` is one checkpoint, which may consist of
+    several files (e.g. parameters and optimizer states), and files of a
+    checkpoint are saved atomically one by one. At most
+    :attr:`max_pending` checkpoints are outstanding, :code:`submit` blocks
+    until an earlier checkpoint finishes if the limit is reached.
+
+    Errors raised in the background thread are re-raised on the next
+    :code:`submit` or :code:`wait` calling.
+
+    Args:
+        max_pending(int): max number of outstanding checkpoints. Default 1.
+    """
+
+    def __init__(self, max_pending=1):
+        assert max_pending > 0, "max_pending should be a positive value"
+        self._pending = threading.BoundedSemaphore(max_pending)
+        self._jobs = queue.Queue()
+        self._error = None
+        self._thread = threading.Thread(target=self._loop)
+        self._thread.daemon = True
+        self._thread.start()
+        # NOTE: the writer thread is a daemon thread, wait for the pending
+        # checkpoints at exit, otherwise they would be lost silently
+        atexit.register(self.wait)
+
+    def _loop(self):
+        while True:
+            files = self._jobs.get()
+            try:
+                for save_fn, obj, path in files:
+                    _atomic_save(save_fn, obj, path)
+            except Exception as e:
+                if self._error is None:
+                    self._error = e
+            finally:
+                self._pending.release()
+                self._jobs.task_done()
+
+    def _raise_error(self):
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise RuntimeError(
+                "Saving checkpoint in background failed."
+            ) from error
+
+    def submit(self, files):
+        """
+        Submit a checkpoint to write.
+
+        Args:
+            files(list): a list of (save_fn, obj, path) tuples, :code:`obj`
+                is written by calling :code:`save_fn(obj, path)` in the
+                background thread, so :code:`obj` should be a snapshot
+                which will not be modified by training any more.
+        """
+        self._raise_error()
+        self._pending.acquire()
+        self._jobs.put(files)
+
+    def wait(self):
+        """
+        Block until all submitted checkpoints are written.
+        """
+        self._jobs.join()
+        self._raise_error()
@@ -38,9 +38,16 @@ from paddle.framework.io_utils import is_belong_to_optimizer
 from paddle.io import DataLoader, Dataset, DistributedBatchSampler
 from paddle.jit.translated_layer import INFER_MODEL_SUFFIX, INFER_PARAMS_SUFFIX
 from paddle.metric import Metric
+from paddle.metric.metrics import _all_reduce_states
+from paddle.profiler.timer import benchmark
 from paddle.static import InputSpec as Input
 
 from .callbacks import EarlyStopping, config_callbacks
+from .checkpoint_writer import (
+    _AsyncCheckpointWriter,
+    _save_dygraph_state,
+    _snapshot_state,
+)
 from .model_summary import summary
 
 __all__ = []
@@ -319,17 +326,21 @@ class StaticGraphAdapter:
         self.mode = 'test'
         return self._run(inputs, None)
 
+    def all_reduce_metrics(self):
+        # outputs and labels are gathered in the program for metrics
+        return False
+
     def parameters(self, *args, **kwargs):
         return self.model.network.parameters(*args, **kwargs)
 
-    def save(self, path):
-        def _save(state, path):
-            if not state:
-                return
-            state = {
+    def save(self, path, writer=None):
+        def _snapshot(state):
+            return {
                 k: to_numpy(v) if isinstance(v, Variable) else v
                 for k, v in state.items()
             }
+
+        def _dump(state, path):
             with open(path, 'wb') as f:
                 pickle.dump(state, f)
 
@@ -338,20 +349,28 @@ class StaticGraphAdapter:
         dir_name = os.path.dirname(path)
         if dir_name and not os.path.exists(dir_name):
             os.makedirs(dir_name)
-        param_path = path + ".pdparams"
-        _save(self.model.network.state_dict(), param_path)
+
+        files = []
+        param_state = self.model.network.state_dict()
+        if param_state:
+            files.append((_dump, _snapshot(param_state), path + ".pdparams"))
         prog = self._progs.get('train', None)
-        if prog is None or self.model._optimizer is None:
-            return
-        # XXX `optimizer.state_dict()` only work in dygraph mode
-        optim_path = path + ".pdopt"
-        optim = {
-            p.name: p for p in filter(is_belong_to_optimizer, prog.list_vars())
-        }
-        if not optim:
-            return
+        if prog is not None and self.model._optimizer is not None:
+            # XXX `optimizer.state_dict()` only work in dygraph mode
+            optim = {
+                p.name: p
+                for p in filter(is_belong_to_optimizer, prog.list_vars())
+            }
+            if optim:
+                files.append((_dump, _snapshot(optim), path + ".pdopt"))
 
-        _save(optim, optim_path)
+        # states are fetched from scope as numpy arrays, which are already
+        # snapshots, only dumping is done in background
+        if writer is not None:
+            writer.submit(files)
+        else:
+            for save_fn, state, file_path in files:
+                save_fn(state, file_path)
 
     # TODO: support save/load scaler state in static graph
     def load(self, param_state_pairs, optim_state):
@@ -791,37 +810,45 @@ class DynamicGraphAdapter:
         inputs = to_list(inputs)
         self._input_info = _update_input_info(inputs)
         labels = labels or []
-        labels = [to_variable(l) for l in to_list(labels)]
 
         # scaler should be initialized only once
         if self._amp_level != "O0" and self.model._scaler is None:
             self.model._scaler = paddle.amp.GradScaler(**self._amp_configs)
 
-        with paddle.amp.auto_cast(
-            enable=self._amp_level != 'O0',
-            **self._amp_custom_lists,
-            level=self._amp_level,
-        ):
-            if self._nranks > 1:
-                outputs = self.ddp_model(*[to_variable(x) for x in inputs])
-            else:
-                outputs = self.model.network(*[to_variable(x) for x in inputs])
+        with benchmark().phase('h2d'):
+            inputs = [to_variable(x) for x in inputs]
+            labels = [to_variable(l) for l in to_list(labels)]
 
-        losses = self.model._loss(*(to_list(outputs) + labels))
-        losses = to_list(losses)
-        final_loss = paddle.add_n(losses)
+        with benchmark().phase('forward'):
+            with paddle.amp.auto_cast(
+                enable=self._amp_level != 'O0',
+                **self._amp_custom_lists,
+                level=self._amp_level,
+            ):
+                if self._nranks > 1:
+                    outputs = self.ddp_model(*inputs)
+                else:
+                    outputs = self.model.network(*inputs)
+
+            losses = self.model._loss(*(to_list(outputs) + labels))
+            losses = to_list(losses)
+            final_loss = paddle.add_n(losses)
 
         if self._amp_level != "O0":
-            scaled = self.model._scaler.scale(final_loss)
-            scaled.backward()
+            with benchmark().phase('backward'):
+                scaled = self.model._scaler.scale(final_loss)
+                scaled.backward()
             if update:
-                self.model._scaler.minimize(self.model._optimizer, scaled)
-                self.model.network.clear_gradients()
+                with benchmark().phase('optimizer'):
+                    self.model._scaler.minimize(self.model._optimizer, scaled)
+                    self.model.network.clear_gradients()
         else:
-            final_loss.backward()
+            with benchmark().phase('backward'):
+                final_loss.backward()
             if update:
-                self.model._optimizer.minimize(final_loss)
-                self.model.network.clear_gradients()
+                with benchmark().phase('optimizer'):
+                    self.model._optimizer.minimize(final_loss)
+                    self.model.network.clear_gradients()
 
         metrics = []
         for metric in self.model._metrics:
@@ -857,7 +884,8 @@ class DynamicGraphAdapter:
             losses = self.model._loss(*(to_list(outputs) + labels))
             losses = to_list(losses)
 
-        if self._nranks > 1:
+        reduce_states = self._reduce_metric_states()
+        if self._nranks > 1 and not reduce_states:
             outputs = [_all_gather(o) for o in to_list(outputs)]
             labels = [_all_gather(l) for l in labels]
         metrics = []
@@ -870,14 +898,24 @@ class DynamicGraphAdapter:
             ):
                 total_size = len(self.model._test_dataloader.dataset)
                 samples = outputs[0].shape[0]
+                local_samples = samples
+                if reduce_states:
+                    # outputs are not gathered, this rank holds the rows
+                    # [rank * samples, (rank + 1) * samples) of the
+                    # gathered batch
+                    samples = samples * self._nranks
                 current_count = self._merge_count.get(self.mode + '_total', 0)
                 if current_count + samples >= total_size:
-                    outputs = [
-                        o[: int(total_size - current_count)] for o in outputs
-                    ]
-                    labels = [
-                        l[: int(total_size - current_count)] for l in labels
-                    ]
+                    num_valid = int(total_size - current_count)
+                    if reduce_states:
+                        num_valid = min(
+                            max(
+                                num_valid - self._local_rank * local_samples, 0
+                            ),
+                            local_samples,
+                        )
+                    outputs = [o[:num_valid] for o in outputs]
+                    labels = [l[:num_valid] for l in labels]
                     self._merge_count[self.mode + '_total'] = 0
                     self._merge_count[self.mode + '_batch'] = int(
                         total_size - current_count
@@ -897,6 +935,20 @@ class DynamicGraphAdapter:
         else:
             return metrics
 
+    def _reduce_metric_states(self):
+        # metrics supporting Metric.states are updated with outputs of this
+        # rank and all reduced once by all_reduce_metrics after evaluation,
+        # instead of gathering outputs and labels of every batch
+        return self._nranks > 1 and all(
+            metric.states() is not None for metric in self.model._metrics
+        )
+
+    def all_reduce_metrics(self):
+        if not self.model._metrics or not self._reduce_metric_states():
+            return False
+        _all_reduce_states(self.model._metrics)
+        return True
+
     def predict_batch(self, inputs):
         self.model.network.eval()
         self.mode = 'test'
@@ -911,17 +963,29 @@ class DynamicGraphAdapter:
     def parameters(self, *args, **kwargs):
         return self.model.network.parameters(*args, **kwargs)
 
-    def save(self, path):
-        params = self.model.network.state_dict()
-        paddle.save(params, path + '.pdparams')
+    def save(self, path, writer=None):
+        states = [(self.model.network.state_dict(), path + '.pdparams')]
         if self.model._optimizer is not None:
             if self.model._optimizer.state_dict():
                 optim = self.model._optimizer.state_dict()
-                paddle.save(optim, path + '.pdopt')
+                states.append((optim, path + '.pdopt'))
         if hasattr(self.model, '_scaler') and self.model._scaler is not None:
             if self.model._scaler.state_dict():
                 scaler = self.model._scaler.state_dict()
-                paddle.save(scaler, path + '.pdscaler')
+                states.append((scaler, path + '.pdscaler'))
+
+        if writer is not None:
+            # only host snapshots are taken here, serializing and writing
+            # files are done in background
+            writer.submit(
+                [
+                    (_save_dygraph_state, _snapshot_state(state), file_path)
+                    for state, file_path in states
+                ]
+            )
+        else:
+            for state, file_path in states:
+                paddle.save(state, file_path)
 
     def load(self, param_state_pairs, optim_state, scaler_state=None):
         # restore parameter states
@@ -1137,6 +1201,7 @@ class Model:
         self._input_info = None
         self._is_shape_inferred = False
         self._test_dataloader = None
+        self._checkpoint_writer = None
         self.stop_training = False
 
         if not _non_static_mode():
@@ -1314,7 +1379,7 @@ class Model:
             self._update_inputs()
         return loss
 
-    def save(self, path, training=True):
+    def save(self, path, training=True, async_save=False):
         """
 
         This function saves parameters, optimizer information or model and
@@ -1337,6 +1402,13 @@ class Model:
                 A exception will be raised.
             training (bool, optional): Whether to save for training. If not, save
                 for inference only. Default: True.
+            async_save (bool, optional): Whether to save for training asynchronously.
+                If True, only a host snapshot of parameters and optimizer states is
+                taken before returning, and files are written in a background thread
+                and renamed to the target location atomically on completion. At most
+                one asynchronous save is outstanding, a new saving waits until the
+                previous one finishes. Pending saves are waited in :code:`load` and
+                at exit. Only works when `training` is True. Default: False.
 
         Returns:
             None
@@ -1390,9 +1462,17 @@ class Model:
         if paddle.distributed.ParallelEnv().local_rank == 0:
             if not training:
                 self._save_inference_model(path)
+            elif async_save:
+                if self._checkpoint_writer is None:
+                    self._checkpoint_writer = _AsyncCheckpointWriter()
+                self._adapter.save(path, self._checkpoint_writer)
             else:
                 self._adapter.save(path)
 
+    def _wait_async_save(self):
+        if self._checkpoint_writer is not None:
+            self._checkpoint_writer.wait()
+
     def load(self, path, skip_mismatch=False, reset_optimizer=False):
         """
 
@@ -1446,6 +1526,9 @@ class Model:
 
         """
 
+        # wait for pending asynchronous saves which may write the same files
+        self._wait_async_save()
+
         def _load_state_from_path(path):
             if not os.path.exists(path):
                 return
@@ -2307,6 +2390,9 @@ class Model:
                 assert len(self._metrics_name()) == len(metrics)
                 for k, v in zip(self._metrics_name(), metrics):
                     logs[k] = v
+
+                if mode == 'train':
+                    benchmark().telemetry_step(batch_size)
             else:
                 if self._inputs is not None:
                     outs = self.predict_batch(data[: len(self._inputs)])
@@ -2333,6 +2419,15 @@ class Model:
                     self.stop_training = True
                     del self.num_iters
                     break
+
+        if mode == 'eval' and self._adapter.all_reduce_metrics():
+            # metrics logged in steps are of this rank only, update them
+            # with the metrics of all ranks
+            metrics = []
+            for metric in self._metrics:
+                metrics.extend(to_list(metric.accumulate()))
+            for k, v in zip(self._metrics_name()[-len(metrics) :], metrics):
+                logs[k] = v
         self._reset_metrics()
 
         if mode == 'predict':
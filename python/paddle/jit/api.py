@@ -219,7 +219,12 @@ def ignore_module(modules: list[Any]):
 
 
 def to_static(
-    function=None, input_spec=None, build_strategy=None, property=False
+    function=None,
+    input_spec=None,
+    build_strategy=None,
+    property=False,
+    shape_buckets=None,
+    max_programs=None,
 ):
     """
     Converts imperative dygraph APIs into declarative function APIs. Decorator
@@ -239,6 +244,14 @@ def to_static(
             of the computational graph. For more information about build_strategy,
             please refer to :code:`paddle.static.BuildStrategy`. The default is None.
         property(bool, Optional): whether the fucntion is python property. The default is False.
+        shape_buckets(list[dict]|None, Optional): bucket boundaries of the positional input Tensors to reuse
+            programs for inputs with dynamic shapes. Each element is None or a dict of ``{axis: boundaries}``
+            for the input at the same position, the size of each axis in the dict is padded with zeros at the
+            end to the smallest boundary not less than it, so inputs in the same bucket share one program. The
+            size greater than all boundaries is not padded. Outputs are computed from the padded inputs, use a
+            mask or slice the outputs if the padding matters. The default is None.
+        max_programs(int|None, Optional): max number of programs cached for the function, the least recently
+            used program is evicted if more programs are traced. The default is None, which means no limit.
 
 
     Returns:
@@ -262,6 +275,14 @@ def to_static(
             x_v = func(x)
             print(x_v) # [[2. 2.]]
 
+            # sequences of length 1~16 share one program, and so do 17~32
+            @to_static(shape_buckets=[{1: [16, 32]}], max_programs=4)
+            def embed(ids):
+                return paddle.nn.functional.one_hot(ids, 8)
+
+            out = embed(paddle.ones([2, 10], dtype='int64'))
+            print(out.shape) # [2, 16, 8]
+
     """
 
     def decorated(python_func):
@@ -279,6 +300,8 @@ def to_static(
                 input_spec=input_spec,
                 build_strategy=build_strategy,
                 property=property,
+                shape_buckets=shape_buckets,
+                max_programs=max_programs,
             ),
         )
 
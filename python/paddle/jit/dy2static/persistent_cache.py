@@ -0,0 +1,381 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# NOTE: [ dy2static persistent cache ]
+# If environment variable `FLAGS_jit_cache_dir` is set, the results of
+# dy2static are also cached on disk under it, so that new processes can
+# skip the translation:
+#
+#   code/<key>.pkl: the transformed source code of a function and its
+#     origin information, keyed by the source code of the function.
+#   program/<key>.pkl: the serialized main and startup programs of a
+#     ConcreteProgram with its inputs, outputs and parameter names, keyed
+#     by the source files of the function and all layers it belongs to,
+#     the input specs and the parameters.
+#
+# Both keys contain the paddle version. Other code called by the function
+# which is not in these source files is not tracked, clear the cache
+# directory after changing it.
+
+import hashlib
+import inspect
+import os
+import pickle
+import threading
+
+import paddle
+from paddle.fluid import framework
+from paddle.fluid.dygraph.base import switch_to_static_graph
+from paddle.nn.layer import layers
+from paddle.utils import flatten, pack_sequence_as
+
+from . import logging_utils
+from .origin_info import Location, OriginInfo, global_origin_info_map
+from .utils import func_to_source_code, prim_or_cinn_is_enabled, unwrap
+
+__all__ = []
+
+CACHE_DIR_ENV_NAME = 'FLAGS_jit_cache_dir'
+# bump it when the layout of cached records changes
+_CACHE_FORMAT_VERSION = 1
+
+_CODE_DIR = 'code'
+_PROGRAM_DIR = 'program'
+
+# {(path, mtime, size): digest}
+_file_digests = {}
+_file_digests_lock = threading.Lock()
+
+
+class _Uncacheable(Exception):
+    pass
+
+
+class _VarName:
+    """
+    Placeholder of a Variable in the cached inputs and outputs structure.
+    """
+
+    __slots__ = ['name']
+
+    def __init__(self, name):
+        self.name = name
+
+    def __getstate__(self):
+        return self.name
+
+    def __setstate__(self, state):
+        self.name = state
+
+
+def get_cache_dir():
+    return os.environ.get(CACHE_DIR_ENV_NAME) or None
+
+
+def _paddle_version():
+    try:
+        from paddle import version
+
+        commit = version.commit
+    except (ImportError, AttributeError):
+        commit = ''
+    return '{}-{}'.format(paddle.__version__, commit)
+
+
+def _digest(*parts):
+    sha = hashlib.sha256()
+    sha.update(repr((_CACHE_FORMAT_VERSION, _paddle_version())).encode())
+    for part in parts:
+        if not isinstance(part, bytes):
+            part = repr(part).encode()
+        sha.update(part)
+    return sha.hexdigest()
+
+
+def _cache_file(kind, key):
+    return os.path.join(get_cache_dir(), kind, key + '.pkl')
+
+
+def _read_record(path):
+    try:
+        with open(path, 'rb') as f:
+            return pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logging_utils.warn(
+            "Failed to read dy2static cache file {}, ignore it: {}".format(
+                path, e
+            )
+        )
+        return None
+
+
+def _write_record(path, record):
+    # write to a temporary file and rename it, so that concurrent processes
+    # never read a partially written record
+    tmp_path = '{}.tmp.{}'.format(path, os.getpid())
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(record, f, protocol=4)
+        os.replace(tmp_path, path)
+    except Exception as e:
+        logging_utils.warn(
+            "Failed to write dy2static cache file {}: {}".format(path, e)
+        )
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def _file_digest(path):
+    stat = os.stat(path)
+    file_key = (path, stat.st_mtime_ns, stat.st_size)
+    with _file_digests_lock:
+        digest = _file_digests.get(file_key)
+    if digest is None:
+        with open(path, 'rb') as f:
+            digest = hashlib.sha256(f.read()).hexdigest()
+        with _file_digests_lock:
+            _file_digests[file_key] = digest
+    return digest
+
+
+def _source_file_digest(obj):
+    try:
+        path = inspect.getsourcefile(obj)
+    except TypeError:
+        path = None
+    if path is None or not os.path.isfile(path):
+        raise _Uncacheable()
+    return path, _file_digest(path)
+
+
+def _spec_signature(spec):
+    if isinstance(spec, paddle.static.InputSpec):
+        # NOTE: same as hashing in memory, names are not considered, they
+        # are usually generated names of tensors and differ among processes
+        return (tuple(spec.shape), str(spec.dtype), spec.stop_gradient)
+    elif isinstance(spec, (list, tuple)):
+        return (type(spec).__name__,) + tuple(_spec_signature(s) for s in spec)
+    elif isinstance(spec, dict):
+        return tuple(
+            (repr(k), _spec_signature(v))
+            for k, v in sorted(spec.items(), key=lambda kv: repr(kv[0]))
+        )
+    elif spec is None or isinstance(spec, (bool, int, float, str)):
+        return repr(spec)
+    # repr of other objects is not guaranteed to be the same in another
+    # process, e.g. it may contain the object address
+    raise _Uncacheable()
+
+
+def _layer_signature(class_instance):
+    if class_instance is None:
+        return None
+    sublayers = []
+    for name, layer in class_instance.named_sublayers(include_self=True):
+        sublayers.append(
+            (
+                name,
+                type(layer).__qualname__,
+                _source_file_digest(type(layer)),
+                layer.training,
+            )
+        )
+    tensors = [
+        (t.name, tuple(t.shape), str(t.dtype), t.stop_gradient)
+        for t in class_instance.parameters() + class_instance.buffers()
+    ]
+    return sublayers, tensors
+
+
+def _program_key(cache_key):
+    if prim_or_cinn_is_enabled(cache_key.kwargs.get('build_strategy')):
+        # programs are rewritten by hooks when prim or cinn is enabled
+        return None
+    function = unwrap(cache_key.function_spec.dygraph_function)
+    try:
+        return _digest(
+            getattr(function, '__module__', None),
+            getattr(function, '__qualname__', None),
+            func_to_source_code(function),
+            _source_file_digest(function),
+            _spec_signature(cache_key.input_args_with_spec),
+            _spec_signature(cache_key.input_kwargs_with_spec),
+            cache_key._spec_names_id,
+            cache_key.kwargs.get('with_hook', False),
+            cache_key.kwargs.get('is_train', False),
+            _layer_signature(cache_key.class_instance),
+        )
+    except (_Uncacheable, OSError, TypeError):
+        return None
+
+
+def load_transformed_code(source_code):
+    """
+    Returns the cached (transformed source code, origin info records) of the
+    function with :attr:`source_code`, or None if it is not cached.
+    """
+    if get_cache_dir() is None:
+        return None
+    record = _read_record(_cache_file(_CODE_DIR, _digest(source_code)))
+    if record is None:
+        return None
+    return record['code'], record['origin_info']
+
+
+def save_transformed_code(source_code, static_code, origin_info_map, func):
+    """
+    Caches the transformed source code of function :attr:`func`. Origin
+    info is saved with line numbers relative to the function, so that it
+    can be restored after the function is moved in its file.
+    """
+    if get_cache_dir() is None:
+        return
+    lineno_offset = inspect.getsourcelines(unwrap(func))[1] - 1
+    origin_info = [
+        (
+            static_loc[1],
+            info.location.lineno - lineno_offset,
+            info.location.col_offset,
+            info.function_name,
+            info.source_code,
+        )
+        for static_loc, info in origin_info_map.items()
+    ]
+    _write_record(
+        _cache_file(_CODE_DIR, _digest(source_code)),
+        {'code': static_code, 'origin_info': origin_info},
+    )
+
+
+def restore_origin_info(origin_info, func, static_file):
+    """
+    Updates the global origin info map with the cached origin info records
+    of :attr:`func`, which is loaded from :attr:`static_file`.
+    """
+    func = unwrap(func)
+    filepath = inspect.getsourcefile(func)
+    lineno_offset = inspect.getsourcelines(func)[1] - 1
+    for static_lineno, lineno, col_offset, func_name, code in origin_info:
+        location = Location(filepath, lineno + lineno_offset, col_offset)
+        global_origin_info_map[(static_file, static_lineno)] = OriginInfo(
+            location, func_name, code
+        )
+
+
+def _to_var_names(structure):
+    values = [
+        _VarName(v.name) if isinstance(v, framework.Variable) else v
+        for v in flatten(structure)
+    ]
+    return pack_sequence_as(structure, values)
+
+
+def _to_vars(structure, block):
+    values = [
+        block.var(v.name) if isinstance(v, _VarName) else v
+        for v in flatten(structure)
+    ]
+    return pack_sequence_as(structure, values)
+
+
+def save_concrete_program(cache_key, concrete_program):
+    """
+    Caches the programs of :attr:`concrete_program` built for
+    :attr:`cache_key`.
+    """
+    if get_cache_dir() is None:
+        return
+    key = _program_key(cache_key)
+    if key is None:
+        return
+
+    inputs = concrete_program.inputs
+    if cache_key.class_instance is not None:
+        inputs = inputs[1:]
+    main_program = concrete_program.main_program
+    startup_program = concrete_program.startup_program
+    record = {
+        'main_program': main_program.desc.serialize_to_string(),
+        'startup_program': startup_program.desc.serialize_to_string(),
+        'inputs': _to_var_names(list(inputs)),
+        'outputs': _to_var_names(concrete_program.outputs),
+        'parameters': [p.name for p in concrete_program.parameters],
+    }
+    try:
+        # non-Variable inputs and outputs should be picklable
+        pickle.dumps(record, protocol=4)
+    except Exception:
+        return
+    _write_record(_cache_file(_PROGRAM_DIR, key), record)
+
+
+@switch_to_static_graph
+def _parse_programs(main_binary, startup_binary):
+    main_program = framework.Program.parse_from_string(main_binary)
+    startup_program = framework.Program.parse_from_string(startup_binary)
+    # NOTE: the random seed is synchronized as building a new program
+    main_program.random_seed = framework.default_main_program().random_seed
+    startup_program.random_seed = (
+        framework.default_startup_program().random_seed
+    )
+    return main_program, startup_program
+
+
+def load_concrete_program(cache_key):
+    """
+    Returns the cached ConcreteProgram for :attr:`cache_key`, or None if it
+    is not cached.
+    """
+    if get_cache_dir() is None:
+        return None
+    key = _program_key(cache_key)
+    if key is None:
+        return None
+    record = _read_record(_cache_file(_PROGRAM_DIR, key))
+    if record is None:
+        return None
+
+    class_instance = cache_key.class_instance
+    tensors = {}
+    if isinstance(class_instance, layers.Layer):
+        for tensor in class_instance.parameters() + class_instance.buffers():
+            tensors[tensor.name] = tensor
+    if any(name not in tensors for name in record['parameters']):
+        return None
+    parameters = [tensors[name] for name in record['parameters']]
+
+    main_program, startup_program = _parse_programs(
+        record['main_program'], record['startup_program']
+    )
+    block = main_program.global_block()
+    inputs = _to_vars(record['inputs'], block)
+    if class_instance is not None:
+        inputs = [class_instance] + inputs
+    outputs = _to_vars(record['outputs'], block)
+
+    from .program_translator import ConcreteProgram
+
+    return ConcreteProgram(
+        inputs=tuple(inputs),
+        outputs=outputs,
+        parameters=parameters,
+        function=cache_key.function_spec.dygraph_function,
+        main_program=main_program,
+        startup_program=startup_program,
+        **cache_key.kwargs,
+    )
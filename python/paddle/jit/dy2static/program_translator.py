@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import bisect
 import collections
 import inspect
 import textwrap
@@ -19,6 +20,9 @@ import threading
 import warnings
 import weakref
 
+import numpy as np
+
+import paddle
 from paddle.amp.auto_cast import _in_amp_guard
 from paddle.fluid import _non_static_mode, core, framework
 from paddle.fluid.data_feeder import check_type
@@ -30,7 +34,7 @@ from paddle.fluid.dygraph.base import (
 from paddle.nn.layer import layers
 from paddle.utils import flatten, gast
 
-from . import error, logging_utils
+from . import error, logging_utils, persistent_cache
 from .ast_transformer import DygraphToStaticAst
 from .function_spec import (
     FunctionSpec,
@@ -46,13 +50,13 @@ from .origin_info import (
 from .partial_program import PartialProgramLayerHook, partial_program_from
 from .utils import (
     ALREADY_D2S,
-    ast_to_func,
     ast_to_source_code,
     func_to_source_code,
     input_specs_compatible,
     is_paddle_func,
     make_hashable,
     prim_or_cinn_is_enabled,
+    source_to_func,
     type_name,
     unwrap,
 )
@@ -119,6 +123,9 @@ class FunctionCache:
 
         If the conversion of A.foo happens after B.foo, it will reuse the transformed ast node of B.foo
         to speed up the conversion.
+
+        If the persistent cache is enabled, the transformed code is also cached on disk and reused
+        by other processes, see `persistent_cache.py` for details.
         """
         # Note: In Python2, it will raise OSError when inspect function
         # with decorator directly and function.__wrapped__ holds the actual function.
@@ -129,18 +136,37 @@ class FunctionCache:
         #  Consider this case: source_code in self._code_to_ast_caches,
         #  but actually they are methods in different classes.
         #  Maybe use (__class__, source_code) as key
+        is_transformed = False
         if source_code in self._code_to_ast_caches:
             root_wrapper = self._code_to_ast_caches[source_code]
         else:
+            cached = persistent_cache.load_transformed_code(source_code)
+            if cached is not None:
+                static_code, origin_info = cached
+                static_func, file_name = source_to_func(static_code, func)
+                persistent_cache.restore_origin_info(
+                    origin_info, func, file_name
+                )
+                return static_func
+
             root = gast.parse(source_code)
             root = attach_origin_info(root, func)
             root_wrapper = self._dygraph_to_static.get_static_ast(root)
             self._code_to_ast_caches[source_code] = root_wrapper
+            is_transformed = True
 
         # Get static function from AST
-        static_func, file_name = ast_to_func(root_wrapper.node, func)
+        static_code = ast_to_source_code(root_wrapper.node)
+        static_func, file_name = source_to_func(static_code, func)
 
-        create_and_update_origin_info_map(root_wrapper.node, static_func)
+        origin_info_map = create_and_update_origin_info_map(
+            root_wrapper.node, static_func, is_global=False
+        )
+        # only the newly transformed code is saved, not the cache hits
+        if is_transformed:
+            persistent_cache.save_transformed_code(
+                source_code, static_code, origin_info_map, func
+            )
         return static_func
 
     def exist(self, func):
@@ -280,6 +306,71 @@ class CacheKey:
         )
 
 
+def _check_shape_buckets(shape_buckets):
+    """
+    Checks `shape_buckets` of `StaticFunction` and returns it with sorted
+    bucket boundaries.
+    """
+    if shape_buckets is None:
+        return None
+    if not isinstance(shape_buckets, (list, tuple)):
+        raise TypeError(
+            "shape_buckets should be a list or tuple, but received {}.".format(
+                type_name(shape_buckets)
+            )
+        )
+    checked = []
+    for axis_buckets in shape_buckets:
+        if axis_buckets is None:
+            checked.append(None)
+            continue
+        if not isinstance(axis_buckets, dict):
+            raise TypeError(
+                "Each element of shape_buckets should be None or a dict of {{axis: boundaries}}, but received {}.".format(
+                    type_name(axis_buckets)
+                )
+            )
+        sorted_buckets = {}
+        for axis, boundaries in axis_buckets.items():
+            if not isinstance(axis, int) or not all(
+                isinstance(b, int) and b > 0 for b in boundaries
+            ):
+                raise ValueError(
+                    "The axis and bucket boundaries in shape_buckets should be int and positive int, but received {}: {}.".format(
+                        axis, boundaries
+                    )
+                )
+            sorted_buckets[axis] = sorted(set(boundaries))
+        checked.append(sorted_buckets)
+    return checked
+
+
+def _pad_to_buckets(value, axis_buckets):
+    """
+    Pads Tensor or numpy.ndarray `value` with zeros at the end of each axis
+    in `axis_buckets` to the smallest bucket boundary not less than its
+    size. The size greater than all boundaries is kept.
+    """
+    if isinstance(value, np.ndarray):
+        concat = np.concatenate
+        zeros = np.zeros
+    elif isinstance(value, core.eager.Tensor):
+        concat = paddle.concat
+        zeros = paddle.zeros
+    else:
+        return value
+
+    for axis, boundaries in axis_buckets.items():
+        shape = list(value.shape)
+        size = shape[axis]
+        idx = bisect.bisect_left(boundaries, size)
+        if idx == len(boundaries) or boundaries[idx] == size:
+            continue
+        shape[axis] = boundaries[idx] - size
+        value = concat([value, zeros(shape, dtype=value.dtype)], axis=axis)
+    return value
+
+
 def unwrap_decorators(func):
     """
     Unwraps a decorated function and returns the decorator list and inner target.
@@ -313,8 +404,14 @@ class StaticFunction:
         Args:
             function(callable): A function or method that will be converted into static program.
             input_spec(list[InputSpec]): list of InputSpec to specify the `shape/dtype/name` information for each input argument, default None.
-            **kwargs(dict): other arguments like `build_strategy` et.al.
+            **kwargs(dict): other arguments like `build_strategy` et.al. `shape_buckets` and `max_programs`
+                are described in `paddle.jit.to_static`.
         """
+        self._shape_buckets = _check_shape_buckets(
+            kwargs.pop("shape_buckets", None)
+        )
+        self._max_programs = kwargs.pop("max_programs", None)
+
         # save the instance `self` while decorating a method of class.
 
         if inspect.ismethod(function):
@@ -348,7 +445,7 @@ class StaticFunction:
 
         self._input_spec = input_spec
         self._function_spec = FunctionSpec(function, input_spec)
-        self._program_cache = ProgramCache()
+        self._program_cache = ProgramCache(self._max_programs)
         self._descriptor_cache = weakref.WeakKeyDictionary()
         # Note: Hold a reference to ProgramTranslator for switching `enable_to_static`.
         self._program_trans = ProgramTranslator()
@@ -426,7 +523,11 @@ class StaticFunction:
 
     def _clone(self):
         return self.__class__(
-            self.dygraph_function, self._input_spec, **self._kwargs
+            self.dygraph_function,
+            self._input_spec,
+            shape_buckets=self._shape_buckets,
+            max_programs=self._max_programs,
+            **self._kwargs,
         )
 
     def __call__(self, *args, **kwargs):
@@ -467,6 +568,8 @@ class StaticFunction:
 
         # 2. trace ops from dygraph layers and cache the generated program.
         args, kwargs = self._function_spec.unified_args_and_kwargs(args, kwargs)
+        if self._shape_buckets is not None:
+            args = self._pad_args_to_buckets(args)
 
         try:
             concrete_program, partial_program_layer = self.get_concrete_program(
@@ -502,6 +605,17 @@ class StaticFunction:
                 )
                 raise e
 
+    def _pad_args_to_buckets(self, args):
+        """
+        Pads positional arguments to their shape buckets, so that inputs
+        in the same bucket reuse one program.
+        """
+        args = list(args)
+        for i, axis_buckets in enumerate(self._shape_buckets[: len(args)]):
+            if axis_buckets:
+                args[i] = _pad_to_buckets(args[i], axis_buckets)
+        return tuple(args)
+
     def _is_train_mode(self):
         if self._class_instance is not None:
             if not hasattr(self._class_instance, 'training'):
@@ -1174,9 +1288,19 @@ class ProgramCache:
 
     dy2static_error_file = "to_static.error"
 
-    def __init__(self):
-        # {hash_id : (concrete_program, partial_layer)}
+    def __init__(self, max_size=None):
+        # {hash_id : (concrete_program, partial_layer)}, ordered from least
+        # to most recently used
         self._caches = collections.OrderedDict()
+        # evict the least recently used program if more than `max_size`
+        # programs are cached, None means no limit
+        if max_size is not None and max_size < 1:
+            raise ValueError(
+                "max_size of ProgramCache should be a positive value or None, but received {}.".format(
+                    max_size
+                )
+            )
+        self._max_size = max_size
         # trace mostly recent used program
         self._recent_key = None
         self._recent_cache_key = None
@@ -1190,13 +1314,18 @@ class ProgramCache:
         enable_fallback = enable_prim
         core.check_and_set_prim_all_enabled()
         try:
-            concrete_program = ConcreteProgram.from_func_spec(
-                func_spec=cache_key.function_spec,
-                input_spec=cache_key.input_args_with_spec,
-                input_kwargs_spec=cache_key.input_kwargs_with_spec,
-                class_instance=cache_key.class_instance,
-                **cache_key.kwargs,
-            )
+            concrete_program = persistent_cache.load_concrete_program(cache_key)
+            if concrete_program is None:
+                concrete_program = ConcreteProgram.from_func_spec(
+                    func_spec=cache_key.function_spec,
+                    input_spec=cache_key.input_args_with_spec,
+                    input_kwargs_spec=cache_key.input_kwargs_with_spec,
+                    class_instance=cache_key.class_instance,
+                    **cache_key.kwargs,
+                )
+                persistent_cache.save_concrete_program(
+                    cache_key, concrete_program
+                )
         except Exception as e:
             if enable_fallback:
                 warnings.warn(
@@ -1243,11 +1372,19 @@ class ProgramCache:
         item_id = hash(item)
         self._recent_cache_key = item
         self._recent_key = item_id
-        if item_id not in self._caches:
+        if item_id in self._caches:
+            self._caches.move_to_end(item_id)
+        else:
             self._caches[item_id] = self._build_once(item)
+            if self._max_size is not None:
+                while len(self._caches) > self._max_size:
+                    self._caches.popitem(last=False)
             # Note: raise warnings if number of traced program is more than `max_tracing_count`
             current_tracing_count = len(self._caches)
-            if current_tracing_count > MAX_TRACED_PROGRAM_COUNT:
+            if (
+                self._max_size is None
+                and current_tracing_count > MAX_TRACED_PROGRAM_COUNT
+            ):
                 logging_utils.warn(
                     "Current traced program number: {} > `max_tracing_count`:{}. Too much cached programs will bring expensive overhead. "
                     "The reason may be: (1) passing tensors with different shapes, (2) passing python objects instead of tensors.".format(
@@ -1271,6 +1408,7 @@ class ProgramCache:
             raise RuntimeError(
                 "Failed to find program for input item, please decorate input function by `@paddle.jit.to_static`."
             )
+        self._caches.move_to_end(item_id)
         return self._caches[item_id]
 
     def last(self):
@@ -1283,6 +1421,10 @@ class ProgramCache:
     def __len__(self):
         return len(self._caches)
 
+    @property
+    def max_size(self):
+        return self._max_size
+
     def concrete_programs(self):
         return [cp for key, (cp, _) in self._caches.items()]
 
@@ -534,6 +534,15 @@ def ast_to_func(ast_root, dyfunc, delete_on_exit=True):
     TODO: If only decorate one of inner function instead of decorating the main
     function, the other inner functions are invisible for the decorated function.
     """
+    source = ast_to_source_code(ast_root)
+    return source_to_func(source, dyfunc, delete_on_exit)
+
+
+def source_to_func(source, dyfunc, delete_on_exit=True):
+    """
+    Transform source code of transformed decorated function into python
+    callable object.
+    """
 
     def remove_if_exit(dir_path):
         if os.path.exists(dir_path):
@@ -548,7 +557,6 @@ def ast_to_func(ast_root, dyfunc, delete_on_exit=True):
                 pass
         return pre_fix
 
-    source = ast_to_source_code(ast_root)
     source = _inject_import_statements() + source
     temp_dir = get_temp_dir()
     f = tempfile.NamedTemporaryFile(
@@ -17,6 +17,7 @@ from .metrics import Accuracy  # noqa: F401
 from .metrics import Precision  # noqa: F401
 from .metrics import Recall  # noqa: F401
 from .metrics import Auc  # noqa: F401
+from .metrics import WindowedMetric  # noqa: F401
 from .metrics import accuracy  # noqa: F401
 
 __all__ = [  # noqa
@@ -25,5 +26,6 @@ __all__ = [  # noqa
     'Precision',
     'Recall',
     'Auc',
+    'WindowedMetric',
     'accuracy',
 ]
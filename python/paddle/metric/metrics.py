@@ -162,6 +162,79 @@ class Metric(metaclass=abc.ABCMeta):
             )
         )
 
+    def states(self):
+        """
+        Returns the sufficient statistics of the metric as a dict of numpy
+        arrays in fixed shapes, which can be summed element-wise to merge
+        metrics of several workers, e.g. the correct and total counts of
+        accuracy. Returns None if the metric does not support it, which is
+        the default.
+
+        Metrics supporting it should also implement :code:`set_states`, and
+        then :code:`merge` and :code:`all_reduce` work with them.
+        """
+        return None
+
+    def set_states(self, states):
+        """
+        Set the sufficient statistics of the metric, see :code:`states`.
+
+        Args:
+            states (dict): the statistics in the same format as the
+                return value of :code:`states`.
+        """
+        raise NotImplementedError(
+            "function 'set_states' not implemented in {}.".format(
+                self.__class__.__name__
+            )
+        )
+
+    def merge(self, other):
+        """
+        Merge the statistics of another metric of the same type and
+        configuration into this one.
+
+        Args:
+            other (Metric): the metric to merge.
+
+        Return:
+            Metric: this metric.
+        """
+        states = self.states()
+        other_states = other.states() if isinstance(other, Metric) else None
+        if (
+            states is None
+            or type(other) is not type(self)
+            or other_states is None
+            or states.keys() != other_states.keys()
+            or any(
+                np.shape(states[k]) != np.shape(other_states[k]) for k in states
+            )
+        ):
+            raise ValueError(
+                "Only {} with the same configuration can be merged.".format(
+                    self.__class__.__name__
+                )
+            )
+        self.set_states({k: states[k] + other_states[k] for k in states})
+        return self
+
+    def all_reduce(self, group=None):
+        """
+        Sum the statistics of the metric across all workers in
+        :attr:`group` with one collective call, so that
+        :code:`accumulate` returns the metric of the data of all workers.
+
+        Args:
+            group (Group, optional): the communication group. Default None,
+                means the global group.
+
+        Return:
+            Metric: this metric.
+        """
+        _all_reduce_states([self], group)
+        return self
+
     def compute(self, *args):
         """
         This API is advanced usage to accelerate metric calculating, calulations
@@ -184,6 +257,47 @@ class Metric(metaclass=abc.ABCMeta):
         return args
 
 
+def _all_reduce_states(metrics, group=None):
+    """
+    Sum the states of all :attr:`metrics` across workers, the states are
+    packed into one float64 tensor so that only one collective call is
+    issued however many metrics there are.
+    """
+    all_states = []
+    for metric in metrics:
+        states = metric.states()
+        if states is None:
+            raise ValueError(
+                "{} does not support reducing its states.".format(
+                    metric.__class__.__name__
+                )
+            )
+        all_states.append({k: np.asarray(v) for k, v in states.items()})
+    arrays = [
+        v.astype(np.float64).reshape([-1])
+        for states in all_states
+        for v in states.values()
+    ]
+    if not arrays:
+        return
+
+    buffer = paddle.to_tensor(np.concatenate(arrays))
+    paddle.distributed.all_reduce(buffer, group=group)
+    buffer = buffer.numpy()
+
+    offset = 0
+    for metric, states in zip(metrics, all_states):
+        reduced = {}
+        for k, v in states.items():
+            reduced[k] = (
+                buffer[offset : offset + v.size]
+                .reshape(v.shape)
+                .astype(v.dtype)
+            )
+            offset += v.size
+        metric.set_states(reduced)
+
+
 class Accuracy(Metric):
     """
     Encapsulates accuracy metric logic.
@@ -291,12 +405,23 @@ class Accuracy(Metric):
         Return:
             Tensor: the accuracy of current step.
         """
-        if isinstance(correct, (paddle.Tensor, paddle.fluid.core.eager.Tensor)):
-            correct = np.array(correct)
         num_samples = np.prod(np.array(correct.shape[:-1]))
+        if isinstance(correct, (paddle.Tensor, paddle.fluid.core.eager.Tensor)):
+            # reduce the mask on device, and only copy the correct counts
+            # of the top 1 to the top maxk predictions to host
+            num_corrects_topk = paddle.cumsum(
+                paddle.sum(
+                    paddle.reshape(correct, [-1, correct.shape[-1]]), axis=0
+                )
+            ).numpy()
+        else:
+            num_corrects_topk = None
         accs = []
         for i, k in enumerate(self.topk):
-            num_corrects = correct[..., :k].sum()
+            if num_corrects_topk is not None:
+                num_corrects = num_corrects_topk[k - 1]
+            else:
+                num_corrects = correct[..., :k].sum()
             accs.append(float(num_corrects) / num_samples)
             self.total[i] += num_corrects
             self.count[i] += num_samples
@@ -310,6 +435,19 @@ class Accuracy(Metric):
         self.total = [0.0] * len(self.topk)
         self.count = [0] * len(self.topk)
 
+    def states(self):
+        """
+        Returns the correct counts and the sample counts of each top k.
+        """
+        return {
+            'total': np.array(self.total, dtype=np.float64),
+            'count': np.array(self.count, dtype=np.int64),
+        }
+
+    def set_states(self, states):
+        self.total = states['total'].tolist()
+        self.count = states['count'].tolist()
+
     def accumulate(self):
         """
         Computes and returns the accumulated metric.
@@ -429,17 +567,23 @@ class Precision(Metric):
         elif not _is_numpy_(labels):
             raise ValueError("The 'labels' must be a numpy ndarray or Tensor.")
 
-        sample_num = labels.shape[0]
-        preds = np.floor(preds + 0.5).astype("int32")
+        preds = np.floor(preds + 0.5).astype("int32").reshape([-1])
+        labels = labels.reshape([-1])
+
+        pred_pos = preds == 1
+        tp = int(np.count_nonzero(pred_pos & (labels == 1)))
+        self.tp += tp
+        self.fp += int(np.count_nonzero(pred_pos)) - tp
 
-        for i in range(sample_num):
-            pred = preds[i]
-            label = labels[i]
-            if pred == 1:
-                if pred == label:
-                    self.tp += 1
-                else:
-                    self.fp += 1
+    def states(self):
+        """
+        Returns the true positive and false positive counts.
+        """
+        return {'tp': np.array(self.tp), 'fp': np.array(self.fp)}
+
+    def set_states(self, states):
+        self.tp = int(states['tp'])
+        self.fp = int(states['fp'])
 
     def reset(self):
         """
@@ -562,17 +706,13 @@ class Recall(Metric):
         elif not _is_numpy_(labels):
             raise ValueError("The 'labels' must be a numpy ndarray or Tensor.")
 
-        sample_num = labels.shape[0]
-        preds = np.rint(preds).astype("int32")
+        preds = np.rint(preds).astype("int32").reshape([-1])
+        labels = labels.reshape([-1])
 
-        for i in range(sample_num):
-            pred = preds[i]
-            label = labels[i]
-            if label == 1:
-                if pred == label:
-                    self.tp += 1
-                else:
-                    self.fn += 1
+        label_pos = labels == 1
+        tp = int(np.count_nonzero(label_pos & (preds == 1)))
+        self.tp += tp
+        self.fn += int(np.count_nonzero(label_pos)) - tp
 
     def accumulate(self):
         """
@@ -584,6 +724,16 @@ class Recall(Metric):
         recall = self.tp + self.fn
         return float(self.tp) / recall if recall != 0 else 0.0
 
+    def states(self):
+        """
+        Returns the true positive and false negative counts.
+        """
+        return {'tp': np.array(self.tp), 'fn': np.array(self.fn)}
+
+    def set_states(self, states):
+        self.tp = int(states['tp'])
+        self.fn = int(states['fn'])
+
     def reset(self):
         """
         Resets all of the metric state.
@@ -600,28 +750,35 @@ class Recall(Metric):
 
 class Auc(Metric):
     """
-    The auc metric is for binary classification.
+    The auc metric is for binary classification, and multi-label or
+    multi-class classification in the one-vs-rest way.
     Refer to https://en.wikipedia.org/wiki/Receiver_operating_characteristic#Area_under_the_curve.
-    Please notice that the auc metric is implemented with python, which may be a little bit slow.
 
-    The `auc` function creates four local variables, `true_positives`,
-    `true_negatives`, `false_positives` and `false_negatives` that are used to
-    compute the AUC. To discretize the AUC curve, a linearly spaced set of
-    thresholds is used to compute pairs of recall and precision values. The area
-    under the ROC-curve is therefore computed using the height of the recall
-    values by the false positive rate, while the area under the PR-curve is the
-    computed using the height of the precision values by the recall.
+    Predictions are bucketized into :attr:`num_thresholds` + 1 linearly
+    spaced buckets, and the counts of positive and negative instances in
+    each bucket are accumulated across batches. To discretize the AUC curve,
+    the buckets are used as thresholds to compute pairs of recall and
+    precision values. The area under the ROC-curve is therefore computed
+    using the height of the recall values by the false positive rate, while
+    the area under the PR-curve is the computed using the height of the
+    precision values by the recall. Both areas are computed with the
+    trapezoidal rule, and the PR-curve starts at the point of recall 0 and
+    precision 1.
 
     Args:
         curve (str): Specifies the mode of the curve to be computed,
             'ROC' or 'PR' for the Precision-Recall-curve. Default is 'ROC'.
         num_thresholds (int): The number of thresholds to use when
             discretizing the roc curve. Default is 4095.
-            'ROC' or 'PR' for the Precision-Recall-curve. Default is 'ROC'.
         name (str, optional): String name of the metric instance. Default
             is `auc`.
-
-    "NOTE: only implement the ROC curve type via Python now."
+        num_classes (int, optional): The number of classes for multi-label
+            or multi-class auc, the statistics of all classes are updated
+            in one pass. Default is None, which means binary classification.
+        average (str|None, optional): How to reduce the auc of classes when
+            :attr:`num_classes` is set, 'macro' for the unweighted mean of
+            classes which have both positive and negative instances, None
+            for the auc of each class. Default is 'macro'.
 
     Example by standalone:
         .. code-block:: python
@@ -641,6 +798,20 @@ class Auc(Metric):
           m.update(preds=preds, labels=labels)
           res = m.accumulate()
 
+    Example of one-vs-rest:
+        .. code-block:: python
+
+          import numpy as np
+          import paddle
+
+          m = paddle.metric.Auc(num_classes=3, average=None)
+
+          preds = np.random.random(size=(8, 3))
+          # class indices, or a multi-hot matrix in the shape of (8, 3)
+          labels = np.random.randint(3, size=(8, 1))
+
+          m.update(preds=preds, labels=labels)
+          res = m.accumulate()  # auc of each class
 
     Example with Model API:
 
@@ -681,15 +852,39 @@ class Auc(Metric):
     """
 
     def __init__(
-        self, curve='ROC', num_thresholds=4095, name='auc', *args, **kwargs
+        self,
+        curve='ROC',
+        num_thresholds=4095,
+        name='auc',
+        num_classes=None,
+        average='macro',
+        *args,
+        **kwargs,
     ):
         super().__init__(*args, **kwargs)
+        if curve not in ['ROC', 'PR']:
+            raise ValueError(
+                "The 'curve' must be 'ROC' or 'PR', but received {}.".format(
+                    curve
+                )
+            )
+        if average not in ['macro', None]:
+            raise ValueError(
+                "The 'average' must be 'macro' or None, but received "
+                "{}.".format(average)
+            )
         self._curve = curve
         self._num_thresholds = num_thresholds
+        self._num_classes = num_classes
+        self._average = average
 
         _num_pred_buckets = num_thresholds + 1
-        self._stat_pos = np.zeros(_num_pred_buckets)
-        self._stat_neg = np.zeros(_num_pred_buckets)
+        if num_classes is None:
+            self._stat_shape = (_num_pred_buckets,)
+        else:
+            self._stat_shape = (num_classes, _num_pred_buckets)
+        self._stat_pos = np.zeros(self._stat_shape)
+        self._stat_neg = np.zeros(self._stat_shape)
         self._name = name
 
     def update(self, preds, labels):
@@ -699,10 +894,15 @@ class Auc(Metric):
         Args:
             preds (numpy.array): An numpy array in the shape of
                 (batch_size, 2), preds[i][j] denotes the probability of
-                classifying the instance i into the class j.
+                classifying the instance i into the class j. When
+                :attr:`num_classes` is set, the shape is
+                (batch_size, num_classes).
             labels (numpy.array): an numpy array in the shape of
                 (batch_size, 1), labels[i] is either o or 1,
-                representing the label of the instance i.
+                representing the label of the instance i. When
+                :attr:`num_classes` is set, it is the class index in the
+                shape of (batch_size, 1), or the multi-hot labels in the
+                shape of (batch_size, num_classes).
         """
         if isinstance(labels, (paddle.Tensor, paddle.fluid.core.eager.Tensor)):
             labels = np.array(labels)
@@ -714,52 +914,102 @@ class Auc(Metric):
         elif not _is_numpy_(preds):
             raise ValueError("The 'preds' must be a numpy ndarray or Tensor.")
 
-        for i, lbl in enumerate(labels):
-            value = preds[i, 1]
-            bin_idx = int(value * self._num_thresholds)
-            assert bin_idx <= self._num_thresholds
-            if lbl:
-                self._stat_pos[bin_idx] += 1.0
+        if self._num_classes is None:
+            scores = preds[:, 1] if preds.ndim == 2 else preds
+            is_pos = labels.reshape([-1]) != 0
+        else:
+            scores = preds.reshape([-1, self._num_classes])
+            if labels.ndim == 2 and labels.shape[1] == self._num_classes > 1:
+                is_pos = labels != 0
             else:
-                self._stat_neg[bin_idx] += 1.0
+                is_pos = labels.reshape([-1, 1]) == np.arange(self._num_classes)
+
+        bin_idx = (scores * self._num_thresholds).astype('int64')
+        assert bin_idx.size == 0 or (
+            bin_idx.min() >= 0 and bin_idx.max() <= self._num_thresholds
+        ), "The 'preds' must be in the range of [0, 1]."
+        if self._num_classes is not None:
+            # each class owns a row of buckets in the flattened statistics
+            bin_idx = bin_idx + np.arange(self._num_classes) * (
+                self._num_thresholds + 1
+            )
+
+        # count positive and negative instances of all buckets in one pass,
+        # where the even slots are negative and the odd slots are positive
+        num_stats = self._stat_pos.size
+        counts = np.bincount(
+            (bin_idx * 2 + is_pos).reshape([-1]), minlength=2 * num_stats
+        )
+        self._stat_neg += counts[0::2].reshape(self._stat_shape)
+        self._stat_pos += counts[1::2].reshape(self._stat_shape)
 
     @staticmethod
     def trapezoid_area(x1, x2, y1, y2):
         return abs(x1 - x2) * (y1 + y2) / 2.0
 
+    def _curve_area(self):
+        # walk the buckets from the highest threshold to the lowest
+        stat_pos = self._stat_pos[..., ::-1]
+        stat_neg = self._stat_neg[..., ::-1]
+        tot_pos = np.cumsum(stat_pos, axis=-1)
+        tot_neg = np.cumsum(stat_neg, axis=-1)
+        num_pos = tot_pos[..., -1]
+        num_neg = tot_neg[..., -1]
+
+        if self._curve == 'ROC':
+            area = np.sum(
+                stat_neg * (tot_pos + (tot_pos - stat_pos)) / 2.0, axis=-1
+            )
+            valid = (num_pos > 0.0) & (num_neg > 0.0)
+            denom = num_pos * num_neg
+        else:
+            tot = tot_pos + tot_neg
+            precision = np.divide(
+                tot_pos, tot, out=np.ones_like(tot_pos), where=tot > 0.0
+            )
+            precision_prev = np.concatenate(
+                [np.ones_like(precision[..., :1]), precision[..., :-1]],
+                axis=-1,
+            )
+            area = np.sum(
+                stat_pos * (precision + precision_prev) / 2.0, axis=-1
+            )
+            valid = num_pos > 0.0
+            denom = num_pos
+        return np.where(valid, area / np.where(valid, denom, 1.0), 0.0), valid
+
     def accumulate(self):
         """
         Return the area (a float score) under auc curve
 
         Return:
-            float: the area under auc curve
-        """
-        tot_pos = 0.0
-        tot_neg = 0.0
-        auc = 0.0
-
-        idx = self._num_thresholds
-        while idx >= 0:
-            tot_pos_prev = tot_pos
-            tot_neg_prev = tot_neg
-            tot_pos += self._stat_pos[idx]
-            tot_neg += self._stat_neg[idx]
-            auc += self.trapezoid_area(
-                tot_neg, tot_neg_prev, tot_pos, tot_pos_prev
-            )
-            idx -= 1
+            float: the area under auc curve. When :attr:`num_classes` is set
+            and :attr:`average` is None, return a numpy array of the auc of
+            each class.
+        """
+        auc, valid = self._curve_area()
+        if self._num_classes is None:
+            return float(auc)
+        if self._average is None:
+            return auc
+        return float(np.mean(auc[valid])) if valid.any() else 0.0
+
+    def states(self):
+        """
+        Returns the positive and negative counts of all buckets.
+        """
+        return {'stat_pos': self._stat_pos, 'stat_neg': self._stat_neg}
 
-        return (
-            auc / tot_pos / tot_neg if tot_pos > 0.0 and tot_neg > 0.0 else 0.0
-        )
+    def set_states(self, states):
+        self._stat_pos = np.asarray(states['stat_pos'], dtype=np.float64)
+        self._stat_neg = np.asarray(states['stat_neg'], dtype=np.float64)
 
     def reset(self):
         """
         Reset states and result
         """
-        _num_pred_buckets = self._num_thresholds + 1
-        self._stat_pos = np.zeros(_num_pred_buckets)
-        self._stat_neg = np.zeros(_num_pred_buckets)
+        self._stat_pos = np.zeros(self._stat_shape)
+        self._stat_neg = np.zeros(self._stat_shape)
 
     def name(self):
         """
@@ -768,6 +1018,114 @@ class Auc(Metric):
         return self._name
 
 
+class WindowedMetric(Metric):
+    """
+    Wraps a metric to compute it over the last :attr:`window_size` updates
+    (e.g. batches) only, instead of all updates since the last reset.
+
+    The wrapped metric should support :code:`Metric.states`, the states of
+    each update are kept in a ring buffer of fixed size, so the cost of
+    :code:`update` and :code:`accumulate` does not grow with the number of
+    updates. The ring buffer is the states of the windowed metric itself,
+    so windowed metrics updated in lockstep by several workers can be
+    merged or all reduced too.
+
+    Args:
+        metric (Metric): the metric to compute in the window.
+        window_size (int): the number of the latest updates in the window.
+        name (str|list[str], optional): the name of the metric. Default
+            None, means the name of :attr:`metric`.
+
+    Examples:
+        .. code-block:: python
+
+          import numpy as np
+          import paddle
+
+          m = paddle.metric.WindowedMetric(paddle.metric.Precision(), 2)
+          m.update(np.array([1.0, 1.0]), np.array([1, 1]))
+          m.update(np.array([1.0, 1.0]), np.array([0, 1]))
+          print(m.accumulate()) # 0.75
+          m.update(np.array([1.0, 1.0]), np.array([0, 0]))
+          print(m.accumulate()) # 0.25, the first update is out of window
+    """
+
+    def __init__(self, metric, window_size, name=None, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        if not isinstance(metric, Metric) or metric.states() is None:
+            raise ValueError(
+                "The 'metric' must be a Metric supporting states(), but "
+                "received {}.".format(metric)
+            )
+        if window_size <= 0:
+            raise ValueError(
+                "The 'window_size' must be positive, but received {}.".format(
+                    window_size
+                )
+            )
+        self._metric = metric
+        self._window_size = window_size
+        self._name = name
+        self.reset()
+
+    def compute(self, *args):
+        return self._metric.compute(*args)
+
+    def update(self, *args):
+        """
+        Update the wrapped metric with the arguments, and push the states
+        of this update into the window.
+
+        Return:
+            The return value of the :code:`update` of the wrapped metric.
+        """
+        self._metric.reset()
+        res = self._metric.update(*args)
+        for k, v in self._metric.states().items():
+            self._window[k][self._pos] = v
+        self._pos = (self._pos + 1) % self._window_size
+        return res
+
+    def accumulate(self):
+        """
+        Computes and returns the metric of the updates in the window.
+        """
+        self._metric.set_states(
+            {k: v.sum(axis=0) for k, v in self._window.items()}
+        )
+        return self._metric.accumulate()
+
+    def states(self):
+        """
+        Returns the states of the updates in the window, each in the shape
+        of :code:`[window_size] + shape of the state of the metric`.
+        """
+        return self._window
+
+    def set_states(self, states):
+        self._window = {
+            k: np.array(v, dtype=self._window[k].dtype)
+            for k, v in states.items()
+        }
+
+    def reset(self):
+        """
+        Resets all of the metric state.
+        """
+        self._metric.reset()
+        self._window = {
+            k: np.zeros((self._window_size,) + np.shape(v), np.asarray(v).dtype)
+            for k, v in self._metric.states().items()
+        }
+        self._pos = 0
+
+    def name(self):
+        """
+        Return name of metric instance.
+        """
+        return self._name or self._metric.name()
+
+
 def accuracy(input, label, k=1, correct=None, total=None, name=None):
     """
     accuracy layer.
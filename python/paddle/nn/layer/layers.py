@@ -39,10 +39,12 @@ from paddle.fluid.framework import (
     _global_flags,
     convert_np_dtype_to_dtype_,
     default_main_program,
+    global_var,
     in_dygraph_mode,
 )
 from paddle.fluid.layer_helper_base import LayerHelperBase
 from paddle.fluid.param_attr import ParamAttr
+from paddle.profiler import utils as profiler_utils
 from paddle.profiler.utils import in_profiler_mode
 from paddle.utils import deprecated
 
@@ -319,8 +321,9 @@ class HookRemoveHelper:
 
     next_hook_id = 0
 
-    def __init__(self, hooks):
+    def __init__(self, hooks, layer=None):
         self._hooks_ref = weakref.ref(hooks)
+        self._layer_ref = weakref.ref(layer) if layer is not None else None
         self._hook_id = HookRemoveHelper.next_hook_id
         HookRemoveHelper.next_hook_id += 1
 
@@ -328,6 +331,9 @@ class HookRemoveHelper:
         hooks = self._hooks_ref()
         if hooks is not None and self._hook_id in hooks:
             del hooks[self._hook_id]
+        layer = self._layer_ref() if self._layer_ref is not None else None
+        if layer is not None:
+            layer._update_call_state()
 
 
 class Layer:
@@ -369,6 +375,10 @@ class Layer:
             out = mylayer(x)
     """
 
+    # layers restored from pickles of older versions go to the slow path
+    # of __call__ once to set it up
+    _has_forward_hooks = True
+
     def __init__(self, name_scope=None, dtype="float32"):
         self.training = True
         if name_scope is None:
@@ -393,6 +403,8 @@ class Layer:
 
         self._forward_pre_hooks = collections.OrderedDict()
         self._forward_post_hooks = collections.OrderedDict()
+        # cached per layer dispatch state of __call__, see _update_call_state
+        self._has_forward_hooks = False
 
         self._casted_by_pure_fp16 = False
 
@@ -598,8 +610,9 @@ class Layer:
                 assert (out0.numpy() == (out1.numpy()) * 2).any()
 
         """
-        hook_remove_helper = HookRemoveHelper(self._forward_post_hooks)
+        hook_remove_helper = HookRemoveHelper(self._forward_post_hooks, self)
         self._forward_post_hooks[hook_remove_helper._hook_id] = hook
+        self._update_call_state()
         return hook_remove_helper
 
     def register_forward_pre_hook(self, hook):
@@ -653,8 +666,9 @@ class Layer:
                 # hook change the linear's input to input * 2, so out0 is equal to out1.
                 assert (out0.numpy() == out1.numpy()).any()
         """
-        hook_remove_helper = HookRemoveHelper(self._forward_pre_hooks)
+        hook_remove_helper = HookRemoveHelper(self._forward_pre_hooks, self)
         self._forward_pre_hooks[hook_remove_helper._hook_id] = hook
+        self._update_call_state()
         return hook_remove_helper
 
     def create_parameter(
@@ -1191,9 +1205,16 @@ class Layer:
     def _build_once(self, *args, **kwargs):
         pass
 
-    def _dygraph_call_func(self, *inputs, **kwargs):
-        from paddle.distributed import parallel_helper
+    def _update_call_state(self):
+        # NOTE: hooks are registered and removed by their helpers, which
+        # refresh the cached state. Hooks deleted from the dicts directly
+        # leave it stale, which only sends calls to the slow path, where it
+        # is refreshed again.
+        self.__dict__['_has_forward_hooks'] = bool(
+            self._forward_pre_hooks or self._forward_post_hooks
+        )
 
+    def _dygraph_call_func(self, *inputs, **kwargs):
         for forward_pre_hook in self._forward_pre_hooks.values():
             hook_result = forward_pre_hook(self, inputs)
             if hook_result is not None:
@@ -1202,6 +1223,8 @@ class Layer:
                 inputs = hook_result
 
         if not self._built:
+            from paddle.distributed import parallel_helper
+
             with program_desc_tracing_guard(False):
                 self._build_once(*inputs, **kwargs)
 
@@ -1234,17 +1257,22 @@ class Layer:
         return outputs
 
     def __call__(self, *inputs, **kwargs):
+        # NOTE: this is called for every sublayer, keep the fast path flat:
+        # the per layer state is cached in _has_forward_hooks, and global
+        # modes are read directly instead of calling in_declarative_mode(),
+        # in_dygraph_mode() and in_profiler_mode().
         if (
-            (not in_declarative_mode())
-            and (not self._forward_pre_hooks)
-            and (not self._forward_post_hooks)
-            and (not self._built)
-            and in_dygraph_mode()
-            and (not in_profiler_mode())
+            (not self._has_forward_hooks)
+            and (not global_var._in_declarative_mode_)
+            and global_var._dygraph_tracer_ is not None
+            and global_var._in_eager_mode_
+            and (not profiler_utils._is_profiler_used)
         ):
-            self._build_once(*inputs, **kwargs)
+            if not self._built:
+                self._build_once(*inputs, **kwargs)
             return self.forward(*inputs, **kwargs)
         else:
+            self._update_call_state()
             return self._dygraph_call_func(*inputs, **kwargs)
 
     def forward(self, *inputs, **kwargs):
@@ -1447,22 +1475,22 @@ class Layer:
         self.__dict__.update(state)
 
     def __getattr__(self, name):
-        if '_parameters' in self.__dict__:
-            _parameters = self.__dict__['_parameters']
-            if name in self._parameters:
-                if in_declarative_mode():
-                    return _convert_into_variable(self._parameters[name])
-                return self._parameters[name]
-        if '_sub_layers' in self.__dict__:
-            _sub_layers = self.__dict__['_sub_layers']
-            if name in self._sub_layers:
-                return self._sub_layers[name]
-        if '_buffers' in self.__dict__:
-            _buffers = self.__dict__['_buffers']
-            if name in _buffers:
-                if in_declarative_mode():
-                    return _convert_into_variable(_buffers[name])
-                return _buffers[name]
+        # NOTE: only called when the normal lookup fails, e.g. for every
+        # sublayer and parameter, so each dict is fetched only once
+        _dict = self.__dict__
+        _parameters = _dict.get('_parameters')
+        if _parameters is not None and name in _parameters:
+            if global_var._in_declarative_mode_:
+                return _convert_into_variable(_parameters[name])
+            return _parameters[name]
+        _sub_layers = _dict.get('_sub_layers')
+        if _sub_layers is not None and name in _sub_layers:
+            return _sub_layers[name]
+        _buffers = _dict.get('_buffers')
+        if _buffers is not None and name in _buffers:
+            if global_var._in_declarative_mode_:
+                return _convert_into_variable(_buffers[name])
+            return _buffers[name]
         return object.__getattribute__(self, name)
 
     def __setattr__(self, name, value):
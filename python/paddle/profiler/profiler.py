@@ -874,13 +874,9 @@ class Profiler:
             views = [views]
 
         if self.profiler_result:
-            statistic_data = StatisticData(
-                self.profiler_result.get_data(),
-                self.profiler_result.get_extra_info(),
-            )
             print(
                 _build_table(
-                    statistic_data,
+                    self._get_statistic_data(),
                     sorted_by=sorted_by,
                     op_detail=op_detail,
                     thread_sep=thread_sep,
@@ -892,6 +888,25 @@ class Profiler:
         if self.with_flops:
             self._print_flops()
 
+    @property
+    def profiler_result(self):
+        return self._profiler_result
+
+    @profiler_result.setter
+    def profiler_result(self, profiler_result):
+        self._profiler_result = profiler_result
+        self._statistic_data = None
+
+    def _get_statistic_data(self):
+        # NOTE: analysing the result walks through all events, do it once
+        # for a profiler result and share it among summaries of it
+        if self._statistic_data is None:
+            self._statistic_data = StatisticData(
+                self.profiler_result.get_data(),
+                self.profiler_result.get_extra_info(),
+            )
+        return self._statistic_data
+
     def _print_flops(self, repeat=1):
         if not self.with_flops:
             print('ERROR: with_flops disabled.')
@@ -356,47 +356,40 @@ class TimeRangeSummary:
         r"""
         Analysis node trees in profiler result, and get time range for different tracer event type.
         """
+        # NOTE: the union of ranges merged by thread or stream is the same as
+        # the union of all ranges, so ranges are collected flatly and merged
+        # once for each event type by vectorized passes
+        cpu_ranges = collections.defaultdict(list)
+        gpu_ranges = collections.defaultdict(
+            lambda: collections.defaultdict(list)
+        )  # device_id/type
         thread2hostnodes = traverse_tree(nodetrees)
         for threadid, hostnodes in thread2hostnodes.items():
-            CPUTimeRange = collections.defaultdict(list)
-            GPUTimeRange = collections.defaultdict(
-                lambda: collections.defaultdict(
-                    lambda: collections.defaultdict(list)
-                )
-            )  # device_id/type/stream_id
             for hostnode in hostnodes[1:]:  # skip root node
-
-                CPUTimeRange[hostnode.type].append(
+                cpu_ranges[hostnode.type].append(
                     (hostnode.start_ns, hostnode.end_ns)
                 )
                 self.call_times[hostnode.type] += 1
                 for runtimenode in hostnode.runtime_node:
-                    CPUTimeRange[runtimenode.type].append(
+                    cpu_ranges[runtimenode.type].append(
                         (runtimenode.start_ns, runtimenode.end_ns)
                     )
                     self.call_times[runtimenode.type] += 1
                     for devicenode in runtimenode.device_node:
-                        GPUTimeRange[devicenode.device_id][devicenode.type][
-                            devicenode.stream_id
+                        gpu_ranges[devicenode.device_id][
+                            devicenode.type
                         ].append((devicenode.start_ns, devicenode.end_ns))
                         self.call_times[devicenode.type] += 1
 
-            for event_type, time_ranges in CPUTimeRange.items():
-                time_ranges = merge_self_ranges(time_ranges, is_sorted=False)
-                self.CPUTimeRange[event_type] = merge_ranges(
-                    self.CPUTimeRange[event_type], time_ranges, is_sorted=True
+        for event_type, time_ranges in cpu_ranges.items():
+            self.CPUTimeRange[event_type] = merge_ranges(
+                self.CPUTimeRange[event_type], time_ranges
+            )
+        for device_id, device_time_ranges in gpu_ranges.items():
+            for event_type, time_ranges in device_time_ranges.items():
+                self.GPUTimeRange[device_id][event_type] = merge_ranges(
+                    self.GPUTimeRange[device_id][event_type], time_ranges
                 )
-            for device_id, device_time_ranges in GPUTimeRange.items():
-                for event_type, event_time_ranges in device_time_ranges.items():
-                    for stream_id, time_ranges in event_time_ranges.items():
-                        time_ranges = merge_self_ranges(
-                            time_ranges, is_sorted=False
-                        )
-                        self.GPUTimeRange[device_id][event_type] = merge_ranges(
-                            self.GPUTimeRange[device_id][event_type],
-                            time_ranges,
-                            is_sorted=True,
-                        )
 
         for event_type, time_ranges in self.CPUTimeRange.items():
             self.CPUTimeRangeSum[event_type] = sum_ranges(time_ranges)
@@ -12,217 +12,116 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+# NOTE: time ranges are (start, end) pairs. They are handled as (N, 2)
+# numpy arrays internally, so that merging, intersecting and subtracting
+# millions of ranges of a long trace are done by a few vectorized passes
+# instead of python loops. The public functions accept and return lists of
+# tuples as before, numpy arrays are also accepted.
+
+import numpy as np
+
+
+def _as_range_array(ranges):
+    if isinstance(ranges, np.ndarray):
+        return ranges.reshape([-1, 2])
+    if len(ranges) == 0:
+        return np.empty([0, 2], dtype=np.int64)
+    return np.asarray(ranges).reshape([-1, 2])
+
+
+def _to_range_list(ranges):
+    return list(zip(ranges[:, 0].tolist(), ranges[:, 1].tolist()))
+
+
+def _merge_range_array(ranges, is_sorted=False):
+    if len(ranges) == 0:
+        return ranges
+    if not is_sorted:
+        ranges = ranges[np.argsort(ranges[:, 0], kind='stable')]
+    # a range starts a new merged range only if it starts after all the
+    # ranges before it end, touching ranges are merged
+    max_ends = np.maximum.accumulate(ranges[:, 1])
+    is_first = np.empty([len(ranges)], dtype=bool)
+    is_first[0] = True
+    np.greater(ranges[1:, 0], max_ends[:-1], out=is_first[1:])
+    first_indices = np.flatnonzero(is_first)
+    last_indices = np.append(first_indices[1:] - 1, len(ranges) - 1)
+    return np.stack([ranges[first_indices, 0], max_ends[last_indices]], axis=1)
+
+
+def _intersect_range_array(ranges1, ranges2):
+    # both are merged. ranges2[lower[i]:upper[i]] are the ranges which
+    # overlap with ranges1[i], they are found by binary search as ends and
+    # starts of merged ranges are both sorted
+    lower = np.searchsorted(ranges2[:, 1], ranges1[:, 0], side='right')
+    upper = np.searchsorted(ranges2[:, 0], ranges1[:, 1], side='left')
+    counts = np.maximum(upper - lower, 0)
+    total = int(counts.sum())
+    if total == 0:
+        return np.empty([0, 2], dtype=ranges1.dtype)
+    indices1 = np.repeat(np.arange(len(ranges1)), counts)
+    offsets = np.cumsum(counts) - counts
+    indices2 = lower[indices1] + np.arange(total) - offsets[indices1]
+    return np.stack(
+        [
+            np.maximum(ranges1[indices1, 0], ranges2[indices2, 0]),
+            np.minimum(ranges1[indices1, 1], ranges2[indices2, 1]),
+        ],
+        axis=1,
+    )
+
+
+def _subtract_range_array(ranges1, ranges2):
+    # both are merged, ranges1 - ranges2 is ranges1 intersected with the
+    # gaps between ranges2
+    gaps = np.stack(
+        [
+            np.append(ranges1[0, 0], ranges2[:, 1]),
+            np.append(ranges2[:, 0], ranges1[-1, 1]),
+        ],
+        axis=1,
+    )
+    gaps = gaps[gaps[:, 1] > gaps[:, 0]]
+    return _intersect_range_array(ranges1, gaps)
+
 
 def sum_ranges(ranges):
-    result = 0
-    for time_range in ranges:
-        result += time_range[1] - time_range[0]
-    return result
+    ranges = _as_range_array(ranges)
+    return int(np.sum(ranges[:, 1] - ranges[:, 0]))
 
 
 def merge_self_ranges(src_ranges, is_sorted=False):
-    merged_ranges = []
-    if len(src_ranges) > 0:
-        if not is_sorted:
-            src_ranges.sort(key=lambda x: x[0])
-        cur_indx = 0
-        merged_ranges.append((src_ranges[cur_indx][0], src_ranges[cur_indx][1]))
-        for cur_indx in range(1, len(src_ranges)):
-            if src_ranges[cur_indx][1] > merged_ranges[-1][1]:
-                if src_ranges[cur_indx][0] <= merged_ranges[-1][1]:
-                    merged_ranges[-1] = (
-                        merged_ranges[-1][0],
-                        src_ranges[cur_indx][1],
-                    )
-                else:
-                    merged_ranges.append(
-                        (src_ranges[cur_indx][0], src_ranges[cur_indx][1])
-                    )
-    return merged_ranges
+    return _to_range_list(
+        _merge_range_array(_as_range_array(src_ranges), is_sorted)
+    )
 
 
 def merge_ranges(range_list1, range_list2, is_sorted=False):
-    merged_ranges = []
-    if not is_sorted:
-        range_list1 = merge_self_ranges(range_list1)
-        range_list2 = merge_self_ranges(range_list2)
-    len1 = len(range_list1)
-    len2 = len(range_list2)
-    if len1 == 0 and len2 == 0:
-        return merged_ranges
-    elif len1 == 0:
-        return range_list2
-    elif len2 == 0:
-        return range_list1
-    else:
-        indx1 = 0
-        indx2 = 0
-        range1 = range_list1[indx1]
-        range2 = range_list2[indx2]
-        if range1[0] < range2[0]:
-            merged_ranges.append(range1)
-            indx1 += 1
-        else:
-            merged_ranges.append(range2)
-            indx2 += 1
-        while indx1 < len1 and indx2 < len2:
-            range1 = range_list1[indx1]
-            range2 = range_list2[indx2]
-            if range1[0] < range2[0]:
-                if range1[1] > merged_ranges[-1][1]:
-                    if range1[0] <= merged_ranges[-1][1]:
-                        merged_ranges[-1] = (merged_ranges[-1][0], range1[1])
-                    else:
-                        merged_ranges.append((range1[0], range1[1]))
-                    indx1 += 1
-                else:
-                    indx1 += 1
-            else:
-                if range2[1] > merged_ranges[-1][1]:
-                    if range2[0] <= merged_ranges[-1][1]:
-                        merged_ranges[-1] = (merged_ranges[-1][0], range2[1])
-                    else:
-                        merged_ranges.append((range2[0], range2[1]))
-                    indx2 += 1
-                else:
-                    indx2 += 1
-
-        while indx1 < len1:
-            range1 = range_list1[indx1]
-            if range1[1] > merged_ranges[-1][1]:
-                if range1[0] <= merged_ranges[-1][1]:
-                    merged_ranges[-1] = (merged_ranges[-1][0], range1[1])
-                else:
-                    merged_ranges.append((range1[0], range1[1]))
-                indx1 += 1
-            else:
-                indx1 += 1
-        while indx2 < len2:
-            range2 = range_list2[indx2]
-            if range2[1] > merged_ranges[-1][1]:
-                if range2[0] <= merged_ranges[-1][1]:
-                    merged_ranges[-1] = (merged_ranges[-1][0], range2[1])
-                else:
-                    merged_ranges.append((range2[0], range2[1]))
-                indx2 += 1
-            else:
-                indx2 += 1
-    return merged_ranges
+    ranges = np.concatenate(
+        [_as_range_array(range_list1), _as_range_array(range_list2)]
+    )
+    return _to_range_list(_merge_range_array(ranges))
 
 
 def intersection_ranges(range_list1, range_list2, is_sorted=False):
-    result_range = []
     if len(range_list1) == 0 or len(range_list2) == 0:
-        return result_range
+        return []
+    ranges1 = _as_range_array(range_list1)
+    ranges2 = _as_range_array(range_list2)
     if not is_sorted:
-        range_list1 = merge_self_ranges(range_list1)
-        range_list2 = merge_self_ranges(range_list2)
-
-    len1 = len(range_list1)
-    len2 = len(range_list2)
-    indx1 = 0
-    indx2 = 0
-    range1 = range_list1[indx1]
-    range2 = range_list2[indx2]
-    while indx1 < len1 and indx2 < len2:
-        if range2[1] <= range1[0]:
-            indx2 += 1
-            if indx2 == len2:
-                break
-            range2 = range_list2[indx2]
-
-        elif range2[0] <= range1[0] and range2[1] < range1[1]:
-            assert range2[1] > range1[0]
-            result_range.append((range1[0], range2[1]))
-            range1 = (range2[1], range1[1])
-            indx2 += 1
-            if indx2 == len2:
-                break
-            range2 = range_list2[indx2]
-
-        elif range2[0] <= range1[0]:
-            assert range2[1] >= range1[1]
-            result_range.append(range1)
-            range2 = (range1[1], range2[1])
-            indx1 += 1
-            if indx1 == len1:
-                break
-            range1 = range_list1[indx1]
-
-        elif range2[1] < range1[1]:
-            assert range2[0] > range1[0]
-            result_range.append(range2)
-            range1 = (range2[1], range1[1])
-            indx2 += 1
-            if indx2 == len2:
-                break
-            range2 = range_list2[indx2]
-
-        elif range2[0] < range1[1]:
-            assert range2[1] >= range1[1]
-            result_range.append((range2[0], range1[1]))
-            range2 = (range1[1], range2[1])
-            indx1 += 1
-            if indx1 == len1:
-                break
-            range1 = range_list1[indx1]
-
-        else:
-            assert range2[0] >= range1[1]
-            indx1 += 1
-            if indx1 == len1:
-                break
-            range1 = range_list1[indx1]
-    return result_range
+        ranges1 = _merge_range_array(ranges1)
+        ranges2 = _merge_range_array(ranges2)
+    return _to_range_list(_intersect_range_array(ranges1, ranges2))
 
 
 def subtract_ranges(range_list1, range_list2, is_sorted=False):
-    result_range = []
+    ranges1 = _as_range_array(range_list1)
+    ranges2 = _as_range_array(range_list2)
     if not is_sorted:
-        range_list1 = merge_self_ranges(range_list1)
-        range_list2 = merge_self_ranges(range_list2)
-    if len(range_list1) == 0:
-        return result_range
-    if len(range_list2) == 0:
-        return range_list1
-
-    len1 = len(range_list1)
-    len2 = len(range_list2)
-    indx1 = 0
-    indx2 = 0
-    range1 = range_list1[indx1]
-    range2 = range_list2[indx2]
-
-    while indx1 < len(range_list1):
-        if indx2 == len(range_list2):
-            result_range.append(range1)
-            indx1 += 1
-            if indx1 == len1:
-                break
-            range1 = range_list1[indx1]
-        elif range2[1] <= range1[0]:
-            indx2 += 1
-            if indx2 != len2:
-                range2 = range_list2[indx2]
-        elif range2[0] <= range1[0] and range2[1] < range1[1]:
-            range1 = (range2[1], range1[1])
-            indx2 += 1
-            if indx2 != len2:
-                range2 = range_list2[indx2]
-        elif range2[0] <= range1[0]:
-            assert range2[1] >= range1[1]
-            range2 = (range1[1], range2[1])
-            indx1 += 1
-            if indx1 != len1:
-                range1 = range_list1[indx1]
-        elif range2[0] < range1[1]:
-            assert range2[0] > range1[0]
-            result_range.append((range1[0], range2[0]))
-            range1 = (range2[0], range1[1])
-        else:
-            assert range2[0] >= range1[1]
-            result_range.append(range1)
-            indx1 += 1
-            if indx1 != len1:
-                range1 = range_list1[indx1]
-    return result_range
+        ranges1 = _merge_range_array(ranges1)
+        ranges2 = _merge_range_array(ranges2)
+    if len(ranges1) == 0:
+        return []
+    if len(ranges2) == 0:
+        return _to_range_list(ranges1)
+    return _to_range_list(_subtract_range_array(ranges1, ranges2))
@@ -12,9 +12,16 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import json
+import os
+import socket
+import time
 import timeit
+import warnings
 from collections import OrderedDict
 
+import numpy as np
+
 
 class Stack:
     """
@@ -346,6 +353,322 @@ class TimeAverager:
         return float(self._total_iters) / self._total_time
 
 
+class _NullPhase:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+
+_null_phase = _NullPhase()
+
+
+class _Phase:
+    __slots__ = ['_records', '_index', '_start']
+
+    def __init__(self, records, index):
+        self._records = records
+        self._index = index
+
+    def __enter__(self):
+        self._start = timeit.default_timer()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._records[self._index] += timeit.default_timer() - self._start
+        return False
+
+
+class StepTelemetry:
+    """
+    Per-step timings kept in a fixed size ring buffer, so that it can be
+    always enabled in production at a cost of a few microseconds per step.
+
+    The cost of each phase of a step is measured on host, the phases are
+    'reader', 'h2d', 'forward', 'backward' and 'optimizer'. The reader cost
+    is recorded by DataLoader, other phases are recorded by
+    :code:`phase`. Device kernels run asynchronously, the host cost of a
+    phase does not include its device time unless it synchronizes.
+
+    Args:
+        capacity(int, optional): number of latest steps to keep. Default 1024.
+        export_path(str, optional): the file, or socket address like
+            'udp://127.0.0.1:9125' and 'unix:///tmp/telemetry.sock', to
+            export the telemetry. Default None, no exporting.
+        export_format(str, optional): 'jsonl' to append one JSON line for
+            each step, or 'prometheus' to write the percentiles of the
+            steps in ring buffer as Prometheus text. Default 'jsonl'.
+        export_interval(int, optional): export every export_interval steps.
+            Default 100.
+        labels(dict, optional): labels of the Prometheus metrics. Default
+            the trainer rank.
+    """
+
+    FIELDS = (
+        'reader_cost',
+        'h2d_cost',
+        'forward_cost',
+        'backward_cost',
+        'optimizer_cost',
+        'batch_cost',
+    )
+    PHASES = ('reader', 'h2d', 'forward', 'backward', 'optimizer')
+    QUANTILES = (50, 95, 99)
+
+    def __init__(
+        self,
+        capacity=1024,
+        export_path=None,
+        export_format='jsonl',
+        export_interval=100,
+        labels=None,
+    ):
+        if capacity < 1:
+            raise ValueError(
+                "capacity should be a positive value, but got {}".format(
+                    capacity
+                )
+            )
+        if export_format not in ['jsonl', 'prometheus']:
+            raise ValueError(
+                "export_format should be 'jsonl' or 'prometheus', but got "
+                "{}".format(export_format)
+            )
+        self.capacity = capacity
+        self.export_path = export_path
+        self.export_format = export_format
+        self.export_interval = export_interval
+        if labels is None:
+            labels = {'rank': os.environ.get('PADDLE_TRAINER_ID', '0')}
+        self.labels = labels
+        self.num_steps = 0
+        self._exported_steps = 0
+        self._socket = None
+        self._warned = False
+        # columns: FIELDS, num_samples, wall time of the step end
+        self._records = np.zeros([capacity, len(self.FIELDS) + 2])
+        self._current = [0.0] * len(self.FIELDS)
+        self._phases = {
+            name: _Phase(self._current, i) for i, name in enumerate(self.PHASES)
+        }
+
+    def phase(self, name):
+        """
+        A context manager which adds the host cost of its block to phase
+        :attr:`name` of the current step.
+        """
+        return self._phases[name]
+
+    def record(self, name, usetime):
+        """
+        Add :attr:`usetime` seconds to phase :attr:`name` of the current
+        step.
+        """
+        self._current[self.PHASES.index(name)] += usetime
+
+    def step(self, batch_cost, num_samples=None):
+        """
+        Finish the current step which costs :attr:`batch_cost` seconds.
+        """
+        current = self._current
+        current[-1] = batch_cost
+        row = self._records[self.num_steps % self.capacity]
+        row[: len(current)] = current
+        row[-2] = num_samples if num_samples is not None else np.nan
+        row[-1] = time.time()
+        for i in range(len(current)):
+            current[i] = 0.0
+        self.num_steps += 1
+        if (
+            self.export_path is not None
+            and self.num_steps - self._exported_steps >= self.export_interval
+        ):
+            self.export()
+
+    def _steps(self, start=0):
+        start = max(start, self.num_steps - self.capacity)
+        steps = np.arange(start, self.num_steps)
+        return steps, self._records[steps % self.capacity]
+
+    def records(self):
+        """
+        Get the timings of the steps in ring buffer.
+
+        Returns:
+            dict: the step ids and each of FIELDS and 'num_samples' as
+                numpy arrays in step order.
+        """
+        steps, records = self._steps()
+        result = {'step': steps}
+        for i, field in enumerate(self.FIELDS):
+            result[field] = records[:, i]
+        result['num_samples'] = records[:, -2]
+        return result
+
+    def percentiles(self, quantiles=QUANTILES):
+        """
+        Get the percentiles of each of FIELDS over the steps in ring buffer.
+
+        Returns:
+            dict: {field: {'p50': value, ...}}, empty if no step finished.
+        """
+        _, records = self._steps()
+        if len(records) == 0:
+            return {}
+        values = np.percentile(
+            records[:, : len(self.FIELDS)], quantiles, axis=0
+        )
+        return {
+            field: {
+                'p{}'.format(q): float(values[j, i])
+                for j, q in enumerate(quantiles)
+            }
+            for i, field in enumerate(self.FIELDS)
+        }
+
+    def to_json_lines(self, start=0):
+        """
+        Format the steps from step :attr:`start` in ring buffer as JSON
+        lines.
+        """
+        steps, records = self._steps(start)
+        lines = []
+        for step, record in zip(steps.tolist(), records.tolist()):
+            item = {'step': step, 'time': record[-1]}
+            item.update(zip(self.FIELDS, record))
+            if not np.isnan(record[-2]):
+                item['num_samples'] = record[-2]
+            lines.append(json.dumps(item) + '\n')
+        return ''.join(lines)
+
+    def to_prometheus(self):
+        """
+        Format the percentiles of the steps in ring buffer as Prometheus
+        text exposition format.
+        """
+        labels = ','.join(
+            '{}="{}"'.format(k, v) for k, v in sorted(self.labels.items())
+        )
+        _, records = self._steps()
+        lines = [
+            '# TYPE paddle_steps_total counter\n',
+            'paddle_steps_total{{{}}} {}\n'.format(labels, self.num_steps),
+        ]
+        percentiles = self.percentiles()
+        for i, field in enumerate(self.FIELDS):
+            name = 'paddle_step_{}_seconds'.format(field)
+            lines.append('# TYPE {} summary\n'.format(name))
+            for q, value in percentiles.get(field, {}).items():
+                lines.append(
+                    '{}{{{}{}quantile="{}"}} {!r}\n'.format(
+                        name,
+                        labels,
+                        ',' if labels else '',
+                        int(q[1:]) / 100,
+                        value,
+                    )
+                )
+            lines.append(
+                '{}_sum{{{}}} {!r}\n'.format(
+                    name, labels, float(records[:, i].sum())
+                )
+            )
+            lines.append(
+                '{}_count{{{}}} {}\n'.format(name, labels, len(records))
+            )
+        return ''.join(lines)
+
+    def _send(self, text):
+        scheme, _, address = self.export_path.partition('://')
+        if self._socket is None:
+            if scheme == 'udp':
+                host, _, port = address.rpartition(':')
+                self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+                self._socket.connect((host, int(port)))
+            else:
+                self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+                self._socket.connect(address)
+            self._socket.setblocking(False)
+        # one datagram for each line, datagrams are dropped rather than
+        # blocking training when the receiver is slow
+        for line in text.splitlines(True):
+            try:
+                self._socket.send(line.encode())
+            except BlockingIOError:
+                pass
+
+    def export(self):
+        """
+        Export the steps finished since last exporting, or the percentiles
+        for 'prometheus' format, to :attr:`export_path`. Failures are
+        warned once and ignored, so that training is never interrupted.
+        """
+        if self.export_format == 'jsonl':
+            text = self.to_json_lines(self._exported_steps)
+        else:
+            text = self.to_prometheus()
+        self._exported_steps = self.num_steps
+        try:
+            if self.export_path.startswith(('udp://', 'unix://')):
+                self._send(text)
+            elif self.export_format == 'jsonl':
+                with open(self.export_path, 'a') as f:
+                    f.write(text)
+            else:
+                # replace the file atomically for Prometheus textfile
+                # collectors
+                tmp_path = '{}.tmp.{}'.format(self.export_path, os.getpid())
+                with open(tmp_path, 'w') as f:
+                    f.write(text)
+                os.replace(tmp_path, self.export_path)
+        except OSError as e:
+            if not self._warned:
+                self._warned = True
+                warnings.warn(
+                    "Failed to export step telemetry to {}: {}".format(
+                        self.export_path, e
+                    )
+                )
+
+    def close(self):
+        if self.export_path is not None and self.num_steps > (
+            self._exported_steps
+        ):
+            self.export()
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+
+
+class TelemetryHook(Hook):
+    """
+    A hook for recording the timings of every step into a
+    :code:`StepTelemetry`.
+    """
+
+    def __init__(self, telemetry):
+        self.telemetry = telemetry
+        self.start_time = timeit.default_timer()
+        self.start_reader = self.start_time
+
+    def begin(self, benchmark):
+        self.start_time = timeit.default_timer()
+
+    def before_reader(self, benchmark):
+        self.start_reader = timeit.default_timer()
+
+    def after_reader(self, benchmark):
+        self.telemetry.record(
+            'reader', timeit.default_timer() - self.start_reader
+        )
+
+    def after_step(self, benchmark):
+        now = timeit.default_timer()
+        self.telemetry.step(now - self.start_time, benchmark.num_samples)
+        self.start_time = now
+
+
 class Benchmark:
     """
     A tool for the statistics of model performance. The `before_reader`
@@ -395,6 +718,55 @@ class Benchmark:
         self.current_event.reset()
         return message
 
+    def enable_telemetry(self, **kwargs):
+        """
+        Record the timings of every step into a ring buffer, the arguments
+        are passed to :code:`StepTelemetry`. Steps are finished by
+        :code:`step`, which is called by `Profiler.step()`, or it can be
+        called directly without `Profiler`. `paddle.Model` finishes its
+        train steps by :code:`telemetry_step`.
+
+        Returns:
+            StepTelemetry: the telemetry.
+        """
+        self.disable_telemetry()
+        telemetry = StepTelemetry(**kwargs)
+        self.hooks['telemetry_hook'] = TelemetryHook(telemetry)
+        return telemetry
+
+    def disable_telemetry(self):
+        hook = self.hooks.pop('telemetry_hook', None)
+        if hook is not None:
+            hook.telemetry.close()
+
+    @property
+    def telemetry(self):
+        hook = self.hooks.get('telemetry_hook')
+        return hook.telemetry if hook is not None else None
+
+    def telemetry_step(self, num_samples=None):
+        """
+        Finish the current telemetry step for training loops which may run
+        without `Profiler`. It does nothing if telemetry is not enabled or a
+        `Profiler` is running, whose `step()` finishes the steps instead.
+        """
+        hook = self.hooks.get('telemetry_hook')
+        if hook is None or self.current_event is not None:
+            return
+        self.num_samples = num_samples
+        hook.after_step(self)
+
+    def phase(self, name):
+        """
+        A context manager which records the host cost of its block as phase
+        :attr:`name` of the current step, it does nothing if telemetry is
+        not enabled.
+        """
+        hook = self.hooks.get('telemetry_hook')
+        if hook is None:
+            return _null_phase
+        return hook.telemetry.phase(name)
+
     def begin(self):
         for hook in self.hooks.values():
             hook.begin(self)
@@ -12,16 +12,28 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import io
 import itertools
 import logging
 import multiprocessing
+import pickle
+import queue
 import random
 import sys
+import traceback
 import warnings
 from itertools import zip_longest
 from queue import Queue
 from threading import Thread
 
+import numpy as np
+
+from paddle.fluid.dataloader.shm_ring import (
+    _create_slab_status,
+    _SharedMemorySlabReader,
+    _SharedMemorySlabRing,
+    shared_memory,
+)
 from paddle.fluid.reader import QUEUE_GET_TIMEOUT
 
 __all__ = []
@@ -400,21 +412,38 @@ class XmapEndSignal:
     pass
 
 
-def xmap_readers(mapper, reader, process_num, buffer_size, order=False):
+def xmap_readers(
+    mapper, reader, process_num, buffer_size, order=False, use_process=False
+):
     """
     Use multi-threads to map samples from reader by a mapper defined by user.
 
     Args:
         mapper (callable): a function to map the data from reader.
         reader (callable): a data reader which yields the data.
-        process_num (int): thread number to handle original sample.
-        buffer_size (int): size of the queue to read data in.
+        process_num (int): thread number to handle original sample, or
+            process number if :attr:`use_process` is True.
+        buffer_size (int): size of the queue to read data in. If
+            :attr:`use_process` is True, it is the max number of samples
+            which are being mapped or waiting to be yielded, which also
+            bounds the samples held for reordering.
         order (bool): whether to keep the data order from original reader.
             Default False.
+        use_process (bool): whether to map samples in worker processes
+            instead of threads, which suits mappers bound by the GIL. The
+            mapper runs in forked processes, numpy arrays in mapped samples
+            are handed back through shared memory instead of being pickled
+            when :code:`multiprocessing.shared_memory` is available (python
+            3.8+). Not supported on windows. Default False.
 
     Returns:
         callable: a decorated reader with data mapping.
     """
+    if use_process:
+        return _xmap_readers_process(
+            mapper, reader, process_num, buffer_size, order
+        )
+
     end = XmapEndSignal()
 
     # define a worker to read samples from reader to in_queue
@@ -496,6 +525,200 @@ def xmap_readers(mapper, reader, process_num, buffer_size, order=False):
     return xreader
 
 
+# NOTE: every worker of process based xmap_readers owns a small ring of
+# shared memory slabs, a slab is released as soon as the main process
+# copies the mapped sample out, so a few slabs are enough
+_XMAP_SLABS_PER_WORKER = 4
+# interval in seconds to check whether workers are alive when waiting for
+# mapped samples
+_XMAP_POLL_INTERVAL = 5
+
+
+class _XmapWorkerError:
+    def __init__(self, message):
+        self.message = message
+
+
+class _XmapArrayPickler(pickle.Pickler):
+    # pickle the structure of a mapped sample only, numpy arrays in it are
+    # collected and replaced by their indices
+    def __init__(self, f):
+        super().__init__(f, protocol=4)
+        self.arrays = []
+        self._indices = {}
+
+    def persistent_id(self, obj):
+        if (
+            isinstance(obj, np.ndarray)
+            and obj.dtype.fields is None
+            and not obj.dtype.hasobject
+        ):
+            key = id(obj)
+            if key not in self._indices:
+                self.arrays.append(obj)
+                self._indices[key] = len(self.arrays) - 1
+            return self._indices[key]
+        return None
+
+
+class _XmapArrayUnpickler(pickle.Unpickler):
+    def __init__(self, f, arrays):
+        super().__init__(f)
+        self._arrays = arrays
+
+    def persistent_load(self, pid):
+        return self._arrays[pid]
+
+
+def _xmap_dumps(sample, ring):
+    if ring is not None:
+        f = io.BytesIO()
+        pickler = _XmapArrayPickler(f)
+        pickler.dump(sample)
+        if pickler.arrays:
+            slab_batch = ring.write(pickler.arrays)
+            if slab_batch is not None:
+                return f.getvalue(), slab_batch
+    # no array in sample or no free slab, pickle the whole sample
+    return pickle.dumps(sample, protocol=4), None
+
+
+def _xmap_loads(data, slab_batch, slab_reader):
+    if slab_batch is None:
+        return pickle.loads(data)
+    arrays = slab_reader.read_numpy(slab_batch)
+    return _XmapArrayUnpickler(io.BytesIO(data), arrays).load()
+
+
+def _xmap_process_worker(
+    mapper, worker_id, in_queue, out_queue, slab_status, slabs_per_worker
+):
+    ring = None
+    if slab_status is not None:
+        ring = _SharedMemorySlabRing(worker_id, slabs_per_worker, slab_status)
+    try:
+        while True:
+            ins = in_queue.get()
+            if ins is None:
+                # all results are received by the main process or it has
+                # stopped reading, do not block exiting on unsent results
+                out_queue.cancel_join_thread()
+                break
+            idx, sample = ins
+            try:
+                # NOTE: pickle in worker instead of in the feeder thread of
+                # out_queue, so that unpicklable samples are reported
+                payload = _xmap_dumps(mapper(sample), ring)
+            except Exception:
+                payload = _XmapWorkerError(traceback.format_exc())
+            out_queue.put((idx, payload))
+    finally:
+        if ring is not None:
+            ring.close()
+
+
+def _xmap_readers_process(mapper, reader, process_num, buffer_size, order):
+    if sys.platform == 'win32':
+        raise NotImplementedError(
+            "The xmap_readers method with use_process=True is not supported "
+            "on windows."
+        )
+    assert process_num > 0, "process_num should be a positive value"
+    assert buffer_size > 0, "buffer_size should be a positive value"
+
+    def get_result(out_queue, workers):
+        while True:
+            try:
+                return out_queue.get(timeout=_XMAP_POLL_INTERVAL)
+            except queue.Empty:
+                failed = [w.pid for w in workers if not w.is_alive()]
+                if failed:
+                    raise RuntimeError(
+                        "xmap_readers worker (pid(s) {}) exited "
+                        "unexpectedly.".format(failed)
+                    )
+
+    def xreader():
+        # NOTE: queues are not bounded, the number of samples in flight is
+        # bounded by buffer_size when dispatching
+        in_queue = fork_context.Queue()
+        out_queue = fork_context.Queue()
+        slab_status = None
+        slab_reader = None
+        if shared_memory is not None:
+            slab_status = _create_slab_status(
+                process_num, _XMAP_SLABS_PER_WORKER
+            )
+            slab_reader = _SharedMemorySlabReader(slab_status)
+
+        workers = []
+        for worker_id in range(process_num):
+            worker = fork_context.Process(
+                target=_xmap_process_worker,
+                args=(
+                    mapper,
+                    worker_id,
+                    in_queue,
+                    out_queue,
+                    slab_status,
+                    _XMAP_SLABS_PER_WORKER,
+                ),
+            )
+            worker.daemon = True
+            worker.start()
+            workers.append(worker)
+
+        samples = reader()
+        exhausted = False
+        send_idx = 0
+        yield_idx = 0
+        # mapped samples arrived ahead of their turn when order is True
+        reorder = {}
+        try:
+            while True:
+                while not exhausted and send_idx - yield_idx < buffer_size:
+                    try:
+                        sample = next(samples)
+                    except StopIteration:
+                        exhausted = True
+                        break
+                    in_queue.put((send_idx, sample))
+                    send_idx += 1
+
+                if exhausted and yield_idx == send_idx:
+                    break
+                if order and yield_idx in reorder:
+                    sample = reorder.pop(yield_idx)
+                    yield_idx += 1
+                    yield sample
+                    continue
+
+                idx, payload = get_result(out_queue, workers)
+                if isinstance(payload, _XmapWorkerError):
+                    raise RuntimeError(
+                        "xmap_readers worker failed to map sample {}:\n"
+                        "{}".format(idx, payload.message)
+                    )
+                sample = _xmap_loads(payload[0], payload[1], slab_reader)
+                if order:
+                    reorder[idx] = sample
+                else:
+                    yield_idx += 1
+                    yield sample
+        finally:
+            for _ in workers:
+                in_queue.put(None)
+            for worker in workers:
+                worker.join(timeout=_XMAP_POLL_INTERVAL)
+                if worker.is_alive():
+                    worker.terminate()
+            in_queue.cancel_join_thread()
+            if slab_reader is not None:
+                slab_reader.close()
+
+    return xreader
+
+
 def multiprocess_reader(readers, use_pipe=True, queue_size=1000):
     """
     This API use python ``multiprocessing`` to read data from ``readers`` parallelly,
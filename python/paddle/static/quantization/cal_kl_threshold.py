@@ -78,7 +78,72 @@ def safe_entropy(reference_distr_P, P_sum, candidate_distr_Q, Q_sum):
     return (tmp_sum1 - tmp_sum2) / P_sum
 
 
-def cal_kl_threshold(hist, bin_width, bits):
+def _kl_divergences(hist, P_sum, candidates, quant_range):
+    '''
+    Calculate the KL divergences of all candidate thresholds at once, which
+    gives the same values as `safe_entropy` of each candidate.
+
+    Args:
+        hist(np.ndarray): The hist of the tensor, in float64.
+        P_sum(float): The sum of hist.
+        candidates(np.ndarray): The candidate bin indices i, the reference
+            distribution of candidate i is hist[0:i].
+        quant_range(int): The number of quantized bins.
+    '''
+    hist_bins = hist.shape[0]
+    rows = np.arange(len(candidates))
+    cols = np.arange(hist_bins)
+    inside = cols < candidates[:, None]
+
+    # reference distribution P: hist[0:i], outliers are added to the last bin
+    outliers = np.append(np.cumsum(hist[::-1])[::-1], 0.0)
+    P = np.where(inside, hist, 0.0)
+    P[rows, candidates - 1] += outliers[candidates]
+    P_nonzero = P != 0
+
+    # candidate distribution Q: hist[0:i] merged into quant_range bins, the
+    # last merged bin takes the remaining bins, and then expanded back to
+    # the nonzero bins of P
+    num_merged_bins = candidates // quant_range
+    merged_idx = np.minimum(
+        cols // np.maximum(num_merged_bins, 1)[:, None], quant_range - 1
+    )
+    merged_idx[num_merged_bins == 0] = quant_range - 1
+    flat_idx = (merged_idx + rows[:, None] * quant_range)[inside]
+    size = len(candidates) * quant_range
+    merged_sum = np.bincount(
+        flat_idx,
+        weights=np.broadcast_to(hist, P.shape)[inside],
+        minlength=size,
+    )
+    merged_nonzero = np.bincount(
+        flat_idx, weights=P_nonzero[inside], minlength=size
+    )
+    avg_bin_ele = np.divide(
+        merged_sum,
+        merged_nonzero,
+        out=np.zeros(size),
+        where=merged_nonzero > 0,
+    ).reshape([len(candidates), quant_range])
+    Q = np.where(
+        P_nonzero, np.take_along_axis(avg_bin_ele, merged_idx, axis=1), 0.0
+    )
+    Q_sum = np.sum(Q, axis=1, keepdims=True)
+
+    P_safe = np.where(P_nonzero, P, 1.0)
+    Q_safe = np.where(P_nonzero, Q, 1.0)
+    if np.any(Q_safe == 0):
+        _logger.error("Fatal error!, qindex = 0 for nonzero p_idx!")
+    tmp_sum1 = np.sum(
+        np.where(P_nonzero, P * np.log(Q_sum * P_safe), 0.0), axis=1
+    )
+    tmp_sum2 = np.sum(
+        np.where(P_nonzero, P * np.log(P_sum * Q_safe), 0.0), axis=1
+    )
+    return (tmp_sum1 - tmp_sum2) / P_sum
+
+
+def cal_kl_threshold(hist, bin_width, bits, batch_size=256):
     '''
     Using the KL-divergenc method to get the more precise threshold.
 
@@ -86,53 +151,32 @@ def cal_kl_threshold(hist, bin_width, bits):
         hist(List): The hist of the tensor.
         bin_width(float): The bin width for the hist.
         bits(int): The quantization bits.
+        batch_size(int): The number of candidate thresholds to evaluate at
+            once, which bounds the memory of the search.
     '''
     assert hist.ndim == 1
     hist_bins = hist.shape[0]
     starting_iter = int((hist_bins - 1) * 0.5)
     quant_range = 2 ** (bits - 1) - 1
 
-    P_sum = np.sum(np.array(hist).ravel())
-    min_kl_divergence = 0
-    min_kl_index = 0
-    kl_inited = False
-
-    for i in range(starting_iter, hist_bins):
-        reference_distr_P = hist[0:i].tolist()
-        outliers_count = sum(hist[i:])
-        if reference_distr_P[i - 1] == 0:
-            continue
-        reference_distr_P[i - 1] += outliers_count
-        reference_distr_bins = reference_distr_P[:]
-        candidate_distr_Q = hist[0:i].tolist()
-        num_merged_bins = int(i / quant_range)
-        candidate_distr_Q_quantized = [0] * quant_range
-        j_start = 0
-        j_end = num_merged_bins
-        for idx in range(quant_range):
-            candidate_distr_Q_quantized[idx] = sum(
-                candidate_distr_Q[j_start:j_end]
-            )
-            j_start += num_merged_bins
-            j_end += num_merged_bins
-            if (idx + 1) == quant_range - 1:
-                j_end = i
-        candidate_distr_Q = expand_quantized_bins(
-            candidate_distr_Q_quantized, reference_distr_bins
+    hist_data = np.array(hist, dtype='float64').ravel()
+    P_sum = np.sum(hist_data)
+    candidates = np.arange(max(starting_iter, 1), hist_bins)
+    # candidates whose last reference bin is empty are skipped
+    candidates = candidates[hist_data[candidates - 1] != 0]
+
+    kl_divergences = [
+        _kl_divergences(
+            hist_data, P_sum, candidates[i : i + batch_size], quant_range
         )
-        Q_sum = sum(candidate_distr_Q)
-        kl_divergence = safe_entropy(
-            reference_distr_P, P_sum, candidate_distr_Q, Q_sum
+        for i in range(0, len(candidates), batch_size)
+    ]
+    min_kl_index = 0
+    if len(candidates) > 0:
+        # the first one is taken if several candidates get the min value
+        min_kl_index = int(
+            candidates[np.argmin(np.concatenate(kl_divergences))]
         )
-        if not kl_inited:
-            min_kl_divergence = kl_divergence
-            min_kl_index = i
-            kl_inited = True
-        elif kl_divergence < min_kl_divergence:
-            min_kl_divergence = kl_divergence
-            min_kl_index = i
-        else:
-            pass
     if min_kl_index == 0:
         while starting_iter > 0:
             if hist[starting_iter] == 0:
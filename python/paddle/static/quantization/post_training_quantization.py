@@ -15,6 +15,7 @@
 import logging
 import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 
@@ -57,6 +58,19 @@ _logger = get_logger(
 )
 
 
+# the max number of elements quantized at once in the mse/emd threshold
+# search, which bounds the memory of the batched search
+_MAX_SEARCH_ELEMENTS = 2**23
+
+
+def _channel_wise_reduce(var_tensor, reduce_fn, axis):
+    '''
+    Reduce all dims except the channel axis, returns a list of float.
+    '''
+    dims = tuple(d for d in range(var_tensor.ndim) if d != axis)
+    return reduce_fn(var_tensor, axis=dims).astype('float64').tolist()
+
+
 def _all_persistable_var_names(program):
     persistable_var_names = []
     for var in program.list_vars():
@@ -390,6 +404,8 @@ class PostTrainingQuantization:
         # If the tensor is zero-size during any calibration step,
         # it will be stored in self._zero_size_var_names
         self._zero_size_var_names = set()
+        # threads to calculate the statistics of activations concurrently
+        self._calibration_threads = min(8, os.cpu_count() or 1)
         self._same_scale_tensor_list = same_scale_tensor_list
         self._freeze_model = freeze_model
         self._scale_dict = scale_dict
@@ -744,6 +760,56 @@ class PostTrainingQuantization:
                 var.persistable = False
                 self._scope.find_var(var.name).get_tensor()._clear()
 
+    def _weight_channel_axis(self, var_name):
+        if (
+            self._weight_op_pairs[var_name]
+            in utils._channelwise_quant_axis1_ops
+        ):
+            return 1
+        return 0
+
+    def _calc_weight_abs_max(self, var_name):
+        '''
+        Calculate the abs_max or channel wise abs_max of the weight.
+        '''
+        var_tensor = utils.load_variable_data(self._scope, var_name)
+        if self._weight_quantize_type == "abs_max":
+            return float(np.max(np.abs(var_tensor)))
+        elif self._weight_quantize_type == "channel_wise_abs_max":
+            return _channel_wise_reduce(
+                np.abs(var_tensor), np.max, self._weight_channel_axis(var_name)
+            )
+
+    def _compute_act_stats(self, stat_fn):
+        '''
+        Load the quantized activations and calculate their statistics by
+        :code:`stat_fn(var_name, var_tensor)` in a thread pool, NumPy releases
+        the GIL in the heavy computation so that activations are calculated
+        concurrently. Activations of zero size, or for which :code:`stat_fn`
+        returns None, are skipped and recorded as zero size variables.
+
+        Returns:
+            list: (var_name, statistics) of the non-empty activations.
+        '''
+
+        def compute(var_name):
+            var_tensor = utils.load_variable_data(self._scope, var_name)
+            if var_tensor.size == 0:
+                return None
+            return stat_fn(var_name, var_tensor)
+
+        var_names = list(self._quantized_act_var_name)
+        with ThreadPoolExecutor(self._calibration_threads) as executor:
+            results = list(executor.map(compute, var_names))
+
+        stats = []
+        for var_name, stat in zip(var_names, results):
+            if stat is None:
+                self._zero_size_var_names.add(var_name)
+                continue
+            stats.append((var_name, stat))
+        return stats
+
     def _sampling(self):
         '''
         Sample the min/max, abs_max or histogram in every iterations.
@@ -766,95 +832,60 @@ class PostTrainingQuantization:
     def _sample_mse(self):
         if self._quantized_threshold == {}:
             for var_name in self._quantized_weight_var_name:
-                var_tensor = utils.load_variable_data(self._scope, var_name)
-                if self._weight_quantize_type == "abs_max":
-                    abs_max_value = float(np.max(np.abs(var_tensor)))
-                elif self._weight_quantize_type == "channel_wise_abs_max":
-                    abs_max_value = []
-                    if (
-                        self._weight_op_pairs[var_name]
-                        in utils._channelwise_quant_axis1_ops
-                    ):
-                        for i in range(var_tensor.shape[1]):
-                            abs_max_value.append(
-                                float(np.max(np.abs(var_tensor[:, i])))
-                            )
-                    else:
-                        for i in range(var_tensor.shape[0]):
-                            abs_max_value.append(
-                                float(np.max(np.abs(var_tensor[i])))
-                            )
-                self._quantized_threshold[var_name] = abs_max_value
+                self._quantized_threshold[var_name] = self._calc_weight_abs_max(
+                    var_name
+                )
         _logger.info("MSE searching stage ...")
-        for var_name in self._quantized_act_var_name:
-            var_tensor = utils.load_variable_data(self._scope, var_name)
-            if var_tensor.size == 0:
-                self._zero_size_var_names.add(var_name)
-                continue
-            var_tensor = var_tensor.flatten()
-            abs_max_value = float(np.max(np.abs(var_tensor)))
-            abs_max_value = 1e-8 if abs_max_value == 0.0 else abs_max_value
-            s = 0.3
-            if var_name not in self._best_calibration_loss:
-                self._best_calibration_loss[var_name] = float('inf')
-            while s <= 1.0:
-                scale = s * abs_max_value
-                s += 0.02
-                bins = 2 ** (self._activation_bits - 1) - 1
-                if self._onnx_format:
-                    quant_var = np.clip(
-                        np.round(var_tensor / scale * bins), -bins - 1, bins
-                    )
-                    quant_dequant_var = quant_var / bins * scale
-                else:
-                    quant_dequant_var = (
-                        np.round(np.clip(var_tensor, 0.0, scale) / scale * bins)
-                        / bins
-                        * scale
-                    )
-                mse_loss = ((var_tensor - quant_dequant_var) ** 2).mean()
-                if mse_loss <= self._best_calibration_loss[var_name]:
-                    self._best_calibration_loss[var_name] = mse_loss
-                    self._quantized_threshold[var_name] = scale
+
+        def mse_loss(var_tensor, quant_dequant_var):
+            return ((var_tensor - quant_dequant_var) ** 2).mean(axis=1)
+
+        self._search_act_threshold(mse_loss)
 
     def _sample_emd(self):
         if self._quantized_threshold == {}:
             for var_name in self._quantized_weight_var_name:
-                var_tensor = utils.load_variable_data(self._scope, var_name)
-                if self._weight_quantize_type == "abs_max":
-                    abs_max_value = float(np.max(np.abs(var_tensor)))
-                elif self._weight_quantize_type == "channel_wise_abs_max":
-                    abs_max_value = []
-                    if (
-                        self._weight_op_pairs[var_name]
-                        in utils._channelwise_quant_axis1_ops
-                    ):
-                        for i in range(var_tensor.shape[1]):
-                            abs_max_value.append(
-                                float(np.max(np.abs(var_tensor[:, i])))
-                            )
-                    else:
-                        for i in range(var_tensor.shape[0]):
-                            abs_max_value.append(
-                                float(np.max(np.abs(var_tensor[i])))
-                            )
-                self._quantized_threshold[var_name] = abs_max_value
+                self._quantized_threshold[var_name] = self._calc_weight_abs_max(
+                    var_name
+                )
         _logger.info("EMD searching stage ...")
-        for var_name in self._quantized_act_var_name:
-            var_tensor = utils.load_variable_data(self._scope, var_name)
-            if var_tensor.size == 0:
-                self._zero_size_var_names.add(var_name)
-                continue
+
+        def emd_loss(var_tensor, quant_dequant_var):
+            return np.abs(
+                np.mean(var_tensor) - np.mean(quant_dequant_var, axis=1)
+            ) + np.abs(np.std(var_tensor) - np.std(quant_dequant_var, axis=1))
+
+        self._search_act_threshold(emd_loss)
+
+    def _search_act_threshold(self, loss_fn):
+        '''
+        Search the scale of activations which minimizes the calibration loss,
+        :code:`loss_fn(var_tensor, quant_dequant_var)` returns the loss of
+        each row of the quant-dequantized activations, one row per scale.
+        '''
+        bins = 2 ** (self._activation_bits - 1) - 1
+
+        def search(var_name, var_tensor):
             var_tensor = var_tensor.flatten()
             abs_max_value = float(np.max(np.abs(var_tensor)))
             abs_max_value = 1e-8 if abs_max_value == 0.0 else abs_max_value
+            scales = []
             s = 0.3
-            if var_name not in self._best_calibration_loss:
-                self._best_calibration_loss[var_name] = float('inf')
             while s <= 1.0:
-                scale = s * abs_max_value
+                scales.append(s * abs_max_value)
                 s += 0.02
-                bins = 2 ** (self._activation_bits - 1) - 1
+            dtype = (
+                var_tensor.dtype
+                if np.issubdtype(var_tensor.dtype, np.floating)
+                else np.float64
+            )
+            # quant-dequantize with a batch of scales at once
+            batch_size = max(1, _MAX_SEARCH_ELEMENTS // var_tensor.size)
+            losses = []
+            for begin in range(0, len(scales), batch_size):
+                scale = np.array(
+                    scales[begin : begin + batch_size], dtype=dtype
+                ).reshape([-1, 1])
                 if self._onnx_format:
                     quant_var = np.clip(
                         np.round(var_tensor / scale * bins), -bins - 1, bins
@@ -866,45 +897,27 @@ class PostTrainingQuantization:
                         / bins
                         * scale
                     )
-                emd_loss = np.abs(
-                    np.mean(var_tensor) - np.mean(quant_dequant_var)
-                ) + np.abs(np.std(var_tensor) - np.std(quant_dequant_var))
-                if emd_loss <= self._best_calibration_loss[var_name]:
-                    self._best_calibration_loss[var_name] = emd_loss
+                losses.extend(loss_fn(var_tensor, quant_dequant_var).tolist())
+            return scales, losses
+
+        for var_name, result in self._compute_act_stats(search):
+            scales, losses = result
+            if var_name not in self._best_calibration_loss:
+                self._best_calibration_loss[var_name] = float('inf')
+            for scale, loss in zip(scales, losses):
+                if loss <= self._best_calibration_loss[var_name]:
+                    self._best_calibration_loss[var_name] = loss
                     self._quantized_threshold[var_name] = scale
 
     def _sample_avg(self):
         if self._quantized_threshold == {}:
             for var_name in self._quantized_weight_var_name:
-                var_tensor = utils.load_variable_data(self._scope, var_name)
-                if self._weight_quantize_type == "abs_max":
-                    abs_max_value = float(np.max(np.abs(var_tensor)))
-                elif self._weight_quantize_type == "channel_wise_abs_max":
-                    abs_max_value = []
-                    if (
-                        self._weight_op_pairs[var_name]
-                        in utils._channelwise_quant_axis1_ops
-                    ):
-                        for i in range(var_tensor.shape[1]):
-                            abs_max_value.append(
-                                float(np.max(np.abs(var_tensor[:, i])))
-                            )
-                    else:
-                        for i in range(var_tensor.shape[0]):
-                            abs_max_value.append(
-                                float(np.max(np.abs(var_tensor[i])))
-                            )
-                self._quantized_threshold[var_name] = abs_max_value
+                self._quantized_threshold[var_name] = self._calc_weight_abs_max(
+                    var_name
+                )
 
-        for var_name in self._quantized_act_var_name:
-            var_tensor = utils.load_variable_data(self._scope, var_name)
-            if var_tensor.size == 0:
-                self._zero_size_var_names.add(var_name)
-                continue
-            abs_max_value = float(np.max(np.abs(var_tensor)))
-            if var_name not in self._quantized_var_avg:
-                self._quantized_var_avg[var_name] = []
-            abs_avg_value = float(
+        def abs_avg(var_name, var_tensor):
+            return float(
                 np.mean(
                     np.max(
                         np.abs(var_tensor.reshape(var_tensor.shape[0], -1)),
@@ -912,37 +925,23 @@ class PostTrainingQuantization:
                     )
                 )
             )
+
+        for var_name, abs_avg_value in self._compute_act_stats(abs_avg):
+            if var_name not in self._quantized_var_avg:
+                self._quantized_var_avg[var_name] = []
             self._quantized_var_avg[var_name].append(abs_avg_value)
 
     def _sample_abs_max(self):
         if self._quantized_threshold == {}:
             for var_name in self._quantized_weight_var_name:
-                var_tensor = utils.load_variable_data(self._scope, var_name)
-                if self._weight_quantize_type == "abs_max":
-                    abs_max_value = float(np.max(np.abs(var_tensor)))
-                elif self._weight_quantize_type == "channel_wise_abs_max":
-                    abs_max_value = []
-                    if (
-                        self._weight_op_pairs[var_name]
-                        in utils._channelwise_quant_axis1_ops
-                    ):
-                        for i in range(var_tensor.shape[1]):
-                            abs_max_value.append(
-                                float(np.max(np.abs(var_tensor[:, i])))
-                            )
-                    else:
-                        for i in range(var_tensor.shape[0]):
-                            abs_max_value.append(
-                                float(np.max(np.abs(var_tensor[i])))
-                            )
-                self._quantized_threshold[var_name] = abs_max_value
+                self._quantized_threshold[var_name] = self._calc_weight_abs_max(
+                    var_name
+                )
 
-        for var_name in self._quantized_act_var_name:
-            var_tensor = utils.load_variable_data(self._scope, var_name)
-            if var_tensor.size == 0:
-                self._zero_size_var_names.add(var_name)
-                continue
-            abs_max_value = float(np.max(np.abs(var_tensor)))
+        def abs_max(var_name, var_tensor):
+            return float(np.max(np.abs(var_tensor)))
+
+        for var_name, abs_max_value in self._compute_act_stats(abs_max):
             if (var_name not in self._quantized_threshold) or (
                 abs_max_value > self._quantized_threshold[var_name]
             ):
@@ -956,29 +955,18 @@ class PostTrainingQuantization:
                     min_value = float(np.min(var_tensor))
                     max_value = float(np.max(var_tensor))
                 elif self._weight_quantize_type == "channel_wise_abs_max":
-                    min_value = []
-                    max_value = []
-                    if (
-                        self._weight_op_pairs[var_name]
-                        in utils._channelwise_quant_axis1_ops
-                    ):
-                        for i in range(var_tensor.shape[1]):
-                            min_value.append(float(np.min(var_tensor[:, i])))
-                            max_value.append(float(np.max(var_tensor[:, i])))
-                    else:
-                        for i in range(var_tensor.shape[0]):
-                            min_value.append(float(np.min(var_tensor[i])))
-                            max_value.append(float(np.max(var_tensor[i])))
+                    axis = self._weight_channel_axis(var_name)
+                    min_value = _channel_wise_reduce(var_tensor, np.min, axis)
+                    max_value = _channel_wise_reduce(var_tensor, np.max, axis)
                 self._quantized_var_min[var_name] = min_value
                 self._quantized_var_max[var_name] = max_value
 
-        for var_name in self._quantized_act_var_name:
-            var_tensor = utils.load_variable_data(self._scope, var_name)
-            if var_tensor.size == 0:
-                self._zero_size_var_names.add(var_name)
-                continue
-            min_value = float(np.min(var_tensor))
-            max_value = float(np.max(var_tensor))
+        def min_max(var_name, var_tensor):
+            return float(np.min(var_tensor)), float(np.max(var_tensor))
+
+        for var_name, (min_value, max_value) in self._compute_act_stats(
+            min_max
+        ):
             if (var_name not in self._quantized_var_min) or (
                 min_value < self._quantized_var_min[var_name]
             ):
@@ -989,16 +977,21 @@ class PostTrainingQuantization:
                 self._quantized_var_max[var_name] = max_value
 
     def _sample_histogram(self):
-        for var_name in self._quantized_act_var_name:
-            var_tensor = utils.load_variable_data(self._scope, var_name)
-            if (var_tensor.size == 0) or (
-                var_name not in self._sampling_act_histogram
-            ):
-                self._zero_size_var_names.add(var_name)
-                continue
-            var_tensor_abs = np.abs(var_tensor)
-            bins = self._sampling_act_histogram[var_name][1]
-            hist, _ = np.histogram(var_tensor_abs, bins=bins)
+        def histogram(var_name, var_tensor):
+            if var_name not in self._sampling_act_histogram:
+                return None
+            # NOTE: the edges are evenly spaced, passing the number of bins
+            # and the range takes the fast path of np.histogram, which gives
+            # the same result as passing the edges
+            edges = self._sampling_act_histogram[var_name][1]
+            hist, _ = np.histogram(
+                np.abs(var_tensor),
+                bins=len(edges) - 1,
+                range=(edges[0], edges[-1]),
+            )
+            return hist
+
+        for var_name, hist in self._compute_act_stats(histogram):
             self._sampling_act_histogram[var_name][0] += hist
 
     def _sample_ptf(self):
@@ -1008,31 +1001,11 @@ class PostTrainingQuantization:
         """
         if self._quantized_threshold == {}:
             for var_name in self._quantized_weight_var_name:
-                var_tensor = utils.load_variable_data(self._scope, var_name)
-                if self._weight_quantize_type == "abs_max":
-                    abs_max_value = float(np.max(np.abs(var_tensor)))
-                elif self._weight_quantize_type == "channel_wise_abs_max":
-                    abs_max_value = []
-                    if (
-                        self._weight_op_pairs[var_name]
-                        in utils._channelwise_quant_axis1_ops
-                    ):
-                        for i in range(var_tensor.shape[1]):
-                            abs_max_value.append(
-                                float(np.max(np.abs(var_tensor[:, i])))
-                            )
-                    else:
-                        for i in range(var_tensor.shape[0]):
-                            abs_max_value.append(
-                                float(np.max(np.abs(var_tensor[i])))
-                            )
-                self._quantized_threshold[var_name] = abs_max_value
+                self._quantized_threshold[var_name] = self._calc_weight_abs_max(
+                    var_name
+                )
 
-        for var_name in self._quantized_act_var_name:
-            var_tensor = utils.load_variable_data(self._scope, var_name)
-            if var_tensor.size == 0:
-                self._zero_size_var_names.add(var_name)
-                continue
+        def ptf_threshold(var_name, var_tensor):
             abs_max_value = float(np.max(np.abs(var_tensor)))
             q_max = 2 ** (self._activation_bits - 1) - 1
             scale8 = abs_max_value / q_max
@@ -1058,7 +1031,9 @@ class PostTrainingQuantization:
             score = [score1, score2, score4, score8]
             mask = 2 ** score.index(min(score))
             scale = scale1 * mask
-            threshold = q_max * scale
+            return q_max * scale
+
+        for var_name, threshold in self._compute_act_stats(ptf_threshold):
             self._quantized_threshold[var_name] = threshold
 
     def _save_input_threhold(self):
@@ -1091,14 +1066,14 @@ class PostTrainingQuantization:
         Collect the abs_min and abs_max for all activation. When algo = KL,
         get the min and max value, and then calculate the threshold.
         '''
-        for var_name in self._quantized_act_var_name:
-            var_tensor = utils.load_variable_data(self._scope, var_name)
-            if var_tensor.size == 0:
-                self._zero_size_var_names.add(var_name)
-                continue
+
+        def abs_min_max(var_name, var_tensor):
             var_tensor = np.abs(var_tensor)
-            min_value = float(np.min(var_tensor))
-            max_value = float(np.max(var_tensor))
+            return float(np.min(var_tensor)), float(np.max(var_tensor))
+
+        for var_name, (min_value, max_value) in self._compute_act_stats(
+            abs_min_max
+        ):
             if var_name not in self._sampling_act_abs_min_max:
                 self._sampling_act_abs_min_max[var_name] = [
                     min_value,
@@ -1136,41 +1111,26 @@ class PostTrainingQuantization:
 
         # Abs_max threshold for weights
         for var_name in self._quantized_weight_var_name:
-            weight_data = utils.load_variable_data(self._scope, var_name)
-            if self._weight_quantize_type == "abs_max":
-                weight_threshold = float(np.max(np.abs(weight_data)))
-            elif self._weight_quantize_type == "channel_wise_abs_max":
-                weight_threshold = []
-                if (
-                    self._weight_op_pairs[var_name]
-                    in utils._channelwise_quant_axis1_ops
-                ):
-                    for i in range(weight_data.shape[1]):
-                        weight_threshold.append(
-                            float(np.max(np.abs(weight_data[:, i])))
-                        )
-                else:
-                    for i in range(weight_data.shape[0]):
-                        weight_threshold.append(
-                            float(np.max(np.abs(weight_data[i])))
-                        )
-            self._quantized_var_threshold[var_name] = weight_threshold
+            self._quantized_var_threshold[var_name] = self._calc_weight_abs_max(
+                var_name
+            )
 
-        for var_name in self._quantized_act_var_name:
-            if (var_name in self._zero_size_var_names) and (
-                var_name not in self._sampling_act_histogram
-            ):
-                continue
+        def threshold(var_name):
             hist, hist_edeges = self._sampling_act_histogram[var_name]
             if self._algo == "KL":
                 bin_width = hist_edeges[1] - hist_edeges[0]
-                self._quantized_var_threshold[var_name] = cal_kl_threshold(
-                    hist, bin_width, self._activation_bits
-                )
-            elif self._algo == "hist":
-                self._quantized_var_threshold[
-                    var_name
-                ] = self._get_hist_scaling_factor(hist, hist_edeges)
+                return cal_kl_threshold(hist, bin_width, self._activation_bits)
+            return self._get_hist_scaling_factor(hist, hist_edeges)
+
+        var_names = [
+            var_name
+            for var_name in self._quantized_act_var_name
+            if (var_name not in self._zero_size_var_names)
+            or (var_name in self._sampling_act_histogram)
+        ]
+        with ThreadPoolExecutor(self._calibration_threads) as executor:
+            thresholds = list(executor.map(threshold, var_names))
+        self._quantized_var_threshold.update(zip(var_names, thresholds))
 
     def _update_program(self):
         '''
@@ -22,6 +22,8 @@ import numpy as np
 from paddle.dataset.common import _check_exists_and_download
 from paddle.io import Dataset
 
+from . import token_cache
+
 __all__ = []
 
 URL = 'https://dataset.bj.bcebos.com/imdb%2FaclImdb_v1.tar.gz'
@@ -87,19 +89,24 @@ class Imdb(Dataset):
                 data_file, URL, MD5, 'imdb', download
             )
 
-        # Build a word dictionary from the corpus
-        self.word_idx = self._build_work_dict(cutoff)
-
-        # read dataset into memory
-        self._load_anno()
-
-    def _build_work_dict(self, cutoff):
-        word_freq = collections.defaultdict(int)
-        pattern = re.compile(r"aclImdb/((train)|(test))/((pos)|(neg))/.*\.txt$")
-        for doc in self._tokenize(pattern):
-            for word in doc:
-                word_freq[word] += 1
+        # tokenized corpus is cached, see NOTE: [ tokenized corpus cache ]
+        path = token_cache.cache_path('imdb', self.data_file, self.mode, cutoff)
+        cached = token_cache.load(path)
+        if cached is not None:
+            meta, fields = cached
+            self.word_idx = meta['word_idx']
+            self.docs = fields['docs']
+            self.labels = fields['labels']
+        else:
+            # read dataset into memory
+            self._load_anno(cutoff)
+            token_cache.save(
+                path,
+                {'word_idx': self.word_idx},
+                {'docs': self.docs, 'labels': self.labels},
+            )
 
+    def _build_work_dict(self, word_freq, cutoff):
         # Not sure if we should prune less-frequent words here.
         word_freq = [x for x in word_freq.items() if x[1] > cutoff]
 
@@ -110,13 +117,12 @@ class Imdb(Dataset):
         return word_idx
 
     def _tokenize(self, pattern):
-        data = []
         with tarfile.open(self.data_file) as tarf:
             tf = tarf.next()
             while tf is not None:
                 if bool(pattern.match(tf.name)):
                     # newline and punctuations removal and ad-hoc tokenization.
-                    data.append(
+                    yield tf.name, (
                         tarf.extractfile(tf)
                         .read()
                         .rstrip(b'\n\r')
@@ -126,25 +132,38 @@ class Imdb(Dataset):
                     )
                 tf = tarf.next()
 
-        return data
+    def _load_anno(self, cutoff):
+        # the word dictionary is built from both train and test documents,
+        # they are tokenized in one pass over the tar file
+        pattern = re.compile(r"aclImdb/((train)|(test))/((pos)|(neg))/.*\.txt$")
+        pos_prefix = f"aclImdb/{self.mode}/pos/"
+        neg_prefix = f"aclImdb/{self.mode}/neg/"
 
-    def _load_anno(self):
-        pos_pattern = re.compile(fr"aclImdb/{self.mode}/pos/.*\.txt$")
-        neg_pattern = re.compile(fr"aclImdb/{self.mode}/neg/.*\.txt$")
+        word_freq = collections.defaultdict(int)
+        pos_docs = []
+        neg_docs = []
+        for name, doc in self._tokenize(pattern):
+            for word in doc:
+                word_freq[word] += 1
+            if name.startswith(pos_prefix):
+                pos_docs.append(doc)
+            elif name.startswith(neg_prefix):
+                neg_docs.append(doc)
 
+        # Build a word dictionary from the corpus
+        self.word_idx = self._build_work_dict(word_freq, cutoff)
         UNK = self.word_idx['<unk>']
 
-        self.docs = []
-        self.labels = []
-        for doc in self._tokenize(pos_pattern):
-            self.docs.append([self.word_idx.get(w, UNK) for w in doc])
-            self.labels.append(0)
-        for doc in self._tokenize(neg_pattern):
-            self.docs.append([self.word_idx.get(w, UNK) for w in doc])
-            self.labels.append(1)
+        self.docs = token_cache.TokenArray.from_sequences(
+            [[self.word_idx.get(w, UNK) for w in doc] for doc in pos_docs]
+            + [[self.word_idx.get(w, UNK) for w in doc] for doc in neg_docs]
+        )
+        self.labels = np.array(
+            [0] * len(pos_docs) + [1] * len(neg_docs), dtype=np.int64
+        )
 
     def __getitem__(self, idx):
-        return (np.array(self.docs[idx]), np.array([self.labels[idx]]))
+        return (np.array(self.docs[idx]), np.array(self.labels[idx : idx + 1]))
 
     def __len__(self):
         return len(self.docs)
@@ -20,6 +20,8 @@ import numpy as np
 from paddle.dataset.common import _check_exists_and_download
 from paddle.io import Dataset
 
+from . import token_cache
+
 __all__ = []
 
 URL = 'https://dataset.bj.bcebos.com/imikolov%2Fsimple-examples.tgz'
@@ -104,11 +106,27 @@ class Imikolov(Dataset):
                 data_file, URL, MD5, 'imikolov', download
             )
 
-        # Build a word dictionary from the corpus
-        self.word_idx = self._build_work_dict(min_word_freq)
-
-        # read dataset into memory
-        self._load_anno()
+        # tokenized corpus is cached, see NOTE: [ tokenized corpus cache ]
+        path = token_cache.cache_path(
+            'imikolov',
+            self.data_file,
+            self.mode,
+            self.data_type,
+            window_size,
+            min_word_freq,
+        )
+        cached = token_cache.load(path)
+        if cached is not None:
+            meta, fields = cached
+            self.word_idx = meta['word_idx']
+            self.data = fields
+        else:
+            # Build a word dictionary from the corpus
+            self.word_idx = self._build_work_dict(min_word_freq)
+
+            # read dataset into memory
+            self._load_anno()
+            token_cache.save(path, {'word_idx': self.word_idx}, self.data)
 
     def word_count(self, f, word_freq=None):
         if word_freq is None:
@@ -145,7 +163,9 @@ class Imikolov(Dataset):
         return word_idx
 
     def _load_anno(self):
-        self.data = []
+        grams = []
+        src_seqs = []
+        trg_seqs = []
         with tarfile.open(self.data_file) as tf:
             filename = f'./simple-examples/data/ptb.{self.mode}.txt'
             f = tf.extractfile(filename)
@@ -158,7 +178,7 @@ class Imikolov(Dataset):
                     if len(l) >= self.window_size:
                         l = [self.word_idx.get(w, UNK) for w in l]
                         for i in range(self.window_size, len(l) + 1):
-                            self.data.append(tuple(l[i - self.window_size : i]))
+                            grams.append(l[i - self.window_size : i])
                 elif self.data_type == 'SEQ':
                     l = l.strip().split()
                     l = [self.word_idx.get(w, UNK) for w in l]
@@ -166,12 +186,34 @@ class Imikolov(Dataset):
                     trg_seq = l + [self.word_idx['<e>']]
                     if self.window_size > 0 and len(src_seq) > self.window_size:
                         continue
-                    self.data.append((src_seq, trg_seq))
+                    src_seqs.append(src_seq)
+                    trg_seqs.append(trg_seq)
                 else:
                     raise AssertionError('Unknow data type')
 
+        # NGRAM data is a [N, window_size] array, and SEQ data is source and
+        # target sequences in CSR layout
+        if self.data_type == 'NGRAM':
+            self.data = {
+                'grams': np.array(grams, dtype=np.int64).reshape(
+                    [len(grams), max(self.window_size, 0)]
+                )
+            }
+        else:
+            self.data = {
+                'src': token_cache.TokenArray.from_sequences(src_seqs),
+                'trg': token_cache.TokenArray.from_sequences(trg_seqs),
+            }
+
     def __getitem__(self, idx):
-        return tuple([np.array(d) for d in self.data[idx]])
+        if self.data_type == 'NGRAM':
+            return tuple([np.array(d) for d in self.data['grams'][idx]])
+        return (
+            np.array(self.data['src'][idx]),
+            np.array(self.data['trg'][idx]),
+        )
 
     def __len__(self):
-        return len(self.data)
+        if self.data_type == 'NGRAM':
+            return len(self.data['grams'])
+        return len(self.data['src'])
@@ -0,0 +1,196 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# NOTE: [ tokenized corpus cache ]
+# Text datasets tokenize their tar files once and cache the results under
+# `DATA_HOME/<module>/`, one directory for each dataset config:
+#
+#   meta.pkl: the vocabularies and the kind of each field, written last,
+#     so that a cache directory with meta.pkl is complete.
+#   <field>.offsets.npy, <field>.ids.npy: a list of token id sequences in
+#     CSR layout, sequence i is ids[offsets[i]:offsets[i + 1]].
+#   <field>.npy: a plain numpy array, e.g. labels.
+#
+# Arrays are loaded by memory map, so constructing a dataset from cache
+# does not read the whole corpus, and DataLoader workers share the pages.
+
+import hashlib
+import os
+import pickle
+import shutil
+import warnings
+
+import numpy as np
+
+import paddle
+
+__all__ = []
+
+# bump it when the layout of cached files changes
+_CACHE_FORMAT_VERSION = 1
+
+_META_FILE = 'meta.pkl'
+_KIND_TOKENS = 'tokens'
+_KIND_ARRAY = 'array'
+
+
+class TokenArray:
+    """
+    A list of token id sequences in CSR layout, i.e. a flat int64 array of
+    all token ids and the offsets of each sequence in it.
+
+    Args:
+        offsets(numpy.ndarray): int64 array of shape [N + 1].
+        ids(numpy.ndarray): int64 array of all token ids.
+        path(str, optional): prefix of the cache files the arrays are mapped
+            from, arrays are re-mapped from it instead of being copied when
+            pickled, e.g. for spawned DataLoader workers. Default None.
+    """
+
+    def __init__(self, offsets, ids, path=None):
+        self.offsets = offsets
+        self.ids = ids
+        self._path = path
+
+    @classmethod
+    def from_sequences(cls, sequences):
+        lengths = np.fromiter(
+            (len(seq) for seq in sequences),
+            dtype=np.int64,
+            count=len(sequences),
+        )
+        offsets = np.zeros([len(sequences) + 1], dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        ids = np.fromiter(
+            (token for seq in sequences for token in seq),
+            dtype=np.int64,
+            count=int(offsets[-1]),
+        )
+        return cls(offsets, ids)
+
+    @classmethod
+    def load(cls, path):
+        return cls(
+            np.load(path + '.offsets.npy', mmap_mode='r'),
+            np.load(path + '.ids.npy', mmap_mode='r'),
+            path,
+        )
+
+    def save(self, path):
+        np.save(path + '.offsets.npy', self.offsets)
+        np.save(path + '.ids.npy', self.ids)
+
+    def __getitem__(self, idx):
+        return self.ids[self.offsets[idx] : self.offsets[idx + 1]]
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __iter__(self):
+        for idx in range(len(self)):
+            yield self[idx]
+
+    def __getstate__(self):
+        if self._path is not None:
+            return {'path': self._path}
+        return {'offsets': self.offsets, 'ids': self.ids}
+
+    def __setstate__(self, state):
+        if 'path' in state:
+            self.__dict__.update(TokenArray.load(state['path']).__dict__)
+        else:
+            self.__init__(state['offsets'], state['ids'])
+
+
+def cache_path(module_name, data_file, *config):
+    """
+    Returns the cache directory of the dataset :attr:`module_name` built
+    from :attr:`data_file` with :attr:`config`, the cache is invalidated
+    when the data file is modified.
+    """
+    data_file = os.path.abspath(data_file)
+    stat = os.stat(data_file)
+    sha = hashlib.sha256()
+    sha.update(
+        repr(
+            (
+                _CACHE_FORMAT_VERSION,
+                data_file,
+                stat.st_size,
+                stat.st_mtime_ns,
+                config,
+            )
+        ).encode()
+    )
+    return os.path.join(
+        paddle.dataset.common.DATA_HOME,
+        module_name,
+        f'{module_name}-{sha.hexdigest()[:16]}',
+    )
+
+
+def load(path):
+    """
+    Returns the cached (meta, fields) in :attr:`path`, or None if it is
+    not cached. Token fields are loaded as :code:`TokenArray` and the other
+    fields as numpy arrays, both by memory map.
+    """
+    try:
+        with open(os.path.join(path, _META_FILE), 'rb') as f:
+            record = pickle.load(f)
+        fields = {}
+        for name, kind in record['fields'].items():
+            field_path = os.path.join(path, name)
+            if kind == _KIND_TOKENS:
+                fields[name] = TokenArray.load(field_path)
+            else:
+                fields[name] = np.load(field_path + '.npy', mmap_mode='r')
+        return record['meta'], fields
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        warnings.warn(f"Failed to load dataset cache {path}, ignore it: {e}")
+        return None
+
+
+def save(path, meta, fields):
+    """
+    Caches :attr:`meta` (picklable, e.g. vocabularies) and :attr:`fields`
+    (a dict of :code:`TokenArray` or numpy arrays) in :attr:`path`. Caching
+    is skipped with a warning if :attr:`path` is not writable.
+    """
+    # write into a temporary directory and rename it, so that concurrent
+    # processes never read a partially written cache
+    tmp_path = f'{path}.tmp.{os.getpid()}'
+    try:
+        os.makedirs(tmp_path, exist_ok=True)
+        kinds = {}
+        for name, field in fields.items():
+            field_path = os.path.join(tmp_path, name)
+            if isinstance(field, TokenArray):
+                field.save(field_path)
+                kinds[name] = _KIND_TOKENS
+            else:
+                np.save(field_path + '.npy', field)
+                kinds[name] = _KIND_ARRAY
+        with open(os.path.join(tmp_path, _META_FILE), 'wb') as f:
+            pickle.dump({'meta': meta, 'fields': kinds}, f, protocol=4)
+        if not os.path.exists(path):
+            os.rename(tmp_path, path)
+    except OSError as e:
+        if not os.path.exists(os.path.join(path, _META_FILE)):
+            warnings.warn(f"Failed to write dataset cache {path}: {e}")
+    finally:
+        if os.path.exists(tmp_path):
+            shutil.rmtree(tmp_path, ignore_errors=True)
@@ -19,6 +19,8 @@ import numpy as np
 from paddle.dataset.common import _check_exists_and_download
 from paddle.io import Dataset
 
+from . import token_cache
+
 __all__ = []
 
 URL_DEV_TEST = (
@@ -107,7 +109,30 @@ class WMT14(Dataset):
         # read dataset into memory
         assert dict_size > 0, "dict_size should be set as positive number"
         self.dict_size = dict_size
-        self._load_data()
+
+        # tokenized corpus is cached, see NOTE: [ tokenized corpus cache ]
+        path = token_cache.cache_path(
+            'wmt14', self.data_file, self.mode, dict_size
+        )
+        cached = token_cache.load(path)
+        if cached is not None:
+            meta, fields = cached
+            self.src_dict = meta['src_dict']
+            self.trg_dict = meta['trg_dict']
+            self.src_ids = fields['src_ids']
+            self.trg_ids = fields['trg_ids']
+            self.trg_ids_next = fields['trg_ids_next']
+        else:
+            self._load_data()
+            token_cache.save(
+                path,
+                {'src_dict': self.src_dict, 'trg_dict': self.trg_dict},
+                {
+                    'src_ids': self.src_ids,
+                    'trg_ids': self.trg_ids,
+                    'trg_ids_next': self.trg_ids_next,
+                },
+            )
 
     def _load_data(self):
         def __to_dict(fd, size):
@@ -119,9 +144,9 @@ class WMT14(Dataset):
                     break
             return out_dict
 
-        self.src_ids = []
-        self.trg_ids = []
-        self.trg_ids_next = []
+        src_ids_list = []
+        trg_ids_list = []
+        trg_ids_next_list = []
         with tarfile.open(self.data_file, mode='r') as f:
             names = [
                 each_item.name
@@ -167,9 +192,15 @@ class WMT14(Dataset):
                     trg_ids_next = trg_ids + [self.trg_dict[END]]
                     trg_ids = [self.trg_dict[START]] + trg_ids
 
-                    self.src_ids.append(src_ids)
-                    self.trg_ids.append(trg_ids)
-                    self.trg_ids_next.append(trg_ids_next)
+                    src_ids_list.append(src_ids)
+                    trg_ids_list.append(trg_ids)
+                    trg_ids_next_list.append(trg_ids_next)
+
+        self.src_ids = token_cache.TokenArray.from_sequences(src_ids_list)
+        self.trg_ids = token_cache.TokenArray.from_sequences(trg_ids_list)
+        self.trg_ids_next = token_cache.TokenArray.from_sequences(
+            trg_ids_next_list
+        )
 
     def __getitem__(self, idx):
         return (
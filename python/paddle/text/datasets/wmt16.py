@@ -24,6 +24,8 @@ import paddle
 from paddle.dataset.common import _check_exists_and_download
 from paddle.io import Dataset
 
+from . import token_cache
+
 __all__ = []
 
 DATA_URL = "http://paddlemodels.bj.bcebos.com/wmt/wmt16.tar.gz"
@@ -145,7 +147,32 @@ class WMT16(Dataset):
         )
 
         # load data
-        self.data = self._load_data()
+        # tokenized corpus is cached, see NOTE: [ tokenized corpus cache ]
+        path = token_cache.cache_path(
+            'wmt16',
+            self.data_file,
+            self.mode,
+            lang,
+            src_dict_size,
+            trg_dict_size,
+        )
+        cached = token_cache.load(path)
+        if cached is not None:
+            _, fields = cached
+            self.src_ids = fields['src_ids']
+            self.trg_ids = fields['trg_ids']
+            self.trg_ids_next = fields['trg_ids_next']
+        else:
+            self._load_data()
+            token_cache.save(
+                path,
+                None,
+                {
+                    'src_ids': self.src_ids,
+                    'trg_ids': self.trg_ids,
+                    'trg_ids_next': self.trg_ids_next,
+                },
+            )
 
     def _load_dict(self, lang, dict_size, reverse=False):
         dict_path = os.path.join(
@@ -201,9 +228,9 @@ class WMT16(Dataset):
         src_col = 0 if self.lang == "en" else 1
         trg_col = 1 - src_col
 
-        self.src_ids = []
-        self.trg_ids = []
-        self.trg_ids_next = []
+        src_ids_list = []
+        trg_ids_list = []
+        trg_ids_next_list = []
         with tarfile.open(self.data_file, mode="r") as f:
             for line in f.extractfile(f"wmt16/{self.mode}"):
                 line = line.decode()
@@ -223,9 +250,15 @@ class WMT16(Dataset):
                 trg_ids_next = trg_ids + [end_id]
                 trg_ids = [start_id] + trg_ids
 
-                self.src_ids.append(src_ids)
-                self.trg_ids.append(trg_ids)
-                self.trg_ids_next.append(trg_ids_next)
+                src_ids_list.append(src_ids)
+                trg_ids_list.append(trg_ids)
+                trg_ids_next_list.append(trg_ids_next)
+
+        self.src_ids = token_cache.TokenArray.from_sequences(src_ids_list)
+        self.trg_ids = token_cache.TokenArray.from_sequences(trg_ids_list)
+        self.trg_ids_next = token_cache.TokenArray.from_sequences(
+            trg_ids_next_list
+        )
 
     def __getitem__(self, idx):
         return (
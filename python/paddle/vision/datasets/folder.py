@@ -12,8 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import hashlib
+import json
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 
+import numpy as np
 from PIL import Image
 
 import paddle
@@ -40,8 +45,60 @@ def has_valid_extension(filename, extensions):
     return filename.lower().endswith(extensions)
 
 
-def make_dataset(dir, class_to_idx, extensions, is_valid_file=None):
-    images = []
+def _walk_valid_files(top, is_valid_file):
+    # returns (root, valid file paths) of each directory under `top`, files
+    # of a directory are sorted by name
+    walked = []
+    for root, _, fnames in os.walk(top, followlinks=True):
+        files = [os.path.join(root, fname) for fname in sorted(fnames)]
+        walked.append((root, [f for f in files if is_valid_file(f)]))
+    return walked
+
+
+def _scan_dirs(tops, is_valid_file, num_workers=None):
+    """
+    Walk the directories in parallel with threads, which mostly wait on
+    file system calls, so that the latency of networked file systems is
+    overlapped across directories.
+
+    Returns:
+        list: (root, valid file paths) pairs of each top directory.
+    """
+    if num_workers is None:
+        num_workers = min(32, (os.cpu_count() or 1) + 4)
+    if num_workers <= 1 or len(tops) <= 1:
+        return [_walk_valid_files(top, is_valid_file) for top in tops]
+    with ThreadPoolExecutor(max_workers=num_workers) as executor:
+        return list(
+            executor.map(
+                lambda top: _walk_valid_files(top, is_valid_file), tops
+            )
+        )
+
+
+def _sorted_paths(walked):
+    # same order as walking with `sorted(os.walk(...))`
+    return [f for _, files in sorted(walked, key=lambda x: x[0]) for f in files]
+
+
+def _index_class_dirs(dir, class_to_idx, is_valid_file, num_workers=None):
+    targets = sorted(class_to_idx.keys())
+    dirs = [os.path.join(dir, target) for target in targets]
+    valid = [os.path.isdir(d) for d in dirs]
+    walked = _scan_dirs(
+        [d for d, v in zip(dirs, valid) if v], is_valid_file, num_workers
+    )
+    paths, labels = [], []
+    for target, result in zip([t for t, v in zip(targets, valid) if v], walked):
+        files = _sorted_paths(result)
+        paths.extend(files)
+        labels.extend([class_to_idx[target]] * len(files))
+    return paths, labels
+
+
+def make_dataset(
+    dir, class_to_idx, extensions, is_valid_file=None, num_workers=None
+):
     dir = os.path.expanduser(dir)
 
     if extensions is not None:
@@ -49,18 +106,152 @@ def make_dataset(dir, class_to_idx, extensions, is_valid_file=None):
         def is_valid_file(x):
             return has_valid_extension(x, extensions)
 
-    for target in sorted(class_to_idx.keys()):
-        d = os.path.join(dir, target)
-        if not os.path.isdir(d):
-            continue
-        for root, _, fnames in sorted(os.walk(d, followlinks=True)):
-            for fname in sorted(fnames):
-                path = os.path.join(root, fname)
-                if is_valid_file(path):
-                    item = (path, class_to_idx[target])
-                    images.append(item)
+    paths, labels = _index_class_dirs(
+        dir, class_to_idx, is_valid_file, num_workers
+    )
+    return list(zip(paths, labels))
 
-    return images
+
+class _PathArray:
+    """
+    A read-only sequence of paths, stored compactly as one byte buffer with
+    offsets instead of tens of millions of python strings. The common
+    prefix (the root directory) is stored only once.
+    """
+
+    def __init__(self, prefix, data, offsets):
+        self.prefix = prefix
+        self._data = data
+        self._offsets = offsets
+
+    @classmethod
+    def from_paths(cls, paths, prefix):
+        if not all(p.startswith(prefix) for p in paths):
+            prefix = ''
+        encoded = [os.fsencode(p[len(prefix) :]) for p in paths]
+        offsets = np.zeros([len(encoded) + 1], dtype='int64')
+        np.cumsum([len(e) for e in encoded], out=offsets[1:])
+        data = np.frombuffer(b''.join(encoded), dtype='uint8')
+        return cls(prefix, data, offsets)
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return [self[i] for i in range(*idx.indices(len(self)))]
+        if idx < 0:
+            idx += len(self)
+        if idx < 0 or idx >= len(self):
+            raise IndexError("path index out of range")
+        begin, end = self._offsets[idx], self._offsets[idx + 1]
+        return self.prefix + os.fsdecode(self._data[begin:end].tobytes())
+
+
+class _FolderSamples:
+    """
+    A read-only sequence of (sample_path, class_index) tuples, backed by a
+    :code:`_PathArray` and an int64 array of class indices.
+    """
+
+    def __init__(self, paths, targets):
+        self.paths = paths
+        self.targets = targets
+
+    def __len__(self):
+        return len(self.paths)
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return [self[i] for i in range(*idx.indices(len(self)))]
+        return self.paths[idx], int(self.targets[idx])
+
+
+def _dir_mtimes(dirs):
+    mtimes = []
+    for d in dirs:
+        try:
+            mtimes.append(os.stat(d).st_mtime_ns)
+        except OSError:
+            mtimes.append(-1)
+    return mtimes
+
+
+def _index_cache_file(cache_dir, kind, root, extensions):
+    key = json.dumps([kind, root, list(extensions)])
+    name = '{}_index_{}.npz'.format(
+        kind.lower(), hashlib.md5(key.encode('utf-8')).hexdigest()
+    )
+    return os.path.join(os.path.expanduser(cache_dir), name)
+
+
+def _load_index(cache_file, meta):
+    if not os.path.exists(cache_file):
+        return None
+    try:
+        with np.load(cache_file, allow_pickle=False) as f:
+            if json.loads(str(f['meta'])) != meta:
+                return None
+            paths = _PathArray(str(f['prefix']), f['data'], f['offsets'])
+            return paths, f['targets']
+    except (OSError, ValueError, KeyError):
+        # a corrupted or partially copied index is rebuilt
+        return None
+
+
+def _save_index(cache_file, meta, paths, targets):
+    os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+    # save to a temporary file then rename it, so that other processes never
+    # load a partially written index
+    tmp_file = f'{cache_file}.tmp.{os.getpid()}.npz'
+    try:
+        np.savez(
+            tmp_file,
+            meta=np.array(json.dumps(meta)),
+            prefix=np.array(paths.prefix),
+            data=paths._data,
+            offsets=paths._offsets,
+            targets=targets,
+        )
+        os.replace(tmp_file, cache_file)
+    finally:
+        if os.path.exists(tmp_file):
+            os.remove(tmp_file)
+
+
+def _load_or_build_index(cache_file, meta, build, timeout=600):
+    """
+    Load the index from :attr:`cache_file` if it is valid for :attr:`meta`,
+    otherwise build it by calling :attr:`build`. In distributed training,
+    only one trainer of each machine builds and saves the index, the others
+    wait for the index to load, so that the index saved on a shared file
+    system is built only once. If the index is still not loadable after
+    :attr:`timeout` seconds, e.g. the builder failed, the waiting trainer
+    builds the index by itself.
+    """
+    if cache_file is None:
+        return build()
+
+    index = _load_index(cache_file, meta)
+    if index is not None:
+        return index
+
+    from paddle.distributed import ParallelEnv
+    from paddle.utils.download import _get_unique_endpoints
+
+    unique_endpoints = _get_unique_endpoints(ParallelEnv().trainer_endpoints[:])
+    if ParallelEnv().current_endpoint in unique_endpoints:
+        index = build()
+        _save_index(cache_file, meta, *index)
+        return index
+
+    deadline = time.time() + timeout
+    while index is None:
+        if time.time() > deadline:
+            return build()
+        time.sleep(1)
+        index = _load_index(cache_file, meta)
+    return index
 
 
 class DatasetFolder(Dataset):
@@ -88,6 +279,17 @@ class DatasetFolder(Dataset):
         is_valid_file (Callable, optional): A function that takes path of a file
             and check if the file is a valid file. Both :attr:`extensions` and
             :attr:`is_valid_file` should not be passed. Default: None.
+        num_workers (int, optional): The number of threads to scan the class
+            directories in parallel. Default: None, which means
+            min(32, os.cpu_count() + 4).
+        cache_dir (str, optional): The directory to cache the index of samples,
+            the index is keyed by :attr:`root` and :attr:`extensions`, and is
+            rebuilt when the modification time of :attr:`root` or any class
+            directory changes. Only one trainer of each machine builds the index
+            in distributed training, so a cache directory on a shared file system
+            is scanned only once for all trainers. Note that adding or removing
+            files in nested sub directories of a class directory is not detected.
+            Default: None, which means no cache.
 
     Returns:
         :ref:`api_paddle_io_Dataset`. An instance of DatasetFolder.
@@ -95,8 +297,9 @@ class DatasetFolder(Dataset):
     Attributes:
         classes (list[str]): List of the class names.
         class_to_idx (dict[str, int]): Dict with items (class_name, class_index).
-        samples (list[tuple[str, int]]): List of (sample_path, class_index) tuples.
-        targets (list[int]): The class_index value for each image in the dataset.
+        samples (Sequence[tuple[str, int]]): Sequence of (sample_path, class_index)
+            tuples, stored compactly as arrays.
+        targets (numpy.ndarray): The class_index value for each image in the dataset.
 
     Example:
 
@@ -152,12 +355,12 @@ class DatasetFolder(Dataset):
             # ['class_0', 'class_1']
             print(data_folder_1.class_to_idx)
             # {'class_0': 0, 'class_1': 1}
-            print(data_folder_1.samples)
+            print(list(data_folder_1.samples))
             # [('./temp_dir/class_0/abc.jpg', 0), ('./temp_dir/class_0/def.png', 0),
             #  ('./temp_dir/class_1/ghi.jpeg', 1), ('./temp_dir/class_1/jkl.png', 1),
             #  ('./temp_dir/class_1/mno/pqr.jpeg', 1), ('./temp_dir/class_1/mno/stu.jpg', 1)]
             print(data_folder_1.targets)
-            # [0, 0, 1, 1, 1, 1]
+            # [0 0 1 1 1 1]
             print(len(data_folder_1))
             # 6
 
@@ -207,15 +410,46 @@ class DatasetFolder(Dataset):
         extensions=None,
         transform=None,
         is_valid_file=None,
+        num_workers=None,
+        cache_dir=None,
     ):
         self.root = root
         self.transform = transform
         if extensions is None:
             extensions = IMG_EXTENSIONS
         classes, class_to_idx = self._find_classes(self.root)
-        samples = make_dataset(
-            self.root, class_to_idx, extensions, is_valid_file
-        )
+
+        root_dir = os.path.expanduser(self.root)
+        if extensions is not None:
+
+            def is_valid_file(x):
+                return has_valid_extension(x, extensions)
+
+        def build():
+            paths, targets = _index_class_dirs(
+                root_dir, class_to_idx, is_valid_file, num_workers
+            )
+            return (
+                _PathArray.from_paths(paths, os.path.join(root_dir, '')),
+                np.array(targets, dtype='int64'),
+            )
+
+        cache_file = None
+        meta = None
+        if cache_dir is not None:
+            abs_root = os.path.abspath(root_dir)
+            cache_file = _index_cache_file(
+                cache_dir, 'DatasetFolder', abs_root, extensions
+            )
+            meta = {
+                'root': abs_root,
+                'classes': classes,
+                'mtimes': _dir_mtimes(
+                    [root_dir] + [os.path.join(root_dir, c) for c in classes]
+                ),
+            }
+        paths, targets = _load_or_build_index(cache_file, meta, build)
+        samples = _FolderSamples(paths, targets)
         if len(samples) == 0:
             raise (
                 RuntimeError(
@@ -230,7 +464,7 @@ class DatasetFolder(Dataset):
         self.classes = classes
         self.class_to_idx = class_to_idx
         self.samples = samples
-        self.targets = [s[1] for s in samples]
+        self.targets = targets
 
         self.dtype = paddle.get_default_dtype()
 
@@ -324,12 +558,23 @@ class ImageFolder(Dataset):
         is_valid_file (Callable, optional): A function that takes path of a file
             and check if the file is a valid file. Both :attr:`extensions` and
             :attr:`is_valid_file` should not be passed. Default: None.
+        num_workers (int, optional): The number of threads to scan the sub
+            directories of :attr:`root` in parallel. Default: None, which means
+            min(32, os.cpu_count() + 4).
+        cache_dir (str, optional): The directory to cache the index of samples,
+            the index is keyed by :attr:`root` and :attr:`extensions`, and is
+            rebuilt when the modification time of :attr:`root` or any of its
+            sub directories changes. Only one trainer of each machine builds the
+            index in distributed training, so a cache directory on a shared file
+            system is scanned only once for all trainers. Note that adding or
+            removing files in deeper sub directories is not detected.
+            Default: None, which means no cache.
 
     Returns:
         :ref:`api_paddle_io_Dataset`. An instance of ImageFolder.
 
     Attributes:
-        samples (list[str]): List of sample path.
+        samples (Sequence[str]): Sequence of sample path, stored compactly as arrays.
 
     Example:
 
@@ -378,7 +623,7 @@ class ImageFolder(Dataset):
             fake_data_dir = tempfile.mkdtemp()
             make_directory(fake_data_dir, directory_hirerarchy)
             image_folder_1 = ImageFolder(fake_data_dir)
-            print(image_folder_1.samples)
+            print(list(image_folder_1.samples))
             # ['./temp_dir/abc.jpg', './temp_dir/def.png',
             #  './temp_dir/ghi/jkl.jpeg', './temp_dir/ghi/mno/pqr.jpg']
             print(len(image_folder_1))
@@ -410,7 +655,7 @@ class ImageFolder(Dataset):
                 transform=transform,  # apply transform to every image
             )
 
-            print(image_folder_2.samples)
+            print(list(image_folder_2.samples))
             # ['./temp_dir/abc.jpg', './temp_dir/ghi/mno/pqr.jpg']
             print(len(image_folder_2))
             # 2
@@ -430,12 +675,13 @@ class ImageFolder(Dataset):
         extensions=None,
         transform=None,
         is_valid_file=None,
+        num_workers=None,
+        cache_dir=None,
     ):
         self.root = root
         if extensions is None:
             extensions = IMG_EXTENSIONS
 
-        samples = []
         path = os.path.expanduser(root)
 
         if extensions is not None:
@@ -443,11 +689,39 @@ class ImageFolder(Dataset):
             def is_valid_file(x):
                 return has_valid_extension(x, extensions)
 
-        for root, _, fnames in sorted(os.walk(path, followlinks=True)):
-            for fname in sorted(fnames):
-                f = os.path.join(root, fname)
-                if is_valid_file(f):
-                    samples.append(f)
+        try:
+            entries = sorted(os.scandir(path), key=lambda e: e.name)
+        except OSError:
+            entries = []
+        sub_dirs = [e.path for e in entries if e.is_dir()]
+
+        def build():
+            # files directly under root, then walk sub directories in parallel
+            files = [
+                os.path.join(path, e.name) for e in entries if not e.is_dir()
+            ]
+            walked = [(path, [f for f in files if is_valid_file(f)])]
+            for result in _scan_dirs(sub_dirs, is_valid_file, num_workers):
+                walked.extend(result)
+            samples = _sorted_paths(walked)
+            return (
+                _PathArray.from_paths(samples, os.path.join(path, '')),
+                np.zeros([0], dtype='int64'),
+            )
+
+        cache_file = None
+        meta = None
+        if cache_dir is not None:
+            abs_root = os.path.abspath(path)
+            cache_file = _index_cache_file(
+                cache_dir, 'ImageFolder', abs_root, extensions
+            )
+            meta = {
+                'root': abs_root,
+                'sub_dirs': [os.path.basename(d) for d in sub_dirs],
+                'mtimes': _dir_mtimes([path] + sub_dirs),
+            }
+        samples, _ = _load_or_build_index(cache_file, meta, build)
 
         if len(samples) == 0:
             raise (
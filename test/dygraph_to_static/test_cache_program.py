@@ -168,5 +168,47 @@ class TestToOutputWithCache(unittest.TestCase):
             self.assertEqual(ret.numpy(), 5050)
 
 
+def double_func(x):
+    return x * 2
+
+
+class TestShapeBuckets(unittest.TestCase):
+    def test_pad_to_buckets(self):
+        paddle.disable_static()
+        func = to_static(double_func, shape_buckets=[{1: [4, 8]}])
+        for length, padded_length in [(3, 4), (4, 4), (5, 8), (9, 9)]:
+            x = np.random.random([2, length]).astype('float32')
+            out = func(paddle.to_tensor(x)).numpy()
+            self.assertEqual(out.shape, (2, padded_length))
+            np.testing.assert_allclose(out[:, :length], x * 2, rtol=1e-05)
+            np.testing.assert_array_equal(out[:, length:], 0)
+        # lengths 3 and 4 share one program
+        self.assertEqual(func.get_traced_count(), 3)
+
+    def test_invalid_buckets(self):
+        with self.assertRaises(TypeError):
+            to_static(double_func, shape_buckets={1: [4, 8]})
+        with self.assertRaises(ValueError):
+            to_static(double_func, shape_buckets=[{1: [0, 8]}])
+
+
+class TestProgramCacheLRU(unittest.TestCase):
+    def test_evict_least_recently_used(self):
+        paddle.disable_static()
+        func = to_static(double_func, max_programs=2)
+        for length in [2, 3, 2, 4]:
+            func(paddle.ones([length]))
+        # the program for length 3 is evicted
+        self.assertEqual(func.get_traced_count(), 2)
+        shapes = [
+            cp.inputs[0].shape for cp in func.program_cache.concrete_programs()
+        ]
+        self.assertEqual(shapes, [(2,), (4,)])
+
+    def test_invalid_max_programs(self):
+        with self.assertRaises(ValueError):
+            to_static(double_func, max_programs=0)
+
+
 if __name__ == '__main__':
     unittest.main()
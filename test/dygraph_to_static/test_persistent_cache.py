@@ -0,0 +1,113 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+
+import paddle
+from paddle.jit.dy2static import persistent_cache
+from paddle.jit.dy2static.ast_transformer import DygraphToStaticAst
+from paddle.jit.dy2static.program_translator import (
+    ConcreteProgram,
+    FunctionCache,
+)
+from paddle.utils import unique_name
+
+
+class SimpleNet(paddle.nn.Layer):
+    def __init__(self):
+        super().__init__()
+        self.linear = paddle.nn.Linear(4, 3)
+
+    @paddle.jit.to_static
+    def forward(self, x):
+        y = self.linear(x)
+        if paddle.mean(y) > 0:
+            y = y * 2
+        return y, x + 1
+
+
+def dyfunc(x):
+    if paddle.mean(x) > 0:
+        x = x - 1
+    return x
+
+
+class TestPersistentCache(unittest.TestCase):
+    def setUp(self):
+        paddle.disable_static()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        os.environ[persistent_cache.CACHE_DIR_ENV_NAME] = self.temp_dir.name
+
+    def tearDown(self):
+        del os.environ[persistent_cache.CACHE_DIR_ENV_NAME]
+        self.temp_dir.cleanup()
+
+    def build_net(self):
+        with unique_name.guard():
+            return SimpleNet()
+
+    def test_transformed_code(self):
+        FunctionCache()._convert(dyfunc)
+        self.assertEqual(
+            len(os.listdir(os.path.join(self.temp_dir.name, 'code'))), 1
+        )
+        # a new process skips the ast transformation
+        with mock.patch.object(
+            DygraphToStaticAst,
+            'get_static_ast',
+            side_effect=AssertionError("should hit the cache"),
+        ):
+            static_func = FunctionCache()._convert(dyfunc)
+        x = paddle.to_tensor([1.0, 2.0])
+        np.testing.assert_allclose(static_func(x).numpy(), [0.0, 1.0])
+
+    def test_concrete_program(self):
+        x = paddle.rand([2, 4])
+        net = self.build_net()
+        out, out1 = net(x)
+        self.assertEqual(
+            len(os.listdir(os.path.join(self.temp_dir.name, 'program'))), 1
+        )
+
+        new_net = self.build_net()
+        new_net.set_state_dict(net.state_dict())
+        with mock.patch.object(
+            ConcreteProgram,
+            'from_func_spec',
+            side_effect=AssertionError("should hit the cache"),
+        ):
+            new_out, new_out1 = new_net(x)
+        np.testing.assert_allclose(new_out.numpy(), out.numpy(), rtol=1e-6)
+        np.testing.assert_allclose(new_out1.numpy(), out1.numpy())
+
+        # the cached program also works for training
+        new_out.sum().backward()
+        self.assertIsNotNone(new_net.linear.weight.grad)
+
+    def test_different_input_spec(self):
+        net = self.build_net()
+        net(paddle.rand([2, 4]))
+        net(paddle.rand([3, 4]))
+        self.assertEqual(
+            len(os.listdir(os.path.join(self.temp_dir.name, 'program'))), 2
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
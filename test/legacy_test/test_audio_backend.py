@@ -158,6 +158,64 @@ class TestAudioBackends(unittest.TestCase):
         if os.path.exists(wave_wav_path):
             os.remove(wave_wav_path)
 
+    def test_partial_load(self):
+        base_dir = os.getcwd()
+        wave_wav_path = os.path.join(base_dir, "wave_partial_test.wav")
+        waveform = np.tile(self.waveform, [2, 1])
+        paddle.audio.save(wave_wav_path, paddle.to_tensor(waveform), self.sr)
+        paddle.audio.backends.set_backend("wave_backend")
+        full_data, _ = paddle.audio.load(wave_wav_path, normalize=False)
+
+        wav_data, sr = paddle.audio.load(
+            wave_wav_path, frame_offset=100, num_frames=300, normalize=False
+        )
+        self.assertEqual(sr, self.sr)
+        np.testing.assert_array_equal(wav_data, full_data[:, 100:400])
+
+        # frame_offset works without num_frames, and reading is clamped
+        # to the end of file
+        wav_data, _ = paddle.audio.load(
+            wave_wav_path, frame_offset=7900, normalize=False
+        )
+        np.testing.assert_array_equal(wav_data, full_data[:, 7900:])
+        wav_data, _ = paddle.audio.load(
+            wave_wav_path,
+            frame_offset=7900,
+            num_frames=1000,
+            normalize=False,
+            channels_first=False,
+        )
+        np.testing.assert_array_equal(wav_data, full_data[:, 7900:].T)
+
+        with open(wave_wav_path, 'rb') as file_:
+            wav_data, _ = paddle.audio.load(
+                file_, frame_offset=100, num_frames=300, normalize=False
+            )
+        np.testing.assert_array_equal(wav_data, full_data[:, 100:400])
+
+        # stream chunks are the same as loading all at once
+        chunks = list(paddle.audio.stream(wave_wav_path, 3000))
+        self.assertEqual([c.shape[1] for c in chunks], [3000, 3000, 2000])
+        full_data, _ = paddle.audio.load(wave_wav_path)
+        np.testing.assert_array_equal(
+            np.concatenate([c.numpy() for c in chunks], axis=1), full_data
+        )
+        chunks = list(
+            paddle.audio.stream(
+                wave_wav_path, 3000, frame_offset=1000, num_frames=4000
+            )
+        )
+        self.assertEqual([c.shape[1] for c in chunks], [3000, 1000])
+        np.testing.assert_array_equal(
+            np.concatenate([c.numpy() for c in chunks], axis=1),
+            full_data[:, 1000:5000],
+        )
+        with self.assertRaises(ValueError):
+            next(paddle.audio.stream(wave_wav_path, 0))
+
+        if os.path.exists(wave_wav_path):
+            os.remove(wave_wav_path)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -12,12 +12,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import itertools
+import os
+import tempfile
 import unittest
 
 import numpy as np
 from parameterized import parameterized
 
 import paddle
+from paddle.audio.datasets import dataset
 
 
 def parameterize(*params):
@@ -115,6 +118,62 @@ class TestAudioDatasets(unittest.TestCase):
         self.assertTrue(elem[0].shape[0] == params)
         self.assertTrue(0 <= elem[1] <= 2)
 
+    def test_feature_extractor_cache(self):
+        extractor = dataset._get_feature_extractor(
+            'mfcc', 16000, {'n_mfcc': 40}
+        )
+        self.assertIs(
+            dataset._get_feature_extractor('mfcc', 16000, {'n_mfcc': 40}),
+            extractor,
+        )
+        self.assertIsNot(
+            dataset._get_feature_extractor('mfcc', 16000, {'n_mfcc': 20}),
+            extractor,
+        )
+
+    def test_feat_store(self):
+        archive = {
+            'url': 'https://bj.bcebos.com/paddleaudio/datasets/TESS_Toronto_emotional_speech_set_lite.zip',
+            'md5': '9ffb5e3adf28d4d6b787fa94bd59b975',
+        }  # small part of TESS dataset for test.
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        tess_dataset = paddle.audio.datasets.TESS(
+            mode='dev', feat_type='logmelspectrogram', archive=archive
+        )
+        stored_dataset = paddle.audio.datasets.TESS(
+            mode='dev',
+            feat_type='logmelspectrogram',
+            archive=archive,
+            feat_store=temp_dir.name,
+        )
+        self.assertEqual(len(os.listdir(temp_dir.name)), 2)
+        for idx in range(len(tess_dataset)):
+            feat, label = tess_dataset[idx]
+            stored_feat, stored_label = stored_dataset[idx]
+            np.testing.assert_allclose(
+                stored_feat.numpy(), feat.numpy(), rtol=1e-6
+            )
+            self.assertEqual(stored_label, label)
+
+        # the store is reused, and a different config has its own store
+        paddle.audio.datasets.TESS(
+            mode='dev',
+            feat_type='logmelspectrogram',
+            archive=archive,
+            feat_store=temp_dir.name,
+        )
+        self.assertEqual(len(os.listdir(temp_dir.name)), 2)
+        paddle.audio.datasets.TESS(
+            mode='dev',
+            feat_type='logmelspectrogram',
+            n_mels=40,
+            archive=archive,
+            feat_store=temp_dir.name,
+        )
+        self.assertEqual(len(os.listdir(temp_dir.name)), 4)
+        temp_dir.cleanup()
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,91 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import numpy as np
+
+import paddle
+from paddle.distributed.communication.serialization_utils import (
+    convert_object_to_tensor,
+    convert_objects_to_tensor,
+    convert_tensor_to_object,
+    convert_tensor_to_objects,
+)
+
+
+class TestObjectSerialization(unittest.TestCase):
+    def setUp(self):
+        paddle.disable_static()
+
+    def build_object(self):
+        array = np.random.random([16, 8]).astype('float32')
+        return {
+            'array': array,
+            'same_array': array,
+            'strided': array[:, 1],
+            'tensor': paddle.to_tensor([[1, 2], [3, 4]], stop_gradient=False),
+            'scalar': paddle.to_tensor(1.5),
+            'empty': np.zeros([0, 3], dtype='int64'),
+            'objects': np.array([1, 'a'], dtype=object),
+            'meta': ('step', 10, [1.0, None]),
+        }
+
+    def check_object(self, loaded, obj):
+        self.assertEqual(set(loaded.keys()), set(obj.keys()))
+        for key in ['array', 'same_array', 'strided', 'empty']:
+            np.testing.assert_array_equal(loaded[key], obj[key])
+            self.assertEqual(loaded[key].dtype, obj[key].dtype)
+        self.assertTrue(np.shares_memory(loaded['array'], loaded['same_array']))
+        self.assertIsInstance(loaded['tensor'], paddle.Tensor)
+        self.assertEqual(loaded['tensor'].dtype, paddle.int64)
+        self.assertFalse(loaded['tensor'].stop_gradient)
+        np.testing.assert_array_equal(
+            loaded['tensor'].numpy(), obj['tensor'].numpy()
+        )
+        self.assertEqual(loaded['scalar'].shape, [])
+        self.assertEqual(loaded['objects'].tolist(), [1, 'a'])
+        self.assertEqual(loaded['meta'], obj['meta'])
+
+    def test_object(self):
+        obj = self.build_object()
+        tensor, len_of_tensor = convert_object_to_tensor(obj)
+        self.assertEqual(tensor.dtype, paddle.uint8)
+        # resized tensor as in all_gather_object
+        padded = paddle.concat([tensor, paddle.zeros([7], dtype='uint8')])
+        self.check_object(convert_tensor_to_object(padded, len_of_tensor), obj)
+
+    def test_out_of_band(self):
+        large = {'weight': np.random.random([256, 256])}
+        tensor, _ = convert_object_to_tensor(large)
+        # the array is sent as raw data, only a small skeleton is pickled
+        self.assertLess(tensor.shape[0], large['weight'].nbytes + 512)
+        loaded = convert_tensor_to_object(tensor, tensor.shape[0])
+        np.testing.assert_array_equal(loaded['weight'], large['weight'])
+
+    def test_objects(self):
+        objs = [self.build_object(), 1, 'str', None, self.build_object()]
+        tensor, len_of_tensor = convert_objects_to_tensor(objs)
+        loaded = convert_tensor_to_objects(tensor, len_of_tensor)
+        self.assertEqual(len(loaded), len(objs))
+        self.check_object(loaded[0], objs[0])
+        self.assertEqual(loaded[1:4], [1, 'str', None])
+        self.check_object(loaded[4], objs[4])
+
+        tensor, len_of_tensor = convert_objects_to_tensor([])
+        self.assertEqual(convert_tensor_to_objects(tensor, len_of_tensor), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,151 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import io
+import os
+import pickle
+import tarfile
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+
+import paddle
+from paddle.text.datasets import Imdb, Imikolov, token_cache
+
+
+def write_tar(path, files):
+    with tarfile.open(path, 'w:gz') as tar:
+        for name, content in files.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(content)
+            tar.addfile(info, io.BytesIO(content))
+
+
+class TestTokenArray(unittest.TestCase):
+    def test_csr(self):
+        seqs = [[1, 2, 3], [], [4], [5, 6]]
+        tokens = token_cache.TokenArray.from_sequences(seqs)
+        self.assertEqual(len(tokens), 4)
+        self.assertEqual([list(t) for t in tokens], seqs)
+        np.testing.assert_array_equal(tokens.offsets, [0, 3, 3, 4, 6])
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, 'tokens')
+            tokens.save(path)
+            loaded = token_cache.TokenArray.load(path)
+            self.assertIsInstance(loaded.ids, np.memmap)
+            # arrays mapped from file are re-mapped rather than copied
+            self.assertLess(len(pickle.dumps(loaded)), 200)
+            self.assertEqual(
+                [list(t) for t in pickle.loads(pickle.dumps(loaded))], seqs
+            )
+
+
+class TestTokenCache(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.patcher = mock.patch.object(
+            paddle.dataset.common, 'DATA_HOME', self.temp_dir.name
+        )
+        self.patcher.start()
+
+    def tearDown(self):
+        self.patcher.stop()
+        self.temp_dir.cleanup()
+
+    def assert_same_dataset(self, dataset, expected):
+        self.assertEqual(len(dataset), len(expected))
+        for idx in range(len(dataset)):
+            for field, expected_field in zip(dataset[idx], expected[idx]):
+                np.testing.assert_array_equal(field, expected_field)
+                self.assertEqual(field.dtype, expected_field.dtype)
+
+    def test_imdb(self):
+        data_file = os.path.join(self.temp_dir.name, 'imdb.tar.gz')
+        write_tar(
+            data_file,
+            {
+                'aclImdb/train/pos/0.txt': b'a good movie, good!\n',
+                'aclImdb/train/neg/0.txt': b'a bad movie\n',
+                'aclImdb/train/neg/1.txt': b'bad, bad.\n',
+                'aclImdb/test/pos/0.txt': b'good a\n',
+                'aclImdb/test/neg/0.txt': b'bad\n',
+            },
+        )
+        imdb = Imdb(data_file=data_file, mode='train', cutoff=1)
+        self.assertEqual(
+            imdb.word_idx,
+            {b'bad': 0, b'a': 1, b'good': 2, b'movie': 3, '<unk>': 4},
+        )
+        expected = [
+            (np.array([1, 2, 3, 2]), np.array([0])),
+            (np.array([1, 0, 3]), np.array([1])),
+            (np.array([0, 0]), np.array([1])),
+        ]
+        self.assert_same_dataset(imdb, expected)
+
+        # constructing from cache does not read the tar file
+        with mock.patch.object(
+            tarfile, 'open', side_effect=AssertionError("should hit the cache")
+        ):
+            cached = Imdb(data_file=data_file, mode='train', cutoff=1)
+        self.assertEqual(cached.word_idx, imdb.word_idx)
+        self.assert_same_dataset(cached, expected)
+
+        # other configs are not cached
+        self.assertEqual(
+            len(Imdb(data_file=data_file, mode='test', cutoff=1)), 2
+        )
+
+    def test_imikolov(self):
+        data_file = os.path.join(self.temp_dir.name, 'imikolov.tgz')
+        files = {
+            './simple-examples/data/ptb.train.txt': b'a b c\nb c c\n',
+            './simple-examples/data/ptb.valid.txt': b'c a\n',
+        }
+        write_tar(data_file, files)
+        for data_type, window_size in [('NGRAM', 2), ('SEQ', -1)]:
+            expected = Imikolov(
+                data_file=data_file,
+                data_type=data_type,
+                window_size=window_size,
+                min_word_freq=0,
+            )
+            expected = [expected[idx] for idx in range(len(expected))]
+            with mock.patch.object(
+                tarfile,
+                'open',
+                side_effect=AssertionError("should hit the cache"),
+            ):
+                cached = Imikolov(
+                    data_file=data_file,
+                    data_type=data_type,
+                    window_size=window_size,
+                    min_word_freq=0,
+                )
+            self.assert_same_dataset(cached, expected)
+
+        # the cache is invalidated when the data file changes
+        files['./simple-examples/data/ptb.train.txt'] += b'a c\n'
+        write_tar(data_file, files)
+        imikolov = Imikolov(
+            data_file=data_file, data_type='SEQ', min_word_freq=0
+        )
+        self.assertEqual(len(imikolov), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
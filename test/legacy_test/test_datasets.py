@@ -85,6 +85,34 @@ class TestFolderDatasets(unittest.TestCase):
         for _ in loader:
             pass
 
+    def test_index_cache(self):
+        cache_dir = tempfile.mkdtemp()
+        try:
+            dataset_folder = DatasetFolder(self.data_dir, num_workers=1)
+            cached = DatasetFolder(self.data_dir, cache_dir=cache_dir)
+            self.assertEqual(len(os.listdir(cache_dir)), 1)
+            cached = DatasetFolder(self.data_dir, cache_dir=cache_dir)
+            self.assertEqual(list(cached.samples), list(dataset_folder.samples))
+            np.testing.assert_array_equal(cached.targets, [0, 0, 1, 1])
+
+            loader = ImageFolder(self.data_dir, cache_dir=cache_dir)
+            loader = ImageFolder(self.data_dir, cache_dir=cache_dir)
+            self.assertEqual(len(os.listdir(cache_dir)), 2)
+            self.assertEqual(
+                list(loader.samples), [s[0] for s in dataset_folder.samples]
+            )
+
+            # the index is rebuilt once a class directory is modified
+            fake_img = (np.random.random((32, 32, 3)) * 255).astype('uint8')
+            cv2.imwrite(
+                os.path.join(self.data_dir, 'class_1', '2.jpg'), fake_img
+            )
+            cached = DatasetFolder(self.data_dir, cache_dir=cache_dir)
+            self.assertEqual(len(cached), 5)
+            self.assertEqual(cached.samples[-1][1], 1)
+        finally:
+            shutil.rmtree(cache_dir)
+
     def test_errors(self):
         with self.assertRaises(RuntimeError):
             ImageFolder(self.empty_dir)
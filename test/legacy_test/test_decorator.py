@@ -17,6 +17,8 @@ import sys
 import time
 import unittest
 
+import numpy as np
+
 import paddle.reader
 
 __all__ = []
@@ -152,6 +154,46 @@ class TestXmap(unittest.TestCase):
                         for idx, e in enumerate(result):
                             self.assertEqual(e, mapper(idx))
 
+    @unittest.skipIf(
+        sys.platform == 'win32', "use_process is not supported on windows"
+    )
+    def test_xmap_process(self):
+        def mapper(x):
+            return np.full([2, 3], x, dtype='float32'), x
+
+        for order in (True, False):
+            for num, size in ((1, 1), (4, 2), (4, 16)):
+                reader = paddle.reader.xmap_readers(
+                    mapper,
+                    reader_creator_10(0),
+                    num,
+                    size,
+                    order,
+                    use_process=True,
+                )
+                result = list(reader())
+                if not order:
+                    result.sort(key=lambda e: e[1])
+                self.assertEqual([e[1] for e in result], list(range(10)))
+                for idx, e in enumerate(result):
+                    self.assertIsInstance(e, tuple)
+                    np.testing.assert_array_equal(e[0], mapper(idx)[0])
+
+    @unittest.skipIf(
+        sys.platform == 'win32', "use_process is not supported on windows"
+    )
+    def test_xmap_process_error(self):
+        def mapper(x):
+            if x == 5:
+                raise ValueError("bad sample")
+            return x
+
+        reader = paddle.reader.xmap_readers(
+            mapper, reader_creator_10(0), 2, 4, True, use_process=True
+        )
+        with self.assertRaises(RuntimeError):
+            list(reader())
+
 
 class TestMultiProcessReader(unittest.TestCase):
     def setup(self):
@@ -0,0 +1,170 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import tempfile
+import threading
+import unittest
+
+import numpy as np
+
+import paddle
+from paddle import Model, nn
+from paddle.hapi.checkpoint_writer import _AsyncCheckpointWriter
+from paddle.io import Dataset
+from paddle.static import InputSpec
+
+
+class RandomDataset(Dataset):
+    def __init__(self, sample_num):
+        self.sample_num = sample_num
+
+    def __getitem__(self, idx):
+        np.random.seed(idx)
+        image = np.random.random([8]).astype('float32')
+        label = np.random.randint(0, 3, (1,)).astype('int64')
+        return image, label
+
+    def __len__(self):
+        return self.sample_num
+
+
+class TestAsyncCheckpointWriter(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_atomic_and_bounded(self):
+        path = os.path.join(self.temp_dir.name, 'state')
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_save(obj, path):
+            started.set()
+            release.wait()
+            with open(path, 'w') as f:
+                f.write(obj)
+
+        writer = _AsyncCheckpointWriter(max_pending=1)
+        writer.submit([(slow_save, 'first', path)])
+        started.wait()
+        # file is only visible after renaming on completion
+        self.assertFalse(os.path.exists(path))
+
+        submitted = threading.Event()
+
+        def submit_second():
+            writer.submit([(slow_save, 'second', path)])
+            submitted.set()
+
+        thread = threading.Thread(target=submit_second)
+        thread.start()
+        # the second checkpoint waits for the outstanding one
+        self.assertFalse(submitted.wait(0.5))
+        release.set()
+        thread.join()
+        writer.wait()
+        with open(path) as f:
+            self.assertEqual(f.read(), 'second')
+        self.assertEqual(os.listdir(self.temp_dir.name), ['state'])
+
+    def test_error(self):
+        def bad_save(obj, path):
+            raise ValueError("bad save")
+
+        writer = _AsyncCheckpointWriter()
+        writer.submit(
+            [(bad_save, None, os.path.join(self.temp_dir.name, 'state'))]
+        )
+        with self.assertRaises(RuntimeError):
+            writer.wait()
+        self.assertEqual(os.listdir(self.temp_dir.name), [])
+
+
+class TestModelAsyncSave(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def build_model(self):
+        net = nn.Sequential(nn.Linear(8, 16), nn.ReLU(), nn.Linear(16, 3))
+        model = Model(
+            net,
+            InputSpec([None, 8], 'float32', 'x'),
+            InputSpec([None, 1], 'int64', 'label'),
+        )
+        optim = paddle.optimizer.Adam(0.001, parameters=net.parameters())
+        model.prepare(optim, nn.CrossEntropyLoss())
+        return model
+
+    def test_dygraph_async_save(self):
+        paddle.disable_static()
+        model = self.build_model()
+        model.fit(RandomDataset(32), batch_size=8, epochs=1, verbose=0)
+        path = os.path.join(self.temp_dir.name, 'async')
+        expected = {k: v.numpy() for k, v in model.network.state_dict().items()}
+        model.save(path, async_save=True)
+        # training goes on while the snapshot is being written
+        model.fit(RandomDataset(32), batch_size=8, epochs=1, verbose=0)
+        model._wait_async_save()
+
+        self.assertTrue(os.path.exists(path + '.pdopt'))
+        loaded = paddle.load(path + '.pdparams')
+        for key, value in expected.items():
+            np.testing.assert_array_equal(loaded[key].numpy(), value)
+
+        new_model = self.build_model()
+        new_model.load(path)
+        for key, value in new_model.network.state_dict().items():
+            np.testing.assert_array_equal(value.numpy(), expected[key])
+
+    def test_callback_async_save(self):
+        paddle.disable_static()
+        model = self.build_model()
+        save_dir = os.path.join(self.temp_dir.name, 'ckpt')
+        callback = paddle.callbacks.ModelCheckpoint(
+            save_dir=save_dir, async_save=True
+        )
+        model.fit(
+            RandomDataset(32),
+            batch_size=8,
+            epochs=2,
+            verbose=0,
+            callbacks=callback,
+        )
+        for prefix in ['0', '1', 'final']:
+            self.assertTrue(
+                os.path.exists(os.path.join(save_dir, prefix + '.pdparams'))
+            )
+        self.assertFalse(any('.tmp.' in name for name in os.listdir(save_dir)))
+
+    def test_static_async_save(self):
+        paddle.enable_static()
+        try:
+            model = self.build_model()
+            model.fit(RandomDataset(32), batch_size=8, epochs=1, verbose=0)
+            path = os.path.join(self.temp_dir.name, 'static')
+            model.save(path, async_save=True)
+            model.load(path)
+            self.assertTrue(os.path.exists(path + '.pdparams'))
+        finally:
+            paddle.disable_static()
+
+
+if __name__ == '__main__':
+    unittest.main()
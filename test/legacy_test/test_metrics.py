@@ -356,6 +356,125 @@ class TestAuc(unittest.TestCase):
         m.reset()
         self.assertEqual(m.accumulate(), 0.0)
 
+    def test_auc_merge(self):
+        np.random.seed(10)
+        preds = np.random.random(size=(100, 1))
+        preds = np.concatenate((1 - preds, preds), axis=1)
+        labels = np.random.randint(2, size=(100, 1))
+
+        m = paddle.metric.Auc()
+        m.update(preds, labels)
+        m1 = paddle.metric.Auc()
+        m1.update(preds[:50], labels[:50])
+        m2 = paddle.metric.Auc()
+        m2.update(preds[50:], labels[50:])
+        self.assertAlmostEqual(m1.merge(m2).accumulate(), m.accumulate())
+
+        with self.assertRaises(ValueError):
+            m.merge(paddle.metric.Auc(num_thresholds=10))
+
+    def test_auc_pr(self):
+        x = np.array([[0.9, 0.1], [0.6, 0.4], [0.35, 0.65], [0.2, 0.8]])
+        y = np.array([[0], [0], [1], [1]])
+        m = paddle.metric.Auc(curve='PR')
+        m.update(x, y)
+        self.assertAlmostEqual(m.accumulate(), 1.0)
+
+        y = np.array([[1], [0], [1], [0]])
+        m.reset()
+        m.update(x, y)
+        # (recall, precision): (0, 1) (0, 0) (0.5, 0.5) (0.5, 1/3) (1, 0.5)
+        self.assertAlmostEqual(m.accumulate(), 0.125 + (1.0 / 3 + 0.5) / 4)
+
+    def test_auc_one_vs_rest(self):
+        np.random.seed(10)
+        preds = np.random.random(size=(64, 3))
+        labels = np.random.randint(3, size=(64, 1))
+
+        m = paddle.metric.Auc(num_classes=3, average=None)
+        m.update(preds, labels)
+        res = m.accumulate()
+        self.assertEqual(res.shape, (3,))
+        for k in range(3):
+            mk = paddle.metric.Auc()
+            mk.update(
+                np.stack([1 - preds[:, k], preds[:, k]], axis=1),
+                (labels == k).astype('int64'),
+            )
+            self.assertAlmostEqual(res[k], mk.accumulate())
+
+        # multi-hot labels give the same statistics
+        m_macro = paddle.metric.Auc(num_classes=3)
+        m_macro.update(preds, (labels == np.arange(3)).astype('int64'))
+        self.assertAlmostEqual(m_macro.accumulate(), np.mean(res))
+
+
+class TestMetricStates(unittest.TestCase):
+    def check_merge(self, create_metric, preds, labels):
+        m = create_metric()
+        m.update(*to_list(m.compute(preds, labels)))
+        m1 = create_metric()
+        m1.update(*to_list(m1.compute(preds[:5], labels[:5])))
+        m2 = create_metric()
+        m2.update(*to_list(m2.compute(preds[5:], labels[5:])))
+        np.testing.assert_allclose(m1.merge(m2).accumulate(), m.accumulate())
+
+        states = m.states()
+        m3 = create_metric()
+        m3.set_states(states)
+        np.testing.assert_allclose(m3.accumulate(), m.accumulate())
+
+    def test_merge(self):
+        np.random.seed(10)
+        preds = np.random.random(size=(16, 4)).astype('float32')
+        labels = np.random.randint(4, size=(16, 1))
+        self.check_merge(
+            lambda: paddle.metric.Accuracy(topk=(1, 3)),
+            paddle.to_tensor(preds),
+            paddle.to_tensor(labels),
+        )
+
+        preds = np.random.random(size=(16, 1))
+        labels = np.random.randint(2, size=(16, 1))
+        self.check_merge(
+            lambda: paddle.metric.Precision(), np.array(preds), labels
+        )
+        self.check_merge(
+            lambda: paddle.metric.Recall(), np.array(preds), labels
+        )
+
+        with self.assertRaises(ValueError):
+            paddle.metric.Precision().merge(paddle.metric.Recall())
+        with self.assertRaises(ValueError):
+            paddle.metric.Accuracy().merge(paddle.metric.Accuracy(topk=(1, 2)))
+
+    def test_accuracy_tensor(self):
+        np.random.seed(10)
+        pred = paddle.to_tensor(np.random.random(size=(8, 2, 5)))
+        label = paddle.to_tensor(np.random.randint(5, size=(8, 2, 1)))
+        m = paddle.metric.Accuracy(topk=(1, 2, 5))
+        correct = m.compute(pred, label)
+        m_numpy = paddle.metric.Accuracy(topk=(1, 2, 5))
+        self.assertEqual(m.update(correct), m_numpy.update(correct.numpy()))
+        self.assertEqual(m.total, m_numpy.total)
+        self.assertEqual(m.count, m_numpy.count)
+
+    def test_windowed(self):
+        m = paddle.metric.WindowedMetric(paddle.metric.Recall(), 2)
+        self.assertEqual(m.name(), 'recall')
+        m.update(np.array([1.0, 1.0]), np.array([1, 1]))
+        m.update(np.array([0.0, 1.0]), np.array([1, 1]))
+        self.assertAlmostEqual(m.accumulate(), 3.0 / 4.0)
+        m.update(np.array([0.0, 0.0]), np.array([1, 1]))
+        self.assertAlmostEqual(m.accumulate(), 1.0 / 4.0)
+        self.assertEqual(m.states()['tp'].shape, (2,))
+
+        m.reset()
+        self.assertEqual(m.accumulate(), 0.0)
+
+        with self.assertRaises(ValueError):
+            paddle.metric.WindowedMetric(paddle.metric.Recall(), 0)
+
 
 if __name__ == '__main__':
     unittest.main()
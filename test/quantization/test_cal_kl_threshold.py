@@ -0,0 +1,84 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import numpy as np
+
+from paddle.static.quantization.cal_kl_threshold import (
+    cal_kl_threshold,
+    expand_quantized_bins,
+    safe_entropy,
+)
+
+
+def reference_kl_threshold(hist, bin_width, bits):
+    # compute the KL divergence of each candidate one by one
+    hist_bins = hist.shape[0]
+    starting_iter = int((hist_bins - 1) * 0.5)
+    quant_range = 2 ** (bits - 1) - 1
+    P_sum = np.sum(hist)
+    min_kl_divergence = None
+    min_kl_index = 0
+    for i in range(starting_iter, hist_bins):
+        reference_distr_P = hist[0:i].tolist()
+        if reference_distr_P[i - 1] == 0:
+            continue
+        reference_distr_P[i - 1] += sum(hist[i:])
+        num_merged_bins = int(i / quant_range)
+        quantized = []
+        for idx in range(quant_range):
+            j_start = idx * num_merged_bins
+            j_end = i if idx == quant_range - 1 else j_start + num_merged_bins
+            quantized.append(sum(hist[j_start:j_end]))
+        candidate_distr_Q = expand_quantized_bins(quantized, reference_distr_P)
+        kl_divergence = safe_entropy(
+            reference_distr_P,
+            P_sum,
+            candidate_distr_Q,
+            sum(candidate_distr_Q),
+        )
+        if min_kl_divergence is None or kl_divergence < min_kl_divergence:
+            min_kl_divergence = kl_divergence
+            min_kl_index = i
+    return (min_kl_index + 0.5) * bin_width
+
+
+class TestCalKLThreshold(unittest.TestCase):
+    def test_threshold(self):
+        np.random.seed(2023)
+        for bins, bits in [(64, 4), (300, 8), (2048, 8)]:
+            data = np.abs(np.random.randn(10000))
+            hist, edges = np.histogram(data, bins=bins)
+            hist[np.random.randint(0, bins, bins // 4)] = 0
+            bin_width = edges[1] - edges[0]
+            self.assertAlmostEqual(
+                cal_kl_threshold(hist, bin_width, bits),
+                reference_kl_threshold(hist, bin_width, bits),
+            )
+            # small batches give the same result
+            self.assertAlmostEqual(
+                cal_kl_threshold(hist, bin_width, bits, batch_size=7),
+                reference_kl_threshold(hist, bin_width, bits),
+            )
+
+    def test_empty_tail(self):
+        hist = np.zeros([100], dtype='int64')
+        hist[:10] = 5
+        # all candidates are skipped, fall back to the last nonzero bin
+        self.assertAlmostEqual(cal_kl_threshold(hist, 0.1, 8), 0.95)
+
+
+if __name__ == '__main__':
+    unittest.main()